@@ -167,12 +167,18 @@
   <image source="../tiles/tile_054.png" width="32" height="32"/>
  </tile>
  <tile id="55">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_055.png" width="32" height="32"/>
  </tile>
  <tile id="56">
   <image source="../tiles/tile_056.png" width="32" height="32"/>
  </tile>
  <tile id="57">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_057.png" width="32" height="32"/>
  </tile>
  <tile id="58">
@@ -182,6 +188,9 @@
   <image source="../tiles/tile_059.png" width="32" height="32"/>
  </tile>
  <tile id="60">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_060.png" width="32" height="32"/>
  </tile>
  <tile id="61">
@@ -194,9 +203,15 @@
   <image source="../tiles/tile_063.png" width="32" height="32"/>
  </tile>
  <tile id="64">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_064.png" width="32" height="32"/>
  </tile>
  <tile id="65">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_065.png" width="32" height="32"/>
  </tile>
  <tile id="66">
@@ -206,6 +221,9 @@
   <image source="../tiles/tile_067.png" width="32" height="32"/>
  </tile>
  <tile id="68">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_068.png" width="32" height="32"/>
  </tile>
  <tile id="69">
@@ -218,9 +236,15 @@
   <image source="../tiles/tile_071.png" width="32" height="32"/>
  </tile>
  <tile id="72">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_072.png" width="32" height="32"/>
  </tile>
  <tile id="73">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_073.png" width="32" height="32"/>
  </tile>
  <tile id="74">
@@ -242,9 +266,15 @@
   <image source="../tiles/tile_079.png" width="32" height="32"/>
  </tile>
  <tile id="80">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_080.png" width="32" height="32"/>
  </tile>
  <tile id="81">
+  <properties>
+   <property name="blocks_sight" type="bool" value="true"/>
+  </properties>
   <image source="../tiles/tile_081.png" width="32" height="32"/>
  </tile>
  <tile id="82">
@@ -272,18 +302,33 @@
   <image source="../tiles/tile_089.png" width="32" height="32"/>
  </tile>
  <tile id="90">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_090.png" width="32" height="32"/>
  </tile>
  <tile id="91">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_091.png" width="32" height="32"/>
  </tile>
  <tile id="92">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_092.png" width="32" height="32"/>
  </tile>
  <tile id="93">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_093.png" width="32" height="32"/>
  </tile>
  <tile id="94">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_094.png" width="32" height="32"/>
  </tile>
  <tile id="95">
@@ -302,15 +347,27 @@
   <image source="../tiles/tile_099.png" width="32" height="32"/>
  </tile>
  <tile id="100">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_100.png" width="32" height="32"/>
  </tile>
  <tile id="101">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_101.png" width="32" height="32"/>
  </tile>
  <tile id="102">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_102.png" width="32" height="32"/>
  </tile>
  <tile id="103">
+  <properties>
+   <property name="walkable" type="bool" value="false"/>
+  </properties>
   <image source="../tiles/tile_103.png" width="32" height="32"/>
  </tile>
  <tile id="104">
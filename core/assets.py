@@ -0,0 +1,535 @@
+# === core/assets.py ===
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+from PIL import Image
+
+from core.settings import ASSET_MEMORY_BUDGET
+from core.pack import AssetPack, pack_name
+from core.variants import VariantStore
+
+
+def _normalize_path(path):
+    """Clé de cache indépendante de la forme du chemin (relatif ou absolu, séparateurs)"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _scaled_size(size, scale):
+    """Taille cible : scale est un facteur ou une taille (largeur, hauteur)"""
+    if isinstance(scale, tuple):
+        return scale
+    return (int(round(size[0] * scale)), int(round(size[1] * scale)))
+
+
+def _surface_bytes(surface):
+    """Taille mémoire des pixels d'une surface (0 pour une subsurface qui partage ceux du parent)"""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def _decode_rgba(source):
+    """Décode un PNG en RGBA brut (thread de travail : PIL relâche le GIL pendant le décodage)"""
+    with Image.open(source) as image:
+        image = image.convert("RGBA")
+        return image.size, image.tobytes()
+
+
+def _decode_pil(source):
+    """Décode complètement une image PIL en RGBA (thread de travail)"""
+    with Image.open(source) as image:
+        image = image.convert("RGBA")
+    image.load()
+    return image
+
+
+def frame_mask(surface):
+    """Masque de collision d'une frame : bit à 1 pour chaque pixel non transparent (alpha > 0)"""
+    return pygame.mask.from_surface(surface, 0)
+
+
+def _mask_bytes(mask):
+    width, height = mask.get_size()
+    return (width * height + 7) // 8
+
+
+def _value_bytes(value):
+    """Taille mémoire d'une surface ou d'un tuple de frames (subsurfaces : pixels du parent)"""
+    if isinstance(value, tuple):
+        if value and value[0].get_parent() is not None:
+            return _surface_bytes(value[0].get_parent())
+        return sum(_surface_bytes(f) for f in value)
+    return _surface_bytes(value)
+
+
+def _transform(key):
+    """Paramètres de transformation d'une clé image/frames (pour le cache de variantes)"""
+    if key[0] == "image":
+        return {"kind": "image", "alpha": key[2], "scale": key[3]}
+    _, _, convert_alpha, scale, frame_size, grid, count, indices = key
+    return {"kind": "frames", "alpha": convert_alpha, "scale": scale, "frame_size": frame_size,
+            "grid": grid, "count": count, "indices": indices}
+
+
+def _key_from_transform(path, transform):
+    """Inverse de _transform (les tuples reviennent du manifeste JSON sous forme de listes)"""
+    def as_tuple(value):
+        return tuple(value) if isinstance(value, list) else value
+    scale = as_tuple(transform["scale"])
+    if transform["kind"] == "image":
+        return ("image", path, transform["alpha"], scale)
+    return ("frames", path, transform["alpha"], scale, as_tuple(transform["frame_size"]),
+            as_tuple(transform["grid"]), transform["count"], as_tuple(transform["indices"]))
+
+
+def slice_sheet(sheet, frame_size=None, grid=None, count=None, indices=None):
+    """Découpe une spritesheet en frames (lignes puis colonnes).
+
+    frame_size: (largeur, hauteur) fixe d'une frame
+    grid: (colonnes, lignes), la taille des frames est déduite de la feuille
+    count: nombre maximal de frames à garder
+    indices: frames à garder, dans cet ordre (index dans la grille)
+    """
+    sheet_w, sheet_h = sheet.get_size()
+    if grid:
+        columns, rows = grid
+        frame_w, frame_h = sheet_w // columns, sheet_h // rows
+    elif frame_size:
+        frame_w, frame_h = frame_size
+        columns, rows = sheet_w // frame_w, sheet_h // frame_h
+    else:
+        return (sheet,)
+
+    if indices is None:
+        total = columns * rows
+        indices = range(total if count is None else min(count, total))
+
+    return tuple(
+        sheet.subsurface(pygame.Rect((i % columns) * frame_w, (i // columns) * frame_h, frame_w, frame_h))
+        for i in indices
+    )
+
+
+class _Entry:
+    """Ressource en cache : valeur, coût mémoire, compteur de références"""
+
+    def __init__(self, key, value, size, parent=None):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.parent = parent  # Entrée dont les pixels sont partagés (subsurfaces)
+        self.refcount = 0
+
+
+class AssetHandle:
+    """Référence comptée vers une ressource du AssetManager. Appeler release() quand elle n'est plus utilisée."""
+
+    def __init__(self, manager, entry):
+        self.manager = manager
+        self.entry = entry  # L'entrée retenue elle-même : la clé peut être reconstruite entre-temps
+        self.key = entry.key
+        self.value = entry.value
+        self.released = False
+
+    def release(self):
+        """Rend la référence ; la ressource devient évinçable quand plus personne ne la tient"""
+        if not self.released:
+            self.released = True
+            self.manager._release(self.entry)
+
+
+class AssetManager:
+    """Gestionnaire singleton des images : déduplication par (chemin, transformation),
+    comptage de références et éviction LRU des ressources non référencées sous un budget mémoire.
+
+    Si l'archive ASSET_PACK_PATH existe, les fichiers qu'elle contient y sont lus en priorité
+    (reconstruire l'archive après avoir modifié assets/) ; les autres restent lus sur disque.
+    """
+
+    _instance = None
+
+    def __init__(self, budget_bytes=ASSET_MEMORY_BUDGET):
+        self.budget_bytes = budget_bytes
+        self.entries = {}
+        self.unreferenced = OrderedDict()  # key -> None, ordre LRU (le plus ancien en premier)
+        self.keys_by_path = {}
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "decodes": 0, "evictions": 0, "variant_hits": 0}
+        self.pack = AssetPack.open_default()
+        self.variants = VariantStore(self)
+
+    @classmethod
+    def get_instance(cls):
+        """Obtient l'instance partagée par tout le processus"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Remet à zéro l'instance (changement de mode vidéo, debug/tests)"""
+        if cls._instance is not None and cls._instance.pack is not None:
+            cls._instance.pack.close()
+        cls._instance = None
+
+    # === Fichiers (archive ou disque) ===
+
+    def _pack_name(self, path):
+        """Nom du fichier dans l'archive, None s'il faut le lire sur disque"""
+        if self.pack is None:
+            return None
+        name = pack_name(path)
+        return name if name is not None and self.pack.contains(name) else None
+
+    def _source(self, path):
+        """Source à décoder : contenu de l'archive (BytesIO) ou chemin sur disque"""
+        name = self._pack_name(path)
+        if name is not None:
+            return io.BytesIO(self.pack.read(name))
+        return path
+
+    def open_file(self, path):
+        """Ouvre un fichier d'asset en lecture binaire (depuis l'archive si elle le contient)"""
+        source = self._source(path)
+        return open(source, "rb") if isinstance(source, str) else source
+
+    def exists(self, path):
+        return self._pack_name(path) is not None or os.path.exists(path)
+
+    def listdir(self, folder):
+        """Fichiers d'un dossier d'assets : ceux de l'archive et ceux du disque"""
+        names = set()
+        if self.pack is not None:
+            name = pack_name(folder)
+            if name is not None:
+                names.update(self.pack.listdir(name))
+        if os.path.isdir(folder):
+            names.update(os.listdir(folder))
+        return sorted(names)
+
+    def fingerprint(self, path):
+        """Identifiant de version du contenu : hash de l'archive, sinon taille et date du fichier"""
+        name = self._pack_name(path)
+        if name is not None:
+            return self.pack.digest(name)
+        stat = os.stat(path)
+        return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+    # === API publique ===
+
+    def acquire(self, path, convert_alpha=True, scale=None, frame_size=None, grid=None, count=None,
+                indices=None):
+        """Retourne un AssetHandle sur une image (ou un tuple de frames si un découpage est donné)"""
+        if frame_size or grid:
+            key = self._frames_key(path, convert_alpha, scale, frame_size, grid, count, indices)
+        else:
+            key = self._image_key(path, convert_alpha, scale)
+        entry = self._get_entry(key)
+        self._retain(entry)
+        self._enforce_budget()
+        return AssetHandle(self, entry)
+
+    def image(self, path, convert_alpha=True, scale=None):
+        """Retourne une surface sans prise de référence (peut être évincée du cache, jamais de l'appelant)"""
+        entry = self._get_entry(self._image_key(path, convert_alpha, scale))
+        self._enforce_budget()
+        return entry.value
+
+    def frames(self, path, frame_size=None, grid=None, count=None, indices=None, scale=None,
+               convert_alpha=True):
+        """Retourne un tuple de frames découpées, sans prise de référence"""
+        key = self._frames_key(path, convert_alpha, scale, frame_size, grid, count, indices)
+        entry = self._get_entry(key)
+        self._enforce_budget()
+        return entry.value
+
+    def masks(self, path, frame_size=None, grid=None, count=None, indices=None, scale=None,
+              convert_alpha=True):
+        """Retourne les masques de collision des frames (même ordre que frames()), calculés une fois"""
+        key = ("masks",) + self._frames_key(path, convert_alpha, scale, frame_size, grid, count, indices)[1:]
+        entry = self._get_entry(key)
+        self._enforce_budget()
+        return entry.value
+
+    def pil_image(self, path):
+        """Retourne l'image PIL en RGBA (à ne pas modifier en place : copy() avant retouche)"""
+        entry = self._get_entry(("pil", _normalize_path(path)))
+        self._enforce_budget()
+        return entry.value
+
+    def generated(self, key, factory):
+        """Retourne un jeu de frames généré (fallback, dessin procédural) créé une seule fois"""
+        cache_key = ("generated",) + tuple(key)
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            frames = tuple(factory())
+            entry = self._store(cache_key, frames, sum(_surface_bytes(f) for f in frames))
+            self._enforce_budget()
+        else:
+            self._touch(entry)
+        return entry.value
+
+    def preload(self, paths, pil=False, on_progress=None, workers=None):
+        """Décode en parallèle les images pas encore en cache et retourne un AssetHandle par image.
+
+        Les PNG sont décodés par PIL sur un pool de threads ; le thread principal ne fait que
+        pygame.image.frombuffer + convert_alpha (pygame n'est pas thread-safe). Avec pil=True,
+        les images PIL sont mises en cache telles quelles (voir pil_image).
+        on_progress(fait, total) est appelé depuis le thread principal après chaque image.
+        Les handles protègent les images de l'éviction : les relâcher une fois les objets construits.
+        """
+        keys = {}
+        for path in paths:
+            key = ("pil", _normalize_path(path)) if pil else self._image_key(path, True, None)
+            if key not in keys.values() and self.exists(path):
+                keys[path] = key
+
+        handles = []
+        for path, key in list(keys.items()):
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.stats["hits"] += 1
+                self._retain(entry)
+                handles.append(AssetHandle(self, entry))
+                del keys[path]
+
+        total, done = len(keys), 0
+        if on_progress:
+            on_progress(done, total)
+
+        decode = _decode_pil if pil else _decode_rgba
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 4)) as pool:
+            futures = {pool.submit(decode, self._source(path)): path for path in keys}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except (OSError, ValueError) as e:
+                    print(f"[ASSETS] Préchargement impossible de {path}: {e}")
+                    continue
+                self.stats["misses"] += 1
+                self.stats["decodes"] += 1
+                if pil:
+                    entry = self._store(keys[path], result, result.width * result.height * 4)
+                else:
+                    size, data = result
+                    surface = pygame.image.frombuffer(data, size, "RGBA").convert_alpha()
+                    entry = self._store(keys[path], surface, _surface_bytes(surface))
+                self._retain(entry)
+                handles.append(AssetHandle(self, entry))
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+
+        self._enforce_budget()
+        return handles
+
+    def invalidate(self, path):
+        """Oublie toutes les variantes d'un fichier réécrit sur disque (export du personnage...).
+
+        Les handles existants gardent l'ancienne valeur ; leur release() ne touche pas aux
+        entrées reconstruites depuis.
+        """
+        for key in list(self.keys_by_path.get(_normalize_path(path), ())):
+            entry = self.entries.get(key)
+            if entry is not None:
+                self._drop(entry)
+
+    def set_budget(self, budget_bytes):
+        """Change le budget mémoire et évince si nécessaire"""
+        self.budget_bytes = budget_bytes
+        self._enforce_budget()
+
+    def get_stats(self):
+        """Retourne les compteurs du cache"""
+        referenced = sum(1 for entry in self.entries.values() if entry.refcount > 0)
+        return dict(self.stats, entries=len(self.entries), referenced=referenced,
+                    bytes=self.total_bytes, budget=self.budget_bytes)
+
+    def log_stats(self):
+        """Affiche les compteurs du cache"""
+        stats = self.get_stats()
+        print(f"[ASSETS] {stats['entries']} entrées ({stats['referenced']} référencées), "
+              f"{stats['bytes'] / 1048576:.1f}/{stats['budget'] / 1048576:.0f} Mo, "
+              f"{stats['decodes']} décodages, {stats['variant_hits']} variantes, "
+              f"{stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} évictions")
+
+    def clear(self):
+        """Vide entièrement le cache (les handles existants gardent leur valeur)"""
+        self.entries.clear()
+        self.unreferenced.clear()
+        self.keys_by_path.clear()
+        self.total_bytes = 0
+
+    # === Clés ===
+
+    def _image_key(self, path, convert_alpha, scale):
+        return ("image", _normalize_path(path), convert_alpha, scale)
+
+    def _frames_key(self, path, convert_alpha, scale, frame_size, grid, count, indices):
+        indices = tuple(indices) if indices is not None else None
+        return ("frames", _normalize_path(path), convert_alpha, scale, frame_size, grid, count, indices)
+
+    # === Chargement ===
+
+    def _get_entry(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self._touch(entry)
+            return entry
+        self.stats["misses"] += 1
+        return self._build(key)
+
+    def _build(self, key, use_variants=True):
+        """Crée la ressource d'une clé, en réutilisant les ressources dont elle dérive"""
+        kind, path = key[0], key[1]
+
+        if kind == "pil":
+            self.stats["decodes"] += 1
+            image = _decode_pil(self._source(path))
+            return self._store(key, image, image.width * image.height * 4)
+
+        if kind == "image" and key[3] is None:
+            convert_alpha = key[2]
+            self.stats["decodes"] += 1
+            surface = pygame.image.load(self._source(path), os.path.basename(path))
+            surface = surface.convert_alpha() if convert_alpha else surface.convert()
+            return self._store(key, surface, _surface_bytes(surface))
+
+        if kind == "frames" and key[3] is None:
+            # Les subsurfaces partagent les pixels de la feuille : elle reste référencée
+            _, _, convert_alpha, scale, frame_size, grid, count, indices = key
+            parent = self._get_entry(self._image_key(path, convert_alpha, None))
+            frames = slice_sheet(parent.value, frame_size, grid, count, indices)
+            self._retain(parent)
+            return self._store(key, frames, 0, parent=parent)
+
+        if kind == "masks":
+            # Les masques suivent le jeu de frames dont ils dérivent : il reste en cache avec eux
+            parent = self._get_entry(("frames",) + key[1:])
+            masks = tuple(frame_mask(f) for f in parent.value)
+            self._retain(parent)
+            return self._store(key, masks, sum(_mask_bytes(m) for m in masks), parent=parent)
+
+        # Variantes redimensionnées : lues telles quelles si le cache disque est à jour
+        transform = _transform(key)
+        if use_variants and self.variants is not None:
+            value = self.variants.load(path, transform)
+            if value is not None:
+                self.stats["variant_hits"] += 1
+                return self._store(key, value, _value_bytes(value))
+
+        if kind == "image":
+            _, _, convert_alpha, scale = key
+            base = self._get_entry(self._image_key(path, convert_alpha, None)).value
+            value = pygame.transform.scale(base, _scaled_size(base.get_size(), scale))
+        else:
+            _, _, convert_alpha, scale, frame_size, grid, count, indices = key
+            sheet = self._get_entry(self._image_key(path, convert_alpha, None)).value
+            frames = slice_sheet(sheet, frame_size, grid, count, indices)
+            value = tuple(pygame.transform.scale(f, _scaled_size(f.get_size(), scale)) for f in frames)
+
+        if self.variants is not None:
+            self.variants.save(path, transform, value)
+        return self._store(key, value, _value_bytes(value))
+
+    def build_variant(self, path, transform):
+        """Reconstruit une variante depuis sa source (commande python -m core.variants build)"""
+        key = _key_from_transform(_normalize_path(path), transform)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self._drop(entry)
+        self._build(key, use_variants=False)
+        self._enforce_budget()
+
+    # === Comptabilité ===
+
+    def _store(self, key, value, size, parent=None):
+        entry = _Entry(key, value, size, parent)
+        self.entries[key] = entry
+        self.unreferenced[key] = None
+        if key[0] != "generated":
+            self.keys_by_path.setdefault(key[1], set()).add(key)
+        self.total_bytes += size
+        return entry
+
+    def _touch(self, entry):
+        if entry.key in self.unreferenced:
+            self.unreferenced.move_to_end(entry.key)
+
+    def _retain(self, entry):
+        entry.refcount += 1
+        self.unreferenced.pop(entry.key, None)
+
+    def _release(self, entry):
+        if entry.refcount == 0:
+            return
+        entry.refcount -= 1
+        # Entrée retirée (invalidate, clear) ou remplacée sous la même clé : plus rien à comptabiliser
+        if self.entries.get(entry.key) is not entry:
+            return
+        if entry.refcount == 0:
+            self.unreferenced[entry.key] = None
+            self._enforce_budget()
+
+    def _drop(self, entry):
+        """Retire une entrée du cache et libère la référence sur sa feuille parente"""
+        del self.entries[entry.key]
+        self.unreferenced.pop(entry.key, None)
+        if entry.key[0] != "generated":
+            self.keys_by_path.get(entry.key[1], set()).discard(entry.key)
+        self.total_bytes -= entry.size
+        if entry.parent is not None:
+            self._release(entry.parent)
+
+    def _enforce_budget(self):
+        """Évince les ressources non référencées les moins récemment utilisées au-delà du budget"""
+        while self.total_bytes > self.budget_bytes and self.unreferenced:
+            key = next(iter(self.unreferenced))
+            self._drop(self.entries[key])
+            self.stats["evictions"] += 1
+
+
+# === Raccourcis utilisés par les widgets ===
+
+def get_image(path):
+    """Retourne l'image convertie (convert_alpha) depuis le cache, la décode au premier appel.
+
+    Lève pygame.error ou FileNotFoundError si l'image est introuvable, comme pygame.image.load.
+    """
+    return AssetManager.get_instance().image(path)
+
+
+def get_frame_set(path, frame_size=None, grid=None, count=None, indices=None, scale=None):
+    """Retourne le tuple de frames partagé pour (chemin, découpage, échelle)"""
+    return AssetManager.get_instance().frames(path, frame_size, grid, count, indices, scale)
+
+
+def get_generated_frame_set(key, factory):
+    """Retourne un jeu de frames généré (fallback, dessin procédural) en le créant une seule fois"""
+    return AssetManager.get_instance().generated(key, factory)
+
+
+def asset_exists(path):
+    """os.path.exists qui voit aussi les fichiers de l'archive d'assets"""
+    return AssetManager.get_instance().exists(path)
+
+
+def list_asset_dir(folder):
+    """os.listdir (trié) qui voit aussi les fichiers de l'archive d'assets"""
+    return AssetManager.get_instance().listdir(folder)
+
+
+def open_asset(path):
+    """Ouvre un fichier d'asset en lecture binaire (archive ou disque)"""
+    return AssetManager.get_instance().open_file(path)
+
+
+def clear_cache():
+    """Vide les caches (changement de mode vidéo, debug/tests)"""
+    AssetManager.get_instance().clear()
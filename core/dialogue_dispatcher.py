@@ -14,15 +14,17 @@ class DialogueDispatcher:
     def __init__(self, twee_path="data/Progmyst.twee"):
         self.twee_path = twee_path
         self.dialogue_data = {}
-        self.character_mapping = {
-            'D': 'DameIndenta',
-            'N': 'Neuill', 
-            'J': 'JSON',
-            'L': 'Loopfang'
-        }
+        self.character_mapping = self._load_character_mapping()
         self.quest_mapping = self._load_quest_mapping()
         self._parse_twee_file()
     
+    def _load_character_mapping(self):
+        """Charge le mapping code de dialogue -> nom du PNJ depuis les définitions (data/pnj/definitions.json)"""
+        from game.pnj import load_pnj_definitions
+        
+        return {definition.dialogue_code: name
+                for name, definition in load_pnj_definitions().items() if definition.dialogue_code}
+    
     def _load_quest_mapping(self):
         """Charge le mapping des codes de quête vers les noms"""
         from core.quest import QUESTS, NEW_QUESTS, SECRET_QUESTS
@@ -1,5 +1,4 @@
 # core/ia.py
-from game.pnj.dame_indenta import DameIndenta
 # Module IA pour les actions et déplacements de l'ordinateur (ex: Dame Indenta)
 
 class DameIndentaAI:
@@ -2,6 +2,7 @@
 import os
 import pygame
 from PIL import Image
+from core.assets import AssetManager, asset_exists
 
 
 # Ordre et mapping des couches pour le rendu isométrique selon la structure réelle
@@ -90,12 +91,12 @@ def load_layer_image_animated(layer_folder, base_index, index=0, frame_index=0,
     layer_dir = os.path.join(ASSET_DIR, layer_folder, str(base_index))
     img_path = os.path.join(layer_dir, f"{index}.png")
     
-    if not os.path.exists(img_path):
+    if not asset_exists(img_path):
         return None
     
     try:
         # Charger la spritesheet
-        sheet = Image.open(img_path).convert('RGBA')
+        sheet = AssetManager.get_instance().pil_image(img_path)
         frame_width, frame_height = 48, 96
         columns = 12
         
@@ -134,11 +135,11 @@ def load_layer_image_animated(layer_folder, base_index, index=0, frame_index=0,
 def load_layer_image(layer_folder, base_index, index=0, color=None):
     layer_dir = os.path.join(ASSET_DIR, layer_folder, str(base_index))
     img_path = os.path.join(layer_dir, f"{index}.png")
-    if not os.path.exists(img_path):
+    if not asset_exists(img_path):
         print(f"[ISO] Asset manquant : {img_path}")
         return None
 
-    img = Image.open(img_path).convert('RGBA')
+    img = AssetManager.get_instance().pil_image(img_path)
 
     # Si aucune couleur n'est fournie, retourner l'image telle quelle
     if color is None:
@@ -0,0 +1,178 @@
+# === core/pack.py ===
+"""Archive d'assets : un seul fichier au lieu de centaines de petits PNG.
+
+Format (entiers little-endian) :
+    en-tête : magic b"PMPK", version (u32), nombre d'entrées (u32)
+    index   : pour chaque entrée, longueur du nom (u16), nom UTF-8 relatif à BASE_DIR
+              avec des '/', offset (u64), longueur (u64), SHA-1 du contenu (20 octets)
+    données : contenus des fichiers, bout à bout
+
+Construction : python -m core.pack build [--source assets] [--output assets.pak]
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+from core.settings import BASE_DIR, ASSETS_DIR, ASSET_PACK_PATH
+
+MAGIC = b"PMPK"
+VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_ENTRY = struct.Struct("<QQ20s")
+_NAME_LEN = struct.Struct("<H")
+
+
+def pack_name(path):
+    """Nom d'un fichier dans l'archive (relatif à BASE_DIR, séparateurs '/'), None s'il est hors du projet"""
+    rel = os.path.relpath(os.path.abspath(path), BASE_DIR)
+    if rel.startswith(".."):
+        return None
+    return rel.replace(os.sep, "/")
+
+
+class AssetPack:
+    """Archive ouverte en mmap : les lectures ne coûtent ni open() ni stat() par fichier"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # nom -> (offset, longueur, sha1)
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_index()
+        except (ValueError, struct.error):
+            self._file.close()
+            raise
+        self.directories = self._index_directories()
+
+    @classmethod
+    def open_default(cls):
+        """Ouvre ASSET_PACK_PATH s'il existe, sinon None (développement : fichiers du dossier assets/)"""
+        if not os.path.exists(ASSET_PACK_PATH):
+            return None
+        try:
+            pack = cls(ASSET_PACK_PATH)
+            print(f"[PACK] {len(pack.entries)} fichiers dans {ASSET_PACK_PATH}")
+            return pack
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[PACK] Archive illisible ({e}), utilisation des fichiers du dossier assets/")
+            return None
+
+    def _read_index(self):
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"format d'archive inconnu ({magic!r} v{version})")
+        pos = _HEADER.size
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(self._mmap, pos)
+            pos += _NAME_LEN.size
+            name = self._mmap[pos:pos + name_len].decode("utf-8")
+            pos += name_len
+            offset, length, digest = _ENTRY.unpack_from(self._mmap, pos)
+            pos += _ENTRY.size
+            self.entries[name] = (offset, length, digest)
+
+    def _index_directories(self):
+        """Dossier -> noms des fichiers qu'il contient directement"""
+        directories = {}
+        for name in self.entries:
+            folder, _, filename = name.rpartition("/")
+            directories.setdefault(folder, []).append(filename)
+        return directories
+
+    def contains(self, name):
+        return name in self.entries
+
+    def read(self, name):
+        """Contenu d'un fichier (vue sur le mmap, sans copie)"""
+        offset, length, _ = self.entries[name]
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def digest(self, name):
+        """SHA-1 hexadécimal du contenu"""
+        return self.entries[name][2].hex()
+
+    def listdir(self, folder):
+        return list(self.directories.get(folder.rstrip("/"), []))
+
+    def verify(self):
+        """Retourne les noms dont le contenu ne correspond plus au hash de l'index"""
+        return [name for name, (_, _, digest) in self.entries.items()
+                if hashlib.sha1(self.read(name)).digest() != digest]
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+def build_pack(source_dir=ASSETS_DIR, output_path=ASSET_PACK_PATH):
+    """Regroupe tous les fichiers de source_dir dans une archive, retourne le nombre de fichiers"""
+    files = []
+    for root, dirs, filenames in os.walk(source_dir):
+        dirs.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            name = pack_name(path)
+            if name is not None:
+                files.append((name, path))
+
+    index_size = _HEADER.size + sum(_NAME_LEN.size + len(name.encode("utf-8")) + _ENTRY.size
+                                    for name, _ in files)
+    index, offset = [], index_size
+    for name, path in files:
+        with open(path, "rb") as f:
+            data = f.read()
+        index.append((name, offset, len(data), hashlib.sha1(data).digest()))
+        offset += len(data)
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+        for name, entry_offset, length, digest in index:
+            encoded = name.encode("utf-8")
+            out.write(_NAME_LEN.pack(len(encoded)))
+            out.write(encoded)
+            out.write(_ENTRY.pack(entry_offset, length, digest))
+        for name, path in files:
+            with open(path, "rb") as f:
+                out.write(f.read())
+    os.replace(tmp_path, output_path)
+    return len(index)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.pack", description="Archive d'assets ProgMyst")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="construit l'archive depuis le dossier assets/")
+    build.add_argument("--source", default=ASSETS_DIR)
+    build.add_argument("--output", default=ASSET_PACK_PATH)
+    for command in ("list", "verify"):
+        cmd = sub.add_parser(command, help=f"{command} le contenu d'une archive")
+        cmd.add_argument("--pack", default=ASSET_PACK_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_pack(args.source, args.output)
+        print(f"[PACK] {count} fichiers écrits dans {args.output} ({os.path.getsize(args.output) / 1048576:.1f} Mo)")
+        return 0
+
+    pack = AssetPack(args.pack)
+    try:
+        if args.command == "list":
+            for name, (offset, length, digest) in sorted(pack.entries.items()):
+                print(f"{digest.hex()[:12]} {length:>9} {name}")
+            return 0
+        corrupted = pack.verify()
+        for name in corrupted:
+            print(f"[PACK] Contenu corrompu : {name}")
+        print(f"[PACK] {len(pack.entries) - len(corrupted)}/{len(pack.entries)} fichiers valides")
+        return 1 if corrupted else 0
+    finally:
+        pack.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
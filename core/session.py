@@ -2,7 +2,7 @@
 import json
 import os
 from game.world import World
-from core.settings import grid_to_iso, iso_to_grid, get_player_data_path, get_player_sprite_path, get_grimoire_path
+from core.settings import DATA_DIR, grid_to_iso, iso_to_grid, get_player_data_path, get_player_sprite_path, get_grimoire_path
 
 
 class SessionManager:
@@ -50,7 +50,21 @@ class SessionManager:
         cls._session = None
     @classmethod
     def check_existing_saves(cls):
-        return [f[:-5] for f in os.listdir("data") if f.endswith(".json")]
+        """Noms des joueurs sauvegardés: seuls les data/<nom>.json écrits par create_player_files comptent"""
+        saves = []
+        for f in sorted(os.listdir(DATA_DIR)):
+            path = os.path.join(DATA_DIR, f)
+            if not (f.endswith(".json") and os.path.isfile(path)):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                print(f"[SESSION_MGR] Fichier ignoré (illisible): {f}")
+                continue
+            if isinstance(data, dict) and str(data.get("name", "")).lower() == f[:-5]:
+                saves.append(f[:-5])
+        return saves
 
     @classmethod
     def create_player_files(cls, name):
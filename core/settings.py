@@ -28,6 +28,9 @@ SPRITES_DIR = os.path.join(ASSETS_DIR, "sprites")
 BUSTS_DIR   = os.path.join(ASSETS_DIR, "Bust")
 MAP_DIR     = os.path.join(DATA_DIR, "map")
 FONT_DIR = os.path.join(ASSETS_DIR, "fonts")
+TILES_DIR = os.path.join(ASSETS_DIR, "tiles")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")  # Fichiers générés (atlas...), non versionnés
+VARIANT_CACHE_DIR = os.path.join(CACHE_DIR, "variants")  # Assets pré-redimensionnés (core/variants.py)
 
 # Fonts
 FONTS = {
@@ -43,6 +46,8 @@ LOOPFANG_MAP = os.path.join(MAP_DIR, "loopfanglerecursif.json")
 NEUILL_MAP = os.path.join(MAP_DIR, "neuill.json")
 ROI_MAP = os.path.join(MAP_DIR, "roi.json")
 TYRAN_MAP = os.path.join(MAP_DIR, "tyran.json")
+TILESET_PATH = os.path.join(ASSETS_DIR, "isometric tileset", "Progmysttiles.tsx")
+PNJ_DATA_PATH = os.path.join(DATA_DIR, "pnj", "definitions.json")  # Définitions des PNJ, hors des sauvegardes data/*.json
 
 # === TUILES ===
 TILE_WIDTH = 64
@@ -53,6 +58,33 @@ LAYER_HEIGHT = 16
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 
+# === BOUCLE DE JEU ===
+FPS = 60                  # Limite d'affichage
+SIMULATION_HZ = 30        # Pas fixe de la logique (game/timestep.py)
+MAX_SIMULATION_STEPS = 5  # Pas de rattrapage max par image (au-delà, le retard est abandonné)
+
+# === MENUS ===
+MENU_BACKGROUND_PATH = os.path.join(ASSETS_DIR, "other", "blueaura.png")  # Fond redimensionné à la taille de l'écran
+ELECTRIC_AURA_PATH = os.path.join(ASSETS_DIR, "other", "electricaura.png")
+DEFAULT_CHARACTER_SPRITE = os.path.join(SPRITES_DIR, "default_character.png")  # Menu d'un joueur sans sprite
+MENU_SPRITE_SCALE = 2                                  # Personnage et aura du menu en double taille
+MENU_IDLE_FRAMES = (1, 4, 13, 28, 37, 40, 25, 16)      # Rotation du personnage (grille 12x8 de 48x96)
+MENU_HOVER_FRAMES = (49, 52, 61, 76, 85, 88, 73, 64)   # Même rotation, au survol
+
+# === ASSETS ===
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024  # Octets d'images non référencées gardées en cache
+ASSET_PACK_PATH = os.path.join(BASE_DIR, "assets.pak")  # Archive construite par python -m core.pack build
+
+# === CARTES ===
+MAP_CACHE_SIZE = 4                      # Cartes gardées en mémoire (les plus récemment utilisées)
+MAP_MEMORY_BUDGET = 32 * 1024 * 1024    # Octets de données de cartes en cache (tableaux, navigation)
+PORTAL_PRELOAD_RADIUS = 6               # Distance (cases) à un portail qui déclenche le préchargement
+MAP_CHUNK_SIZE = 16                     # Côté (cases) des morceaux de carte préparés pour l'affichage
+CHUNK_PREFETCH = 1                      # Anneau de morceaux préparés autour de la vue, avant qu'ils n'y entrent
+CHUNK_EVICT_MARGIN = 3                  # Morceaux plus loin que ça de la vue : libérés
+OCCLUSION_CULLING = True                # Tuiles entièrement cachées par celles dessinées après : jamais dessinées
+MAP_BIN_DIR = os.path.join(CACHE_DIR, "maps")  # Cartes compilées (python -m game.mapbin build)
+
 # === FONCTIONS UTILITAIRES COORDONNÉES (Matrices de transformation) ===
 
 def _get_iso_transformation_matrix(tile_width=64, tile_height=64):
@@ -85,6 +117,11 @@ def grid_to_iso(x, y, tile_width=64, tile_height=64):
         print(f"[SETTINGS] Erreur conversion grid_to_iso: {e}")
         return 0, 0
 
+def grid_to_iso_array(points, tile_width=64, tile_height=64):
+    """Version vectorisée de grid_to_iso : tableau (N, 2) de coordonnées grille -> pixels entiers (N, 2)"""
+    transform_matrix = _get_iso_transformation_matrix(tile_width, tile_height)
+    return np.rint(np.asarray(points, dtype=np.float64) @ transform_matrix.T).astype(np.int64)
+
 def iso_to_grid(iso_x, iso_y, tile_width=64, tile_height=64):
     """Convertit les coordonnées pixels en coordonnées grille via matrice inverse"""
     try:
@@ -0,0 +1,266 @@
+# === core/variants.py ===
+"""Variantes pré-transformées des assets (redimensionnées, converties).
+
+Chaque variante est identifiée par le hash du contenu source et les paramètres de la
+transformation. Le manifeste (VARIANT_CACHE_DIR/manifest.json) garde pour chaque variante sa
+source, le hash source utilisé et le fichier produit : une variante dont la source a changé est
+périmée et sera reconstruite, les autres sont chargées telles quelles au lieu de refaire
+décodage + redimensionnement.
+
+Les variantes connues d'avance (declared_variants : fond des menus à la taille de l'écran,
+personnage et aura du menu en double taille, spritesheets des PNJ mis à l'échelle) sont
+produites par "build" même sur un cache vide ; les autres s'ajoutent au manifeste quand le jeu
+les crée.
+
+    python -m core.variants status   liste les variantes périmées ou manquantes
+    python -m core.variants build    produit les variantes déclarées manquantes et reconstruit les périmées
+    python -m core.variants prune    supprime les variantes dont la source a disparu
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import sys
+
+import pygame
+
+from core.settings import (VARIANT_CACHE_DIR, DATA_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, MENU_BACKGROUND_PATH,
+                           ELECTRIC_AURA_PATH, DEFAULT_CHARACTER_SPRITE, MENU_SPRITE_SCALE, MENU_IDLE_FRAMES,
+                           MENU_HOVER_FRAMES)
+from core.pack import pack_name
+
+MANIFEST_VERSION = 1
+
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _jsonable(value):
+    """Tuples -> listes, récursivement (pour des paramètres de transformation stables en JSON)"""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def declared_variants(assets):
+    """(chemin, transformation) des variantes connues d'avance, dont la source existe"""
+    from core.assets import _transform
+    from game.pnj.definitions import load_pnj_definitions
+
+    keys = [assets._image_key(MENU_BACKGROUND_PATH, False, (SCREEN_WIDTH, SCREEN_HEIGHT)),
+            assets._frames_key(ELECTRIC_AURA_PATH, True, MENU_SPRITE_SCALE, (96, 96), None, 7, None)]
+    # Personnage du menu : sprite par défaut et sprites exportés par le créateur de personnage
+    for path in [DEFAULT_CHARACTER_SPRITE] + sorted(glob.glob(os.path.join(DATA_DIR, "*_iso.png"))):
+        for indices in (MENU_IDLE_FRAMES, MENU_HOVER_FRAMES):
+            keys.append(assets._frames_key(path, True, MENU_SPRITE_SCALE, (48, 96), None, None, indices))
+    # Spritesheets des PNJ, mis à l'échelle comme dans PNJ.load_frames
+    for definition in load_pnj_definitions().values():
+        spec = definition.sprite_spec
+        if spec.get("scale") is None:
+            continue
+        if spec.get("frame_size") or spec.get("grid"):
+            keys.append(assets._frames_key(definition.sprite_path, True, spec["scale"], spec.get("frame_size"),
+                                           spec.get("grid"), spec.get("count"), spec.get("indices")))
+        else:
+            keys.append(assets._image_key(definition.sprite_path, True, spec["scale"]))
+    return [(key[1], _transform(key)) for key in keys if assets.exists(key[1])]
+
+
+class VariantStore:
+    """Cache disque des variantes, indexé par manifeste"""
+
+    def __init__(self, assets, cache_dir=VARIANT_CACHE_DIR):
+        self.assets = assets  # AssetManager : accès archive/disque et empreintes des sources
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "sources": {}, "variants": {}}
+
+    def _write_manifest(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    # === Sources ===
+
+    def _source_name(self, path):
+        return pack_name(path) or os.path.abspath(path)
+
+    def source_hash(self, path):
+        """Hash du contenu source. Dans l'archive il est déjà dans l'index ; sur disque il n'est
+        recalculé que si la taille ou la date du fichier ont changé depuis le dernier calcul."""
+        if self.assets._pack_name(path) is not None:
+            return self.assets.fingerprint(path)
+        name = self._source_name(path)
+        fingerprint = self.assets.fingerprint(path)
+        known = self.manifest["sources"].get(name)
+        if known and known["fingerprint"] == fingerprint:
+            return known["hash"]
+        content_hash = _file_sha1(path)
+        self.manifest["sources"][name] = {"fingerprint": fingerprint, "hash": content_hash}
+        return content_hash
+
+    # === Variantes ===
+
+    @staticmethod
+    def variant_id(source_hash, transform):
+        params = json.dumps(_jsonable(transform), sort_keys=True)
+        return hashlib.sha1(f"{source_hash}:{params}".encode()).hexdigest()[:16]
+
+    def load(self, path, transform):
+        """Retourne la variante fraîche (surface, ou tuple de frames) ou None"""
+        if not self.assets.exists(path):
+            return None
+        record = self.manifest["variants"].get(self.variant_id(self.source_hash(path), transform))
+        if record is None:
+            return None
+        variant_path = os.path.join(self.cache_dir, record["file"])
+        try:
+            surface = pygame.image.load(variant_path)
+        except (pygame.error, FileNotFoundError):
+            return None
+        surface = surface.convert_alpha() if transform["alpha"] else surface.convert()
+        if transform["kind"] == "image":
+            return surface
+        frame_w, frame_h = record["frame_size"]
+        columns = surface.get_width() // frame_w
+        return tuple(surface.subsurface(pygame.Rect((i % columns) * frame_w, (i // columns) * frame_h,
+                                                    frame_w, frame_h))
+                     for i in range(record["count"]))
+
+    def save(self, path, transform, value):
+        """Écrit la variante produite au runtime et l'enregistre dans le manifeste"""
+        source_hash = self.source_hash(path)
+        variant = self.variant_id(source_hash, transform)
+        record = {"source": self._source_name(path), "path": path, "source_hash": source_hash,
+                  "transform": _jsonable(transform), "file": f"{variant}.png"}
+        if transform["kind"] == "image":
+            surface = value
+        else:
+            surface, record["frame_size"], record["count"] = self._pack_frames(value)
+            if surface is None:
+                return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(surface, os.path.join(self.cache_dir, record["file"]))
+            # Une source n'a qu'une variante par transformation : on oublie l'ancienne version
+            for old_id, old in list(self.manifest["variants"].items()):
+                if old["source"] == record["source"] and old["transform"] == record["transform"]:
+                    self._remove(old_id)
+            self.manifest["variants"][variant] = record
+            self._write_manifest()
+        except (OSError, pygame.error) as e:
+            print(f"[VARIANTS] Variante non écrite pour {path}: {e}")
+
+    @staticmethod
+    def _pack_frames(frames):
+        """Range des frames de même taille en grille dans une seule surface"""
+        if not frames or any(f.get_size() != frames[0].get_size() for f in frames):
+            return None, None, None
+        frame_w, frame_h = frames[0].get_size()
+        columns = max(1, math.ceil(math.sqrt(len(frames))))
+        rows = math.ceil(len(frames) / columns)
+        sheet = pygame.Surface((columns * frame_w, rows * frame_h), pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+        for i, frame in enumerate(frames):
+            sheet.blit(frame, ((i % columns) * frame_w, (i // columns) * frame_h))
+        return sheet, [frame_w, frame_h], len(frames)
+
+    def _remove(self, variant):
+        record = self.manifest["variants"].pop(variant, None)
+        if record:
+            try:
+                os.remove(os.path.join(self.cache_dir, record["file"]))
+            except OSError:
+                pass
+
+    def stale(self):
+        """Variantes à reconstruire (source modifiée ou fichier manquant) et variantes orphelines"""
+        stale, orphans = [], []
+        for variant, record in self.manifest["variants"].items():
+            if not self.assets.exists(record["path"]):
+                orphans.append(variant)
+            elif (self.source_hash(record["path"]) != record["source_hash"]
+                  or not os.path.exists(os.path.join(self.cache_dir, record["file"]))):
+                stale.append(variant)
+        return stale, orphans
+
+    def missing(self, declared):
+        """Variantes déclarées (chemin, transformation) jamais produites (les périmées sont dans stale)"""
+        known = {(record["source"], json.dumps(record["transform"], sort_keys=True))
+                 for record in self.manifest["variants"].values()}
+        return [(path, transform) for path, transform in declared
+                if (self._source_name(path), json.dumps(_jsonable(transform), sort_keys=True)) not in known]
+
+    def prune(self, variants):
+        for variant in variants:
+            self._remove(variant)
+        self._write_manifest()
+
+
+def main(argv=None):
+    from core.assets import AssetManager
+
+    parser = argparse.ArgumentParser(prog="python -m core.variants", description="Variantes pré-transformées")
+    parser.add_argument("command", choices=("status", "build", "prune"))
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    assets = AssetManager.get_instance()
+    store = assets.variants
+    stale, orphans = store.stale()
+
+    declared = declared_variants(assets)
+
+    if args.command == "status":
+        for variant in stale:
+            record = store.manifest["variants"][variant]
+            print(f"[VARIANTS] Périmée : {record['source']} {record['transform']}")
+        for variant in orphans:
+            print(f"[VARIANTS] Orpheline : {store.manifest['variants'][variant]['source']}")
+        missing = store.missing(declared)
+        for path, transform in missing:
+            print(f"[VARIANTS] Manquante : {store._source_name(path)} {_jsonable(transform)}")
+        print(f"[VARIANTS] {len(store.manifest['variants'])} variantes, {len(stale)} périmées, "
+              f"{len(missing)} manquantes, {len(orphans)} orphelines")
+        return 1 if stale or missing or orphans else 0
+
+    if args.command == "prune":
+        store.prune(orphans)
+        print(f"[VARIANTS] {len(orphans)} variantes orphelines supprimées")
+        return 0
+
+    # build : seules les variantes périmées ou manquantes repassent par décodage + transformation
+    missing = store.missing(declared)
+    for variant in stale:
+        record = store.manifest["variants"][variant]
+        assets.build_variant(record["path"], record["transform"])
+    for path, transform in missing:
+        assets.build_variant(path, transform)
+    print(f"[VARIANTS] {len(stale)} variantes reconstruites, {len(missing)} produites")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
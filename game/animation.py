@@ -0,0 +1,92 @@
+import numpy as np
+
+
+class Animation:
+    """Precomputed animation: frame indices and the cumulative end time of each frame.
+
+    The frame shown at any moment is a lookup of the elapsed time in the cumulative durations,
+    so nothing has to be accumulated per entity and per frame.
+    """
+
+    __slots__ = ("frames", "ends", "duration")
+
+    def __init__(self, frames, durations):
+        frames = list(frames) or [0]
+        durations = list(durations) or [1]
+        self.frames = np.asarray(frames, dtype=np.int32)
+        self.ends = np.cumsum(np.maximum(np.asarray(durations, dtype=np.float64), 1.0))
+        self.duration = float(self.ends[-1])
+
+    @classmethod
+    def uniform(cls, frames, delay):
+        """Every frame shown for delay milliseconds"""
+        frames = list(frames) or [0]
+        return cls(frames, [delay] * len(frames))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def index_at(self, elapsed):
+        """Position in the sequence after elapsed milliseconds (looping)"""
+        if len(self.frames) == 1:
+            return 0
+        return int(np.searchsorted(self.ends, elapsed % self.duration, side="right"))
+
+    def frame_at(self, elapsed):
+        """Sheet frame index shown after elapsed milliseconds"""
+        return int(self.frames[self.index_at(elapsed)])
+
+    def frames_at(self, elapsed):
+        """Vectorized frame_at for an array of elapsed times"""
+        local = np.asarray(elapsed, dtype=np.float64) % self.duration
+        return self.frames[np.searchsorted(self.ends, local, side="right")]
+
+
+def build_animations(sequences, delay):
+    """{name: frame list, or {"frames": [...], "durations": [...]}} -> {name: Animation}"""
+    animations = {}
+    for name, sequence in sequences.items():
+        if isinstance(sequence, Animation):
+            animations[name] = sequence
+        elif isinstance(sequence, dict):
+            frames = sequence["frames"]
+            durations = sequence.get("durations") or [sequence.get("delay", delay)] * len(frames)
+            animations[name] = Animation(frames, durations)
+        else:
+            animations[name] = Animation.uniform(sequence, delay)
+    return animations
+
+
+class AnimationController:
+    """Single animation clock shared by every entity.
+
+    The game loop advances it once per frame with tick(dt). An entity only remembers which
+    animation it plays and the clock time it started at; its current frame is derived when it
+    is drawn, so entities that are not drawn cost nothing.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self.time = 0.0  # Milliseconds since start (only advanced by tick)
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def tick(self, dt):
+        """Advance the clock by dt milliseconds"""
+        self.time += dt
+
+    def elapsed(self, start_time):
+        return self.time - start_time
+
+    def frame(self, animation, start_time):
+        """Sheet frame index of an animation started at start_time"""
+        return animation.frame_at(self.time - start_time)
@@ -8,9 +8,9 @@ class Camera:
     def follow(self, target):
         self.center_on_character(target)
 
-    def center_on_character(self, character):
+    def center_on_character(self, character, alpha=None):
         if hasattr(character, 'get_screen_position'):
-            screen_x, screen_y = character.get_screen_position()
+            screen_x, screen_y = character.get_screen_position(alpha=alpha)
             self.x = screen_x - self.width // 2
             self.y = screen_y - self.height // 2
 
@@ -1,10 +1,20 @@
 import pygame
 import math
+from core.assets import AssetManager
 from game.entity import Entity
+from game.animation import AnimationController, build_animations
+from game.collision import sweep_box
 
 class Character(Entity):
     """Simplified Character with fluid movement"""
     
+    COLLISION_HALF_SIZE = 0.25  # Collision box half-width, in tiles
+    
+    __slots__ = ("float_pos", "session", "world_manager", "speed", "energie",
+                 "frame_width", "frame_height", "columns", "rows", "sprite_handle", "frames", "animations",
+                 "anim_state", "anim_start", "anim_delay", "direction", "moving",
+                 "input_vector", "path", "previous_pos", "show_debug")
+    
     def __init__(self, session, world_manager, speed=3.0):
         # Get reliable spawn position
         spawn_x, spawn_y = world_manager.get_spawn_position('joueur')
@@ -14,6 +24,7 @@ class Character(Entity):
         
         # Character uses float position for smooth movement
         self.float_pos = [float(spawn_x), float(spawn_y)]
+        self.previous_pos = tuple(self.float_pos)  # float_pos at the previous update (render interpolation)
         
         print(f"[CHAR] Initialized - grid: {tuple(self.grid_pos)}, float: {tuple(self.float_pos)}")
         
@@ -27,21 +38,21 @@ class Character(Entity):
         self.max_hp = 2
         self.energie = 1
         
-        # Load sprite
-        self.sprite_sheet = pygame.image.load(session.data["sprite_path"]).convert_alpha()
+        # Load sprite (shared through the asset manager)
         self.frame_width, self.frame_height, self.columns, self.rows = 48, 96, 12, 8
+        self.sprite_handle = None
         self.frames = self.load_frames()
-        self.animations = self.define_animations()
+        self.anim_delay = 120
+        self.animations = build_animations(self.define_animations(), self.anim_delay)
         
-        # Animation state
+        # Animation state (frame derived from the shared animation clock)
         self.anim_state = "idle_front"
-        self.anim_index = 0
-        self.anim_timer = 0
-        self.anim_delay = 120
+        self.anim_start = AnimationController.get_instance().time
         
         # Movement state
         self.direction = "front"
         self.moving = False
+        self.path = []  # Click-to-move waypoints (grid cells)
         
         # Register with world
         self.register_to_world(world_manager)
@@ -52,19 +63,25 @@ class Character(Entity):
         """Character returns float position for smooth movement"""
         return tuple(self.float_pos)
     
+    def get_render_position(self, alpha):
+        """Float position interpolated between the last two simulation steps"""
+        (px, py), (x, y) = self.previous_pos, self.float_pos
+        return (px + (x - px) * alpha, py + (y - py) * alpha)
+    
     def sync_positions(self):
         """Synchronize grid and float positions using unified coordinate system"""
         # Update grid position from float position
         new_grid_x = int(round(self.float_pos[0]))
         new_grid_y = int(round(self.float_pos[1]))
         
-        # Ensure within map bounds (0-32)
-        new_grid_x = max(0, min(32, new_grid_x))
-        new_grid_y = max(0, min(32, new_grid_y))
+        # Ensure within map bounds
+        new_grid_x = max(0, min(self.world.map.width - 1, new_grid_x))
+        new_grid_y = max(0, min(self.world.map.height - 1, new_grid_y))
         
         if [new_grid_x, new_grid_y] != self.grid_pos:
             old_grid = tuple(self.grid_pos)
             self.grid_pos = [new_grid_x, new_grid_y]
+            self.world.entity_moved(self)
             print(f"[CHAR] Grid synced from {old_grid} to {tuple(self.grid_pos)}")
             
             # Update session on grid change
@@ -73,15 +90,19 @@ class Character(Entity):
     
     def get_current_frame(self):
         """Get current animation frame"""
-        frames = self.animations.get(self.anim_state)
-        return self.frames[frames[self.anim_index % len(frames)]] if frames else self.frames[0]
+        animation = self.animations.get(self.anim_state)
+        if animation is None:
+            return self.frames[0]
+        return self.frames[AnimationController.get_instance().frame(animation, self.anim_start)]
     
     def load_frames(self):
         """Load sprite frames"""
-        return [self.sprite_sheet.subsurface(pygame.Rect(
-            col * self.frame_width, row * self.frame_height,
-            self.frame_width, self.frame_height))
-            for row in range(self.rows) for col in range(self.columns)]
+        if self.sprite_handle:
+            self.sprite_handle.release()
+        self.sprite_handle = AssetManager.get_instance().acquire(
+            self.session.data["sprite_path"], frame_size=(self.frame_width, self.frame_height),
+            count=self.columns * self.rows)
+        return self.sprite_handle.value
 
     def define_animations(self):
         """Define animation sequences"""
@@ -148,21 +169,57 @@ class Character(Entity):
         return self.direction
 
     def update(self, dt):
-        """Update character"""
+        """Update character (one simulation step of dt milliseconds)"""
+        self.previous_pos = tuple(self.float_pos)
+        
         # Handle input
         keys = pygame.key.get_pressed()
         self.handle_input(keys)
         
+        # Keyboard overrides click-to-move
+        if self.moving:
+            self.path = []
+        elif self.path:
+            self.follow_path(dt)
+        
         # Update animation state
-        self.anim_state = f"walk_{self.direction}" if self.moving else f"idle_{self.direction}"
+        self.set_anim_state(f"walk_{self.direction}" if self.moving else f"idle_{self.direction}")
         
         # Move if moving
         if self.moving:
             self.move(dt)
-        
-        # Update animation
-        self.update_animation(dt)
 
+    def move_towards(self, x, y):
+        """Click-to-move: walk to grid (x, y) along the shortest path"""
+        path = self.path_to(x, y)
+        if path is None:
+            print(f"[CHAR] No path to ({int(round(x))}, {int(round(y))})")
+            return False
+        self.path = list(path)
+        return True
+    
+    def follow_path(self, dt):
+        """Steer the input vector toward the next waypoint of the click-to-move path"""
+        step = self.speed * dt / 1000.0
+        while self.path:
+            grid_dx = self.path[0][0] - self.float_pos[0]
+            grid_dy = self.path[0][1] - self.float_pos[1]
+            distance = math.hypot(grid_dx, grid_dy)
+            if distance > step:
+                self.input_vector = (grid_dx / distance, grid_dy / distance)
+            elif len(self.path) == 1:
+                # Last waypoint within this frame's step: scale the input to land exactly on it
+                self.path.pop()
+                if distance == 0:
+                    return
+                self.input_vector = (grid_dx / step, grid_dy / step)
+            else:
+                self.path.pop(0)
+                continue
+            self.moving = True
+            self.direction = self.compute_direction_from_grid(grid_dx, grid_dy)
+            return
+    
     def move(self, dt):
         """Smooth character movement using exact grid axes"""
         grid_dx, grid_dy = self.input_vector
@@ -173,41 +230,43 @@ class Character(Entity):
         dt_seconds = dt / 1000.0
         movement_distance = self.speed * dt_seconds
         
-        # Calculate new float position
-        new_x = self.float_pos[0] + grid_dx * movement_distance
-        new_y = self.float_pos[1] + grid_dy * movement_distance
+        if not self.world:
+            return
         
-        # Check if new grid position is valid
-        test_grid_x = int(round(new_x))
-        test_grid_y = int(round(new_y))
+        # Standing on a tile that is no longer walkable: step off it first
+        if not self.world.is_valid_position(*self.float_pos):
+            self.unstick()
         
-        if self.world and self.world.is_valid_position(test_grid_x, test_grid_y):
-            # Update float position
-            self.float_pos = [new_x, new_y]
-            
-            # Sync grid position only when needed (not forced)
-            self.sync_positions()
-        else:
-            # Movement blocked
-            print(f"[CHAR] Movement blocked at ({test_grid_x}, {test_grid_y})")
+        # Sweep the collision box through the walkable tiles, sliding along walls
+        (new_x, new_y), (blocked_x, blocked_y) = sweep_box(
+            self.world.walkable, self.float_pos,
+            (grid_dx * movement_distance, grid_dy * movement_distance), self.COLLISION_HALF_SIZE)
+        
+        # Entering a tile held by another entity: wait here (a click-to-move path is kept)
+        if not self.world.is_free(new_x, new_y, self):
+            return
+        self.float_pos = [new_x, new_y]
+        
+        # Sync grid position only when needed (not forced)
+        self.sync_positions()
+        
+        # Fully stopped by a wall: drop the click-to-move path
+        if (blocked_x or not grid_dx) and (blocked_y or not grid_dy) and self.path:
+            print(f"[CHAR] Movement blocked at {tuple(self.grid_pos)}")
+            self.path = []
 
-    def update_animation(self, dt):
-        """Update sprite animation"""
-        frames = self.animations.get(self.anim_state)
-        if not frames:
-            self.anim_state = "idle_front"
-            frames = self.animations["idle_front"]
-            self.anim_index = 0
-        
-        self.anim_timer += dt
-        if self.anim_timer >= self.anim_delay:
-            self.anim_timer = 0
-            self.anim_index = (self.anim_index + 1) % len(frames)
+    def set_anim_state(self, anim_state):
+        """Switch animation; the new one starts from its first frame on the shared clock"""
+        if anim_state not in self.animations:
+            anim_state = "idle_front"
+        if anim_state != self.anim_state:
+            self.anim_state = anim_state
+            self.anim_start = AnimationController.get_instance().time
 
-    def draw(self, surface, camera):
+    def draw(self, surface, camera, alpha=None):
         """Draw character using float position for smooth movement"""
         camera_offset = (-camera.x, -camera.y)
-        super().draw(surface, camera_offset)
+        super().draw(surface, camera_offset, alpha)
         
         # Simple debug info
         if hasattr(self, 'show_debug') and self.show_debug:
@@ -216,15 +275,25 @@ class Character(Entity):
             text_surface = font.render(debug_text, True, (255, 255, 255))
             surface.blit(text_surface, (10, 10))
 
+    def move_to(self, x, y):
+        """Teleport to a grid position, keeping the float position in sync"""
+        if not super().move_to(x, y):
+            return False
+        self.float_pos = [float(self.grid_pos[0]), float(self.grid_pos[1])]
+        self.previous_pos = tuple(self.float_pos)
+        return True
+
     # Combat methods for compatibility
     def combat_move_to(self, target_x, target_y):
         """Combat positioning using unified grid system"""
         target_x, target_y = int(round(target_x)), int(round(target_y))
         
-        if self.world and self.world.is_valid_position(target_x, target_y):
+        if self.world and self.world.is_free(target_x, target_y, self) and self.path_to(target_x, target_y) is not None:
             # Sync both positions
             self.grid_pos = [target_x, target_y]
             self.float_pos = [float(target_x), float(target_y)]
+            self.previous_pos = tuple(self.float_pos)
+            self.world.entity_moved(self)
             print(f"[CHAR] Combat moved to {tuple(self.grid_pos)}")
             return "none"
         
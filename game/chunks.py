@@ -0,0 +1,160 @@
+import numpy as np
+
+from core.settings import (TILE_WIDTH, TILE_HEIGHT, LAYER_HEIGHT, MAP_CHUNK_SIZE, CHUNK_PREFETCH,
+                           CHUNK_EVICT_MARGIN, OCCLUSION_CULLING, grid_to_iso_array)
+from game.occlusion import TileOcclusion
+
+
+class BakedChunk:
+    """Draw data of the tiles of one chunk, on every layer"""
+
+    __slots__ = ("keys", "dests", "areas", "fills")
+
+    def __init__(self, keys, dests, areas, fills):
+        self.keys = keys        # (N, 3) int32 (layer, y, x): draw order
+        self.dests = dests      # (N, 2) blit positions relative to the map center
+        self.areas = areas      # Atlas rect per tile (None without atlas: fallback tile)
+        self.fills = fills      # (N,) visible pixels per tile (overdraw counter)
+
+    @property
+    def nbytes(self):
+        return (self.keys.nbytes + self.dests.nbytes + self.fills.nbytes
+                + len(self.areas) * 8)
+
+
+class ChunkStreamer:
+    """Baked draw data of the map chunks around the camera.
+
+    A chunk is chunk_size x chunk_size cells. Baking reads its tiles on every layer and
+    precomputes their draw order, pixel positions and atlas areas; drawing then only offsets
+    and culls arrays. Chunks are baked when they enter the view or the CHUNK_PREFETCH ring
+    around it, and dropped once they are more than CHUNK_EVICT_MARGIN chunks away, so the
+    memory used follows the area around the camera instead of the map size.
+
+    With OCCLUSION_CULLING, tiles fully covered by tiles drawn after them (game/occlusion.py)
+    are left out when baking, so they are never blitted.
+    """
+
+    def __init__(self, map_data, chunk_size=MAP_CHUNK_SIZE):
+        self.map = map_data
+        self.chunk_size = chunk_size
+        self.chunks = {}        # (cx, cy) -> BakedChunk, None for a chunk without tiles
+        self.view_range = None  # Chunk range of the last merged view
+        self.view = None        # (keys order applied) merged dests, areas, fills of the view chunks
+        self.occlusion = None   # TileOcclusion of the current atlas
+        self.stats = {"baked": 0, "evicted": 0, "occluded": 0}
+
+    def clear(self):
+        """Drop every baked chunk (atlas change, map leaving the cache)"""
+        self.chunks = {}
+        self.view_range = None
+        self.view = None
+        self.occlusion = None
+
+    def _occlusion(self):
+        if self.occlusion is None and self.map.atlas:
+            self.occlusion = TileOcclusion(self.map.atlas, self.map.tile_properties)
+        return self.occlusion
+
+    def _bake(self, cx, cy):
+        size = self.chunk_size
+        x0, y0 = cx * size, cy * size
+        x1, y1 = min(x0 + size, self.map.width), min(y0 + size, self.map.height)
+        self.stats["baked"] += 1
+        if not self.map.layers:
+            return None
+        occlusion = self._occlusion()
+        culling = occlusion is not None and OCCLUSION_CULLING
+        # Occlusion needs the tiles around the chunk that can cover its own
+        margin = occlusion.margin(len(self.map.layers)) if culling else 0
+        stack = np.array([layer.gids(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+                          for layer in self.map.layers])
+        regions = stack[:, margin:margin + y1 - y0, margin:margin + x1 - x0]
+        if culling:
+            hidden = occlusion.hidden(stack, margin) & (regions > 0)
+            self.stats["occluded"] += int(np.count_nonzero(hidden))
+            regions = np.where(hidden, 0, regions)
+
+        keys = []
+        gids = []
+        for layer_index, region in enumerate(regions):
+            ys, xs = np.nonzero(region)
+            if len(xs):
+                keys.append(np.column_stack([np.full(len(xs), layer_index), ys + y0, xs + x0]))
+                gids.append(region[ys, xs])
+        if not keys:
+            return None
+
+        keys = np.concatenate(keys).astype(np.int32)
+        gids = np.concatenate(gids)
+        atlas = self.map.atlas
+        if atlas:
+            # Tiles without an atlas image are not drawn
+            areas = [atlas.get_rect(gid) for gid in gids.tolist()]
+            kept = np.array([area is not None for area in areas], dtype=bool)
+            keys, gids = keys[kept], gids[kept]
+            areas = [area for area in areas if area is not None]
+            if not areas:
+                return None
+        else:
+            areas = [None] * len(keys)
+        if occlusion:
+            fills = occlusion.fill[occlusion.index(gids)]
+        else:
+            fills = np.full(len(keys), TILE_WIDTH * TILE_HEIGHT, dtype=np.int32)
+
+        center_x, center_y = self.map.center
+        centers = grid_to_iso_array(keys[:, [2, 1]] - np.array([center_x, center_y]), TILE_WIDTH, TILE_HEIGHT)
+        # Each layer is drawn LAYER_HEIGHT pixels higher
+        dests = centers - np.column_stack([np.full(len(keys), TILE_WIDTH // 2),
+                                           TILE_HEIGHT // 2 + keys[:, 0] * LAYER_HEIGHT])
+        return BakedChunk(keys, dests, areas, fills)
+
+    def chunk_range(self, min_x, min_y, max_x, max_y, margin=0):
+        """Chunks (cx0, cy0, cx1, cy1 inclusive) covering a cell rectangle, grown by margin chunks"""
+        size = self.chunk_size
+        last_x = max(0, (self.map.width - 1) // size)
+        last_y = max(0, (self.map.height - 1) // size)
+        return (max(0, int(min_x // size) - margin), max(0, int(min_y // size) - margin),
+                min(last_x, int(max_x // size) + margin), min(last_y, int(max_y // size) + margin))
+
+    def update(self, min_x, min_y, max_x, max_y):
+        """Bake the chunks in view and in the prefetch ring, evict the far ones"""
+        cx0, cy0, cx1, cy1 = self.chunk_range(min_x, min_y, max_x, max_y, CHUNK_PREFETCH)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                if (cx, cy) not in self.chunks:
+                    self.chunks[(cx, cy)] = self._bake(cx, cy)
+
+        kx0, ky0, kx1, ky1 = self.chunk_range(min_x, min_y, max_x, max_y, CHUNK_EVICT_MARGIN)
+        far = [key for key in self.chunks if not (kx0 <= key[0] <= kx1 and ky0 <= key[1] <= ky1)]
+        for key in far:
+            del self.chunks[key]
+        self.stats["evicted"] += len(far)
+
+    def visible(self, min_x, min_y, max_x, max_y):
+        """Tiles of the chunks covering a cell rectangle, in draw order: (dests, areas, fills).
+
+        The merged order only depends on the set of chunks, so it is rebuilt only when the
+        camera moves onto another chunk range.
+        """
+        view_range = self.chunk_range(min_x, min_y, max_x, max_y)
+        if view_range != self.view_range:
+            cx0, cy0, cx1, cy1 = view_range
+            baked = [self.chunks.get((cx, cy)) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+            baked = [chunk for chunk in baked if chunk is not None]
+            if baked:
+                keys = np.concatenate([chunk.keys for chunk in baked])
+                order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))  # layer, then y, then x
+                areas = [area for chunk in baked for area in chunk.areas]
+                self.view = (np.concatenate([chunk.dests for chunk in baked])[order],
+                             [areas[i] for i in order.tolist()],
+                             np.concatenate([chunk.fills for chunk in baked])[order])
+            else:
+                self.view = (np.zeros((0, 2), dtype=np.int64), [], np.zeros(0, dtype=np.int32))
+            self.view_range = view_range
+        return self.view
+
+    @property
+    def nbytes(self):
+        return sum(chunk.nbytes for chunk in self.chunks.values() if chunk is not None)
@@ -0,0 +1,48 @@
+import math
+
+EPSILON = 1e-9
+
+
+def _cell(coordinate, bias=0.0):
+    """Tile index containing a grid coordinate (tile k covers [k - 0.5, k + 0.5))"""
+    return math.floor(coordinate + 0.5 + bias)
+
+
+def _sweep_axis(walkable, along, across, move, half_size, axis):
+    """Move a box along one axis until its leading edge meets a blocked tile.
+
+    along / across are the box center coordinates on the moving axis and the other one.
+    Only the tiles the leading edge enters are tested, so the cost depends on the distance
+    covered (one column or row of tiles per tile travelled), not on the frame time, and a
+    box already overlapping a blocked tile can still move out of it.
+    Returns (new along coordinate, blocked).
+    """
+    if move == 0:
+        return along, False
+    height, width = walkable.shape
+    sign = 1 if move > 0 else -1
+    bias = -EPSILON if sign > 0 else EPSILON  # A leading edge exactly on a tile border is outside the next tile
+    lead = along + sign * half_size
+    first_across = _cell(across - half_size, EPSILON)
+    last_across = _cell(across + half_size, -EPSILON)
+
+    for cell in range(_cell(lead, bias) + sign, _cell(lead + move, bias) + sign, sign):
+        for other in range(first_across, last_across + 1):
+            x, y = (cell, other) if axis == 0 else (other, cell)
+            if not (0 <= x < width and 0 <= y < height and walkable[y, x]):
+                # Stop flush against the tile border
+                return cell - sign * (0.5 + half_size), True
+    return along + move, False
+
+
+def sweep_box(walkable, position, delta, half_size):
+    """Move a square box (center position, half_size in tiles) by delta through a walkable array.
+
+    Axes are resolved one after the other (x then y), so a blocked axis does not stop the
+    other one: the box slides along walls. walkable is the world's [y, x] bool array.
+    Returns ((x, y), (blocked_x, blocked_y)).
+    """
+    x, y = position
+    x, blocked_x = _sweep_axis(walkable, x, y, delta[0], half_size, 0)
+    y, blocked_y = _sweep_axis(walkable, y, x, delta[1], half_size, 1)
+    return (x, y), (blocked_x, blocked_y)
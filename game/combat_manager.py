@@ -43,6 +43,10 @@ class SimpleCombatManager:
         self.player_entity = player_entity
         self.enemy_entity = enemy_entity
         
+        # Les cases des combattants sont réservées : personne ne s'y arrête pendant le combat
+        for entity in (player_entity, enemy_entity):
+            self.world.reserve(entity, [entity.get_grid_position()])
+        
         self.state = CombatState.PLAYER_TURN
         self.is_active = True
         self._create_action_buttons()
@@ -63,6 +67,9 @@ class SimpleCombatManager:
     def _abandon_combat(self):
         print("[COMBAT] Combat abandonné")
         self.is_active = False
+        for entity in (self.player_entity, self.enemy_entity):
+            if entity is not None:
+                self.world.release(entity)
         return "end_combat"
         
     def _create_action_buttons(self):
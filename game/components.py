@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class ComponentStore:
+    """Component arrays for bulk entities (ambient creatures, NPCs).
+
+    Each entity owns one row: grid position, velocity (tiles/second) and the animation clock
+    time its current animation started at live in NumPy arrays, so the per-frame update runs
+    vectorized over every row instead of through one Python method call per entity. Entities
+    read and write their row through properties, so the entity API stays the same.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.count = 0        # High-water mark: rows >= count were never used
+        self.free_rows = []
+        self.time = 0.0  # Simulation time in ms, advanced by the update scheduler
+        self.owners = []
+        self.positions = np.zeros((0, 2), dtype=np.float64)
+        self.previous_positions = np.zeros((0, 2), dtype=np.float64)  # Positions at the previous update (render interpolation)
+        self.velocities = np.zeros((0, 2), dtype=np.float64)
+        self.anim_start = np.zeros(0, dtype=np.float64)
+        self.active = np.zeros(0, dtype=bool)
+        self.tiers = np.zeros(0, dtype=np.int8)           # Update level of detail (game/lod.py), 0 = every step
+        self.last_update = np.zeros(0, dtype=np.float64)  # Simulation time of the row's last update
+        self._grow(max(1, capacity))
+
+    def __len__(self):
+        return self.count - len(self.free_rows)
+
+    def _grow(self, capacity):
+        """Reallocate every array with room for capacity rows"""
+        def resized(array):
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+
+        self.positions = resized(self.positions)
+        self.previous_positions = resized(self.previous_positions)
+        self.velocities = resized(self.velocities)
+        self.anim_start = resized(self.anim_start)
+        self.active = resized(self.active)
+        self.tiers = resized(self.tiers)
+        self.last_update = resized(self.last_update)
+        self.owners.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def add(self, owner, position=(0, 0), anim_start=0.0):
+        """Allocate a row for owner and return its index"""
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow(self.capacity * 2)
+            row = self.count
+            self.count += 1
+        self.owners[row] = owner
+        self.positions[row] = position
+        self.previous_positions[row] = position
+        self.velocities[row] = 0.0
+        self.anim_start[row] = anim_start
+        self.active[row] = True
+        self.tiers[row] = 0  # Updated every step until the scheduler buckets it
+        self.last_update[row] = self.time
+        return row
+
+    def remove(self, row):
+        """Free a row (reused by the next add)"""
+        if 0 <= row < self.count and self.active[row]:
+            self.active[row] = False
+            self.velocities[row] = 0.0
+            self.owners[row] = None
+            self.free_rows.append(row)
+
+    def rows(self):
+        """Indices of the rows in use"""
+        return np.flatnonzero(self.active[:self.count])
+
+    def save_previous_positions(self, rows=None):
+        """Remember the current positions before a simulation step"""
+        if rows is None:
+            self.previous_positions[:self.count] = self.positions[:self.count]
+        else:
+            self.previous_positions[rows] = self.positions[rows]
+    
+    def integrate(self, dt, rows=None):
+        """Move rows with a velocity by dt milliseconds (one dt, or one per row).
+
+        Returns (rows, previous positions) for the rows whose rounded grid cell changed, so the
+        caller can validate the new cells and update its spatial index.
+        """
+        if rows is None:
+            rows = self.rows()
+        dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), (len(rows),))
+        has_velocity = np.any(self.velocities[rows] != 0.0, axis=1)
+        moving, dt = rows[has_velocity], dt[has_velocity]
+        if len(moving) == 0:
+            return moving, np.zeros((0, 2))
+        previous = self.positions[moving].copy()
+        self.positions[moving] += self.velocities[moving] * (dt / 1000.0)[:, None]
+        changed = np.any(np.rint(previous) != np.rint(self.positions[moving]), axis=1)
+        return moving[changed], previous[changed]
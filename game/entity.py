@@ -1,18 +1,30 @@
 import pygame
 import math
-from core.settings import TILE_HEIGHT, grid_to_iso
+import random
+import numpy as np
+from core.settings import TILE_HEIGHT, COLORS
+from core.assets import frame_mask
+from game.components import ComponentStore
+from game.lod import UpdateScheduler
+from game.pathfinding import PathPlanner
+
+
+def sprite_origin(frame, screen_x, screen_y):
+    """Top-left corner of a frame drawn on a screen position: centered, bottom on the tile's bottom"""
+    return screen_x - frame.get_width() // 2, screen_y - frame.get_height() + TILE_HEIGHT
+
 
 class Entity:
     """Unified Entity with reliable position system"""
     
+    # No per-instance __dict__: entities can exist by the thousand
+    __slots__ = ("grid_pos", "name", "is_moving", "current_hp", "max_hp", "world", "frame_masks")
+    
     def __init__(self, grid_pos, name):
-        # REAL grid coordinates (0-32, matching tile array indices)
-        self.grid_pos = [int(round(grid_pos[0])), int(round(grid_pos[1]))]
         self.name = str(name)
         
-        # Ensure coordinates are within map bounds
-        self.grid_pos[0] = max(0, min(32, self.grid_pos[0]))
-        self.grid_pos[1] = max(0, min(32, self.grid_pos[1]))
+        # REAL grid coordinates (matching tile array indices)
+        self.grid_pos = [int(round(grid_pos[0])), int(round(grid_pos[1]))]
         
         # Movement system (simplified)
         self.is_moving = False
@@ -24,6 +36,9 @@ class Entity:
         # World reference (set during registration)
         self.world = None
         
+        # Collision masks by frame surface (filled by load_frames, completed lazily)
+        self.frame_masks = {}
+        
         print(f"[ENTITY] {self.name} initialized at REAL grid {tuple(self.grid_pos)}")
         
     def get_grid_position(self):
@@ -34,15 +49,23 @@ class Entity:
         """Get current position - override in subclasses for smooth movement"""
         return self.get_grid_position()
     
-    def get_screen_position(self, camera_offset=(0, 0)):
-        """Get reliable screen position using world transformation"""
+    def get_render_position(self, alpha):
+        """Position to draw alpha (0-1) of the way from the previous simulation step to the current one"""
+        return self.get_position()
+    
+    def get_screen_position(self, camera_offset=(0, 0), alpha=None):
+        """Get reliable screen position using world transformation (interpolated if alpha is given)"""
         if not self.world:
             return (0, 0)
         
-        pos = self.get_position()
+        pos = self.get_position() if alpha is None else self.get_render_position(alpha)
         screen_x, screen_y = self.world.get_screen_position(pos[0], pos[1], camera_offset)
         return (int(screen_x), int(screen_y))
     
+    def get_draw_position(self, frame, camera_offset=(0, 0), alpha=None):
+        """Top-left corner where frame is drawn (see sprite_origin), interpolated if alpha is given"""
+        return sprite_origin(frame, *self.get_screen_position(camera_offset, alpha))
+    
     def move_to(self, x, y):
         """Reliable movement to grid position"""
         target_x, target_y = int(round(x)), int(round(y))
@@ -55,9 +78,30 @@ class Entity:
         # Update position
         old_pos = tuple(self.grid_pos)
         self.grid_pos = [target_x, target_y]
+        if self.world:
+            self.world.entity_moved(self)
         print(f"[ENTITY] {self.name} moved from {old_pos} to {tuple(self.grid_pos)}")
         return True
     
+    def unstick(self):
+        """Move onto the closest walkable tile if the current one is not walkable"""
+        if not self.world:
+            return False
+        x, y = self.get_grid_position()
+        if self.world.is_valid_position(x, y):
+            return False
+        nearest = self.world.find_nearest_walkable(x, y)
+        if nearest is None:
+            return False
+        print(f"[ENTITY] {self.name} unstuck from ({x}, {y}) to {nearest}")
+        return self.move_to(*nearest)
+    
+    def path_to(self, x, y):
+        """Walkable cells from this entity to (x, y), both included, or None if unreachable"""
+        if not self.world:
+            return None
+        return self.world.find_path(self.get_grid_position(), (int(round(x)), int(round(y))), self)
+    
     def register_to_world(self, world):
         """Register with world"""
         self.world = world
@@ -94,15 +138,19 @@ class Entity:
         """Basic update - override in subclasses"""
         pass
     
-    def draw(self, screen, camera_offset=(0, 0)):
+    def get_frame_mask(self, frame):
+        """Collision mask of a frame, computed once per frame surface"""
+        mask = self.frame_masks.get(frame)
+        if mask is None:
+            mask = frame_mask(frame)
+            self.frame_masks[frame] = mask
+        return mask
+    
+    def draw(self, screen, camera_offset=(0, 0), alpha=None):
         """Simple draw using world screen position"""
-        screen_x, screen_y = self.get_screen_position(camera_offset)
         frame = self.get_current_frame()
         if frame:
-            # Simple center-bottom anchoring
-            draw_x = screen_x - frame.get_width() // 2
-            draw_y = screen_y - frame.get_height() + TILE_HEIGHT
-            screen.blit(frame, (draw_x, draw_y))
+            screen.blit(frame, self.get_draw_position(frame, camera_offset, alpha))
     
     # Combat methods
     @property
@@ -120,48 +168,200 @@ class Entity:
 class PNJManager(Entity):
     """Simplified NPC management"""
     
+    PATH_BLOCKED_MS = 1500  # How long a path follower waits for a held tile before dropping its path
+    
     def __init__(self, world):
         self.world = world
         self.active_npcs = []
+        self.components = ComponentStore()  # Positions, velocities, animation timers of every NPC
+        self.scheduler = UpdateScheduler()  # Update rate of each NPC by distance to the view
+        self.max_frame_size = (0, 0)  # Largest NPC sprite, bounds the click search area
+        self.hovered_npc = None
+        self.outlines = {}  # mask -> outline point lists, relative to the frame
+        self.paths = {}  # npc -> [remaining waypoints, speed] for NPCs walking to a target
+        self.chasers = {}  # npc -> speed for NPCs following the distance field toward chase_target
+        self.chase_target = None
+        self.planner = PathPlanner(world)  # Path requests of patrols / wanderers, solved within a per-frame budget
+        self.behaving = []  # NPCs with a movement behavior
+        self.rng = random.Random()
         print("[PNJ_MGR] UNIFIED: PNJ Manager initialized")
 
+    @staticmethod
+    def get_npc_definitions():
+        """NPC definitions by spawn name (data/pnj/definitions.json)"""
+        from game.pnj import load_pnj_definitions
+        return load_pnj_definitions()
+
+    @classmethod
+    def get_preload_paths(cls):
+        """Sprite sheets loaded by spawn_npcs (for the asset preload pipeline, busts load on demand)"""
+        return [definition.sprite_path for definition in cls.get_npc_definitions().values()]
+
     def spawn_npcs(self):
-        """Spawn all NPCs using Character-compatible coordinate system"""
-        from game.pnj.dame_indenta import DameIndenta
-        from game.pnj.neuill import Neuill
-        from game.pnj.json import JSON
-        from game.pnj.loopfang import Loopfang
-        
-        npc_classes = {"DameIndenta": DameIndenta, "Neuill": Neuill, "JSON": JSON, "Loopfang": Loopfang}
+        """Spawn one NPC per definition, at its data-defined spawn or the world spawn point"""
+        from game.pnj import PNJ
         self.active_npcs = []
         
-        # Use Character-compatible spawn positions (same logic as Character movement)
-        character_compatible_spawns = {
-            "DameIndenta": (12, 20),    # Sud-ouest du centre (Character logic) 
-            "Neuill": (16, 12),         # Nord du centre (visible sur screenshot)  
-            "JSON": (12, 16),           # Ouest du centre
-            "Loopfang": (20, 16),       # Est du centre
-        }
-        
-        for name, cls in npc_classes.items():
-            # Use Character-compatible position if available
-            if name in character_compatible_spawns:
-                spawn_pos = character_compatible_spawns[name]
-                print(f"[PNJ_MGR] Using Character-compatible spawn for {name}: {spawn_pos}")
+        for name, definition in self.get_npc_definitions().items():
+            if definition.map != self.world.map.name:
+                continue
+            if definition.spawn:
+                spawn_pos = definition.spawn
             else:
                 try:
                     spawn_pos = self.world.get_spawn_position(name)
                 except ValueError:
-                    spawn_pos = (16, 16)  # Default to center
+                    spawn_pos = tuple(int(round(c)) for c in self.world.map.center)  # Default to center
                     print(f"[PNJ_MGR] WARNING: No spawn for {name}, using center")
             
-            npc = cls(list(spawn_pos))
-            npc.name = name
-            npc.register_to_world(self.world)
-            self.active_npcs.append(npc)
+            npc = self.add_npc(definition, spawn_pos)
             print(f"[PNJ_MGR] Spawned {name} at {tuple(npc.grid_pos)}")
         
-        print(f"[PNJ_MGR] All {len(self.active_npcs)} NPCs spawned with Character-compatible axes")
+        print(f"[PNJ_MGR] All {len(self.active_npcs)} NPCs spawned from definitions")
+
+    def despawn_npcs(self):
+        """Remove every NPC (map change)"""
+        for npc in list(self.active_npcs):
+            self.remove_npc(npc)
+
+    def add_npc(self, definition, grid_pos, name=None):
+        """Create an NPC backed by the manager's component arrays and register it"""
+        from game.pnj import PNJ
+        from game.pnj.behavior import create_behavior
+        if not self.world.is_valid_position(*grid_pos):
+            grid_pos = self.world.find_nearest_walkable(*grid_pos) or grid_pos
+        npc = PNJ(definition, list(grid_pos), name, store=self.components)
+        npc.register_to_world(self.world)
+        npc.behavior = create_behavior(definition.behavior, self, npc.get_grid_position())
+        if npc.behavior:
+            self.behaving.append(npc)
+        self.active_npcs.append(npc)
+        self._update_max_frame_size(npc)
+        return npc
+
+    def spawn_ambient(self, name, count, speed=0.5, seed=None):
+        """Spawn count wandering creatures of a definition on random walkable tiles.
+        
+        Creatures drift in a random direction, unless the definition has its own behavior.
+        """
+        definition = self.get_npc_definitions()[name]
+        rng = random.Random(seed)
+        walkable = [(int(x), int(y)) for y, x in np.argwhere(self.world.walkable)]
+        free = [pos for pos in walkable if self.world.is_free(*pos)]
+        creatures = []
+        for i in range(count):
+            # One creature per tile while there is room, stacked afterwards
+            pos = free.pop(rng.randrange(len(free))) if free else rng.choice(walkable)
+            npc = self.add_npc(definition, pos, f"{name}_{i}")
+            if npc.behavior:
+                creatures.append(npc)
+                continue
+            angle = rng.uniform(0, 2 * math.pi)
+            npc.velocity = (speed * math.cos(angle), speed * math.sin(angle))
+            creatures.append(npc)
+        print(f"[PNJ_MGR] {count} ambient {name} spawned")
+        return creatures
+
+    def remove_npc(self, npc):
+        """Despawn an NPC: world index, component row and assets"""
+        if npc in self.active_npcs:
+            self.active_npcs.remove(npc)
+        self.world.unregister_entity(npc)
+        if npc.store is self.components:
+            self.components.remove(npc.row)
+        npc.release_assets()
+        if self.hovered_npc is npc:
+            self.hovered_npc = None
+        self.paths.pop(npc, None)
+        self.chasers.pop(npc, None)
+        self.planner.cancel(npc)
+        if npc in self.behaving:
+            self.behaving.remove(npc)
+    
+    def send_npc_to(self, npc, x, y, speed=2.0):
+        """Walk an NPC to (x, y) along the shortest path; False if it cannot get there"""
+        path = npc.path_to(x, y)
+        if path is None:
+            print(f"[PNJ_MGR] No path for {npc.name} to ({x}, {y})")
+            return False
+        self.follow_path(npc, path, speed)
+        return True
+    
+    def follow_path(self, npc, path, speed=2.0):
+        """Walk an NPC along a list of cells (the first one is where it stands)"""
+        self.paths[npc] = [list(path[1:]), speed, 0.0]
+    
+    def is_following_path(self, npc):
+        return npc in self.paths
+    
+    def chase(self, npcs, target, speed=1.5):
+        """Send NPCs after a target entity; they share one distance field instead of one path each"""
+        self.chase_target = target
+        for npc in npcs:
+            if self.paths.pop(npc, None) is not None:
+                self.world.release(npc)
+            self.chasers[npc] = speed
+    
+    def stop_chasing(self, npcs=None):
+        """Stop the given NPCs (all chasers by default)"""
+        for npc in list(self.chasers) if npcs is None else npcs:
+            if self.chasers.pop(npc, None) is not None:
+                npc.velocity = (0.0, 0.0)
+        if not self.chasers:
+            self.chase_target = None
+    
+    def _steer_chasers(self, row_dt):
+        """Point every chaser updated this step at the next cell of the distance field, all rows at once"""
+        chasers = [(npc, speed) for npc, speed in self.chasers.items() if npc.row in row_dt]
+        if not chasers:
+            return
+        field = self.world.distance_field(self.chase_target.get_grid_position())
+        components = self.components
+        rows = [npc.row for npc, speed in chasers]
+        speeds = np.array([speed for npc, speed in chasers], dtype=np.float64)
+        positions = components.positions[rows]
+        
+        next_cells = field.next_cells(positions)
+        delta = next_cells - positions
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        # Stop on the goal cell (next cell is where we stand), where the goal is unreachable
+        # and behind a tile held by another entity
+        moving = (next_cells[:, 0] >= 0) & (distance > 0.05)
+        moving &= ~self.world.occupancy.held_by_others(next_cells, [npc for npc, speed in chasers])
+        scale = np.where(moving, speeds / np.maximum(distance, 1e-9), 0.0)
+        components.velocities[rows] = delta * scale[:, None]
+    
+    def _steer_along_paths(self, row_dt):
+        """Point the velocity of path-following NPCs updated this step at their next waypoint"""
+        for npc, entry in list(self.paths.items()):
+            dt = row_dt.get(npc.row)
+            if dt is None:
+                continue
+            waypoints, speed = entry[0], entry[1]
+            x, y = npc.get_position()
+            step = speed * dt / 1000.0
+            while waypoints:
+                dx, dy = waypoints[0][0] - x, waypoints[0][1] - y
+                distance = math.hypot(dx, dy)
+                if distance > step:
+                    if self.world.reserve(npc, [waypoints[0]]):
+                        entry[2] = 0.0
+                        npc.velocity = (speed * dx / distance, speed * dy / distance)
+                        break
+                    # Next tile held by another entity: wait, then give up on the path
+                    npc.velocity = (0.0, 0.0)
+                    entry[2] += dt
+                    if entry[2] >= self.PATH_BLOCKED_MS:
+                        self.world.release(npc)
+                        del self.paths[npc]
+                    break
+                waypoints.pop(0)
+            else:
+                # Arrived: snap onto the target tile and stop
+                npc.velocity = (0.0, 0.0)
+                npc.grid_pos = npc.get_grid_position()
+                self.world.release(npc)
+                del self.paths[npc]
 
     def get_active_npcs(self):
         """Get active NPCs (spawn if empty)"""
@@ -170,48 +370,163 @@ class PNJManager(Entity):
             self.spawn_npcs()
         return self.active_npcs
 
+    def set_view(self, camera_offset, screen_size):
+        """Grid bounds of the screen, for the update scheduler (same camera_offset as draw)"""
+        width, height = screen_size
+        corners = [self.world.screen_to_grid(x, y, camera_offset) for x, y in
+                   ((0, 0), (width, 0), (0, height), (width, height))]
+        xs, ys = [x for x, y in corners], [y for x, y in corners]
+        self.scheduler.set_view(min(xs), min(ys), max(xs), max(ys))
+    
     def update(self, dt):
-        """UNIFIED: Update all active NPCs with movement and animation"""
-        for npc in self.active_npcs:
-            # Use unified update method that handles both movement and animation
-            if hasattr(npc, 'update'):
-                npc.update(dt)
-                
-                # Log active NPC movement
-                if hasattr(npc, 'is_moving') and npc.is_moving:
-                    print(f"[PNJ_MGR] {npc.name} moving: progress {npc.movement_progress:.2f}")
-            elif hasattr(npc, 'update_animation'):
-                print(f"[PNJ_MGR] WARNING: {npc.name} using legacy update_animation method")
-                npc.update_animation(dt)
-    
-    def draw(self, screen, camera_offset=(0, 0)):
-        """Draw all NPCs using unified positioning"""
-        for npc in self.active_npcs:
-            npc.draw(screen, camera_offset)
+        """Move the NPCs due this step on the component arrays (frames come from the animation clock).
+        
+        The scheduler picks the rows: visible NPCs every step, near offscreen ones every few
+        steps with the time accumulated since, far ones not at all.
+        """
+        components = self.components
+        rows, row_dt = self.scheduler.due(components, dt)
+        components.save_previous_positions(rows)
+        if self.paths or self.chasers or self.behaving:
+            due = dict(zip(rows.tolist(), row_dt.tolist()))
+            for npc in self.behaving:
+                if npc.row in due:
+                    npc.update_movement(due[npc.row])
+            if self.paths:
+                self._steer_along_paths(due)
+            if self.chasers and self.chase_target is not None:
+                self._steer_chasers(due)
+        
+        # Only rows that changed tile go back to Python: walkability check and spatial index
+        moved, previous = components.integrate(row_dt, rows)
+        for row, old_pos in zip(moved.tolist(), previous):
+            npc = components.owners[row]
+            x, y = npc.grid_pos
+            if self.world.is_free(x, y, npc):
+                self.world.entity_moved(npc)
+            else:
+                # Wall or tile held by another entity: stay on the previous tile and turn back
+                components.positions[row] = old_pos
+                components.velocities[row] *= -1
     
-    def handle_click(self, pixel_x, pixel_y):
-        """Simplified sprite-based click detection"""
-        for npc in self.active_npcs:
-            if self._is_npc_clicked(npc, pixel_x, pixel_y):
-                print(f"[PNJ_MGR] Clicked: {npc.name}")
-                if hasattr(npc, 'interact') and hasattr(self.world, 'session'):
-                    npc.interact(self.world.session)
-                else:
-                    npc.speak()
+    def draw(self, screen, camera_offset=(0, 0), alpha=None):
+        """Draw all NPCs in one blits call, screen positions computed for all of them at once"""
+        if not self.active_npcs:
+            return
+        if self.hovered_npc in self.active_npcs:
+            self._draw_outline(screen, self.hovered_npc, camera_offset, alpha)
+        
+        screen_positions = self._screen_positions(self.active_npcs, camera_offset, alpha)
+        
+        # Skip NPCs whose largest possible sprite is off screen
+        max_w, max_h = self.max_frame_size
+        screen_w, screen_h = screen.get_size()
+        xs, ys = screen_positions[:, 0], screen_positions[:, 1]
+        visible = (xs + max_w // 2 >= 0) & (xs - max_w // 2 < screen_w) & (ys + TILE_HEIGHT >= 0) & (ys - max_h < screen_h)
+        
+        blits = []
+        for i in np.flatnonzero(visible).tolist():
+            npc = self.active_npcs[i]
+            screen_x, screen_y = screen_positions[i].tolist()
+            frame = npc.get_current_frame()
+            if frame:
+                blits.append((frame, sprite_origin(frame, screen_x, screen_y)))
+        screen.blits(blits, doreturn=False)
+    
+    def _screen_positions(self, npcs, camera_offset=(0, 0), alpha=None):
+        """(N, 2) screen positions of NPCs, computed at once from the component rows"""
+        rows = [npc.row for npc in npcs]
+        positions = self.components.positions[rows]
+        if alpha is not None:
+            # Between two fixed simulation steps: interpolate from the previous positions
+            previous = self.components.previous_positions[rows]
+            positions = previous + (positions - previous) * alpha
+        return self.world.get_screen_positions(positions, camera_offset)
+    
+    def _get_outline(self, mask):
+        """Outline of each opaque region of a mask, computed once per mask"""
+        outline = self.outlines.get(mask)
+        if outline is None:
+            outline = [points for points in (component.outline() for component in mask.connected_components())
+                       if len(points) > 1]
+            self.outlines[mask] = outline
+        return outline
+    
+    def _draw_outline(self, screen, npc, camera_offset, alpha=None):
+        """Hover highlight, drawn under the sprite so only the border shows"""
+        frame = self._get_npc_frame(npc)
+        if not frame:
+            return
+        draw_x, draw_y = npc.get_draw_position(frame, camera_offset, alpha)
+        for points in self._get_outline(npc.get_frame_mask(frame)):
+            pygame.draw.lines(screen, COLORS['text_highlight'], True,
+                              [(draw_x + x, draw_y + y) for x, y in points], 3)
+    
+    def _update_max_frame_size(self, npc):
+        frames = getattr(npc, 'frames', None) or []
+        max_w, max_h = self.max_frame_size
+        for frame in frames:
+            max_w, max_h = max(max_w, frame.get_width()), max(max_h, frame.get_height())
+        self.max_frame_size = (max_w, max_h)
+    
+    def _get_click_candidates(self, pixel_x, pixel_y, alpha=None):
+        """(NPC, screen position) pairs whose sprite could cover the pixel, front-most first"""
+        max_w, max_h = self.max_frame_size
+        # Sprites are drawn by sprite_origin: the screen position lies between TILE_HEIGHT
+        # above the pixel and max_h below it
+        corners = [(pixel_x - max_w / 2, pixel_y - TILE_HEIGHT), (pixel_x + max_w / 2, pixel_y - TILE_HEIGHT),
+                   (pixel_x - max_w / 2, pixel_y + max_h), (pixel_x + max_w / 2, pixel_y + max_h)]
+        grid_corners = [self.world.screen_to_grid(x, y) for x, y in corners]
+        xs = [x for x, _ in grid_corners]
+        ys = [y for _, y in grid_corners]
+        # One tile of margin for rounding of the grid positions
+        candidates = self.world.entities_in_rect(math.floor(min(xs)) - 1, math.floor(min(ys)) - 1,
+                                                 math.ceil(max(xs)) + 1, math.ceil(max(ys)) + 1)
+        active = set(self.active_npcs)
+        npcs = [e for e in candidates if e in active]
+        if not npcs:
+            return []
+        screen_positions = self._screen_positions(npcs, alpha=alpha)
+        xs, ys = screen_positions[:, 0], screen_positions[:, 1]
+        # Exact spatial bound: the largest sprite drawn there must cover the pixel
+        near = ((np.abs(xs - pixel_x) <= max_w // 2 + 1) & (ys + TILE_HEIGHT > pixel_y)
+                & (ys + TILE_HEIGHT - max_h <= pixel_y))
+        # Drawn lowest on screen last, so it is on top
+        order = [i for i in np.argsort(-ys, kind="stable").tolist() if near[i]]
+        return [(npcs[i], tuple(screen_positions[i].tolist())) for i in order]
+    
+    def pick(self, pixel_x, pixel_y, alpha=None):
+        """Front-most NPC whose sprite covers the pixel (world pixel, camera removed), or None"""
+        for npc, screen_pos in self._get_click_candidates(pixel_x, pixel_y, alpha):
+            if self._is_npc_clicked(npc, pixel_x, pixel_y, screen_pos):
                 return npc
         return None
     
-    def _is_npc_clicked(self, npc, pixel_x, pixel_y):
+    def update_hover(self, pixel_x, pixel_y, alpha=None):
+        """Track the NPC under the cursor for the hover outline (alpha as passed to draw)"""
+        self.hovered_npc = self.pick(pixel_x, pixel_y, alpha)
+        return self.hovered_npc
+    
+    def handle_click(self, pixel_x, pixel_y):
+        """Sprite-based click detection on the NPCs near the click"""
+        npc = self.pick(pixel_x, pixel_y)
+        if npc:
+            print(f"[PNJ_MGR] Clicked: {npc.name}")
+            if hasattr(npc, 'interact') and hasattr(self.world, 'session'):
+                npc.interact(self.world.session)
+            else:
+                npc.speak()
+        return npc
+    
+    def _is_npc_clicked(self, npc, pixel_x, pixel_y, screen_pos=None):
         """Check if NPC sprite is clicked (excluding transparent pixels)"""
-        screen_pos = npc.get_screen_position()
         frame = self._get_npc_frame(npc)
-        
         if not frame:
             return False
         
-        # Calculate sprite position (center-bottom anchored)
-        draw_x = screen_pos[0] - frame.get_width() // 2
-        draw_y = screen_pos[1] - frame.get_height() + 16
+        if screen_pos is None:
+            screen_pos = npc.get_screen_position()
+        draw_x, draw_y = sprite_origin(frame, *screen_pos)
         
         # Check if click is within sprite bounds
         rel_x = pixel_x - draw_x
@@ -220,15 +535,8 @@ class PNJManager(Entity):
         if not (0 <= rel_x < frame.get_width() and 0 <= rel_y < frame.get_height()):
             return False
         
-        # Check for transparent pixel (if frame has alpha)
-        if frame.get_bitsize() == 32:
-            try:
-                pixel_alpha = frame.get_at((rel_x, rel_y)).a
-                return pixel_alpha > 0  # Non-transparent pixel
-            except:
-                return True  # Fallback to true if pixel check fails
-        
-        return True  # No alpha channel, accept click
+        # Transparent pixels are not part of the sprite (opaque frames have a full mask)
+        return bool(npc.get_frame_mask(frame).get_at((rel_x, rel_y)))
     
     def _get_npc_frame(self, npc):
         """Get NPC frame with fallback"""
@@ -249,7 +557,7 @@ class PNJManager(Entity):
         print("[PNJ_MGR] === NPC POSITION DEBUG ===")
         for npc in self.active_npcs:
             screen_pos = npc.get_screen_position()
-            print(f"[PNJ_MGR] UNIFIED: {npc.name} - grid: {tuple(npc.grid_pos)}, float: {tuple(npc.float_pos)}, screen: {screen_pos}, moving: {getattr(npc, 'is_moving', False)}")
+            print(f"[PNJ_MGR] UNIFIED: {npc.name} - grid: {tuple(npc.grid_pos)}, float: {tuple(npc.get_position())}, screen: {screen_pos}, moving: {getattr(npc, 'is_moving', False)}")
         print("[PNJ_MGR] === END NPC DEBUG ===")
     
     def test_npc_movement(self):
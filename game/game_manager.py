@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 import pygame
 from enum import Enum
@@ -6,14 +7,18 @@ from ui.main_menu import MainMenu
 from ui.character_creator import CharacterCreator
 from ui.interaction import InteractionUI
 from ui.quest_table import QuestTable
-from ui.uitools import QuestButton
+from ui.uitools import QuestButton, preload_with_loading_screen, draw_loading_screen
 from core.session import SessionManager
-from core.settings import get_player_data_path
+from core.settings import get_player_data_path, get_player_bust_path, FPS, CLAIRIERE_MAP, PORTAL_PRELOAD_RADIUS
+from core.assets import AssetManager
 from game.world import World
 from game.character import Character
 from game.camera import Camera
 from game.entity import PNJManager
 from game.combat_manager import SimpleCombatManager
+from game.animation import AnimationController
+from game.timestep import FixedTimestep
+from game.maps import map_path
 
 class GameState(Enum):
     MENU = "menu"
@@ -36,6 +41,8 @@ class GameManager:
         self.state = GameState.MENU
         self.running = True
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()  # Logique à pas fixe, affichage interpolé
+        self.last_cell = None  # Case du joueur à l'image précédente (entrée dans un portail)
         
         self.world = None
         self.character = None
@@ -76,9 +83,24 @@ class GameManager:
                 session.load_data()
             self.state = GameState.MENU
 
+    def preload_exploration_assets(self, start_map):
+        """Décode en parallèle les images de l'exploration (carte de départ incluse) derrière un écran de chargement"""
+        session = self.get_current_session()
+        paths = World.get_preload_paths(start_map) + PNJManager.get_preload_paths()
+        if session:
+            paths.append(session.data.get("sprite_path", session.sprite_path))
+            paths.append(get_player_bust_path(session.name))
+        handles = preload_with_loading_screen(self.screen, paths, "Chargement de la carte...")
+        print(f"[GM] {len(handles)} images préchargées")
+        return handles
+
     def initialize_world(self):
         if self.world is None:
-            self.world = World(self.screen)
+            # Même carte pour le préchargement et le monde (celle de la session)
+            start_map = self.get_start_map()
+            preload_handles = self.preload_exploration_assets(start_map)
+            draw_loading_screen(self.screen, 1.0, "Préparation du monde...")
+            self.world = World(self.screen, start_map)
             self.world.session = self.session
             self.npc_manager = PNJManager(self.world)
             self.npc_manager.spawn_npcs()
@@ -89,8 +111,39 @@ class GameManager:
                     self.screen.get_height(), 
                     session=self.session
                 )
+            if self.character is None:
+                session = self.get_current_session()
+                if session:
+                    self.character = Character(session, self.world)
+            
+            # Le monde, les PNJ et le personnage tiennent maintenant leurs propres références
+            for handle in preload_handles:
+                handle.release()
         return self.world
 
+    def get_start_map(self):
+        """Carte enregistrée dans la session (la clairière si elle n'existe pas)"""
+        session = self.get_current_session()
+        path = map_path(session.data.get("current_map", "clairiere")) if session else CLAIRIERE_MAP
+        return path if os.path.exists(path) else CLAIRIERE_MAP
+
+    def change_map(self, portal):
+        """Passage par un portail : la carte vient du cache (préchargée à l'approche du portail)"""
+        world, character = self.world, self.character
+        if self.npc_manager:
+            self.npc_manager.despawn_npcs()
+        world.change_map(portal.target_map)
+        character.path = []
+        target = world.map.to_grid(*portal.target)
+        character.move_to(*(world.find_nearest_walkable(*target) or target))
+        self.last_cell = character.get_grid_position()
+        if self.npc_manager:
+            self.npc_manager.spawn_npcs()
+        if self.session:
+            self.session.update_grid_position(*self.last_cell, map_name=world.map.name)
+        self.timestep.reset()
+        print(f"[GM] Arrivée sur {world.map.name} en {self.last_cell}")
+
     def initialize_character(self):
         if self.character is None:
             session = self.get_current_session()
@@ -118,9 +171,11 @@ class GameManager:
         quest_button = self.initialize_quest_button()
 
         exploring = True
+        self.timestep.reset()
+        self.last_cell = character.get_grid_position()
 
         while exploring:
-            dt = self.clock.tick(60)
+            dt = self.clock.tick(FPS)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -133,6 +188,11 @@ class GameManager:
                     elif event.key == pygame.K_F1:
                         # Debug: print entity positions
                         world.print_entity_positions()
+                        AssetManager.get_instance().log_stats()
+                        if self.npc_manager:
+                            self.npc_manager.planner.log_stats()
+                        world.maps.log_stats()
+                        world.log_draw_stats()
                 
                 # Gestion du bouton de quête
                 quest_result = self.handle_quest_button_event(event)
@@ -149,27 +209,60 @@ class GameManager:
                             clicked_npc = self.npc_manager.handle_click(world_x, world_y)
                             if clicked_npc:
                                 self.interaction_ui.start_interaction(character, clicked_npc, self.session)
+                                self.npc_manager.hovered_npc = None
                                 self.state = GameState.INTERACTION
                                 exploring = False
+                                continue
+                        # Clic au sol : déplacement jusqu'à la case visée
+                        grid_x, grid_y = world.screen_to_grid(mouse_x, mouse_y, (camera.x, camera.y))
+                        character.move_towards(grid_x, grid_y)
 
+            # Horloge d'animation partagée par tous les personnages
+            AnimationController.get_instance().tick(dt)
+            
             keys = pygame.key.get_pressed()
             character.handle_input(keys)
-            character.update(dt)
-            camera.center_on_character(character)
+            
+            # Simulation à pas fixe : le nombre de pas dépend du temps écoulé, pas du framerate
+            if self.npc_manager:
+                self.npc_manager.set_view((camera.x, camera.y), self.screen.get_size())
+            step_ms = self.timestep.step_ms
+            for _ in range(self.timestep.advance(dt)):
+                character.update(step_ms)
+                if self.npc_manager:
+                    self.npc_manager.update(step_ms)
+            if self.npc_manager:
+                # Chemins des patrouilles : au plus un budget de quelques ms par image
+                self.npc_manager.planner.process()
+            
+            # Portails : cartes voisines préchargées à l'approche, changement à l'entrée
+            cell = character.get_grid_position()
+            world.maps.preload_near(world.map, cell, PORTAL_PRELOAD_RADIUS)
+            if cell != self.last_cell:
+                self.last_cell = cell
+                portal = world.portal_at(*cell)
+                if portal:
+                    self.change_map(portal)
+            
+            # Rendu interpolé entre les deux derniers pas
+            alpha = self.timestep.alpha
+            camera.center_on_character(character, alpha)
 
             if self.npc_manager:
-                self.npc_manager.update(dt)
+                # Contour du PNJ sous le curseur
+                mouse_x, mouse_y = pygame.mouse.get_pos()
+                self.npc_manager.update_hover(mouse_x - camera.x, mouse_y - camera.y, alpha)
 
             # Met à jour le bouton de quête
             quest_button.update()
 
             self.screen.fill((20, 30, 40))
             world.draw(self.screen, (camera.x, camera.y))
-            character.draw(self.screen, camera)
+            character.draw(self.screen, camera, alpha)
             
             if self.npc_manager:
                 camera_offset = (camera.x, camera.y)
-                self.npc_manager.draw(self.screen, camera_offset)
+                self.npc_manager.draw(self.screen, camera_offset, alpha)
             
             # Dessine le bouton de quête
             quest_button.draw(self.screen)
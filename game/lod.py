@@ -0,0 +1,75 @@
+import numpy as np
+
+VISIBLE, NEAR, DORMANT = 0, 1, 2
+
+
+class UpdateScheduler:
+    """Level-of-detail update rates for the rows of a ComponentStore.
+
+    Rows are bucketed by their grid distance to the camera view: visible rows are simulated
+    every step, near offscreen rows every near_interval steps (staggered by row, with the
+    time accumulated since their last update), dormant rows not at all until the view comes
+    back near them. Bucketing is incremental: each step re-buckets one slice of the rows.
+    Without a view every row is visible, i.e. simulated every step.
+    """
+
+    def __init__(self, visible_margin=2, near_margin=12, near_interval=4, rebucket_slices=4):
+        self.visible_margin = visible_margin  # Tiles around the view still updated at full rate (sprite overhang)
+        self.near_margin = near_margin        # Tiles around the view updated at reduced rate
+        self.near_interval = near_interval
+        self.rebucket_slices = rebucket_slices
+        self.view = None  # (min_x, min_y, max_x, max_y) grid bounds of the screen
+        self.steps = 0
+        self.cursor = 0
+
+    def set_view(self, min_x, min_y, max_x, max_y):
+        self.view = (min_x, min_y, max_x, max_y)
+
+    def tiers_of(self, positions):
+        """Tier of each (x, y) position by its Chebyshev distance to the view rectangle"""
+        if self.view is None:
+            return np.full(len(positions), VISIBLE, dtype=np.int8)
+        min_x, min_y, max_x, max_y = self.view
+        x, y = positions[:, 0], positions[:, 1]
+        distance = np.maximum.reduce([min_x - x, x - max_x, min_y - y, y - max_y, np.zeros_like(x)])
+        return np.where(distance <= self.visible_margin, VISIBLE,
+                        np.where(distance <= self.near_margin, NEAR, DORMANT)).astype(np.int8)
+
+    def _rebucket(self, store, step_ms):
+        """Re-tier the next slice of rows"""
+        count = store.count
+        if not count:
+            return
+        size = max(64, -(-count // self.rebucket_slices))
+        start = self.cursor if self.cursor < count else 0
+        end = min(count, start + size)
+        self.cursor = end
+
+        tiers = self.tiers_of(store.positions[start:end])
+        previous = store.tiers[start:end]
+        # Waking rows resume from now: dormancy is not caught up
+        woken = (previous == DORMANT) & (tiers != DORMANT)
+        store.last_update[start:end][woken] = store.time - step_ms
+        store.tiers[start:end] = tiers
+
+    def due(self, store, step_ms):
+        """Advance one step; return (rows to simulate now, dt of each of those rows in ms)"""
+        store.time += step_ms
+        self.steps += 1
+        self._rebucket(store, step_ms)
+
+        count = store.count
+        tiers = store.tiers[:count]
+        indices = np.arange(count)
+        due = store.active[:count] & ((tiers == VISIBLE) |
+                                     ((tiers == NEAR) & ((indices + self.steps) % self.near_interval == 0)))
+        rows = np.flatnonzero(due)
+        row_dt = store.time - store.last_update[rows]
+        store.last_update[rows] = store.time
+        return rows, row_dt
+
+    def counts(self, store):
+        """Number of active rows per tier (diagnostics)"""
+        tiers = store.tiers[:store.count][store.active[:store.count]]
+        return {name: int(np.count_nonzero(tiers == tier))
+                for name, tier in (("visible", VISIBLE), ("near", NEAR), ("dormant", DORMANT))}
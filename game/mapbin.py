@@ -0,0 +1,209 @@
+# === game/mapbin.py ===
+"""Compiled maps: a Tiled JSON map converted once into a binary file opened with np.memmap.
+
+Format (little-endian integers):
+    header : magic b"PMMP", version (u32), source size (u64), source mtime (u64, ns),
+             meta length (u32), number of arrays (u32)
+    meta   : UTF-8 JSON of the small data (size, origin, portals, the Tiled map without its
+             tile data, for the tilesets)
+    index  : per array, name length (u16), UTF-8 name, dtype (4 bytes, e.g. b"<u2 "),
+             ndim (u8), shape (3 x u32), offset (u64)
+    data   : the arrays, each aligned on 16 bytes
+
+Arrays: "layer/<i>" gids of each tile layer ([h, w] uint16, uint32 when a gid does not fit),
+"walkable" and "blocks_sight" (packed bits of [h, w] arrays), "nearest_walkable" ([h, w, 2]
+int32, closest walkable cell of every cell, used to place spawns) and "tile/<name>" (per-gid
+tile property tables). Loading reads the header, the meta and the index; the arrays are
+views on the mapped file, paged in when first read.
+
+A compiled file records the size and modification time of its JSON source, and the version of
+each .tsx tileset it read properties from: once one of them changes it is stale, the JSON is
+parsed again and the file rewritten.
+
+    python -m game.mapbin build [maps...]   compile maps (every map of data/map by default)
+    python -m game.mapbin status            list maps without an up-to-date compiled file
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+from core.settings import MAP_DIR, MAP_BIN_DIR
+from core.assets import AssetManager
+
+MAGIC = b"PMMP"
+VERSION = 2
+_HEADER = struct.Struct("<4sIQQII")
+_ENTRY = struct.Struct("<4sB3IQ")
+_NAME_LEN = struct.Struct("<H")
+_ALIGN = 16
+
+
+def compiled_path(path):
+    """Compiled file of a map source (the path hash keeps same-named maps apart)"""
+    path = os.path.abspath(path)
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(MAP_BIN_DIR, f"{os.path.splitext(os.path.basename(path))[0]}-{digest}.pmap")
+
+
+def source_stamp(path):
+    """(size, mtime in ns) of a map source, stored in its compiled file"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class CompiledMap:
+    """A compiled map opened with np.memmap: arrays are views on the file, nothing is parsed"""
+
+    def __init__(self, path):
+        self.path = path
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, size, mtime, meta_length, count = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"unknown compiled map format ({magic!r} v{version})")
+        self.stamp = (size, mtime)
+        pos = _HEADER.size
+        self.meta = json.loads(self.buffer[pos:pos + meta_length].tobytes().decode("utf-8"))
+        pos += meta_length
+        self.entries = {}  # name -> (dtype, shape, offset)
+        for _ in range(count):
+            (name_length,) = _NAME_LEN.unpack_from(self.buffer, pos)
+            pos += _NAME_LEN.size
+            name = self.buffer[pos:pos + name_length].tobytes().decode("utf-8")
+            pos += name_length
+            dtype, ndim, dim0, dim1, dim2, offset = _ENTRY.unpack_from(self.buffer, pos)
+            pos += _ENTRY.size
+            self.entries[name] = (np.dtype(dtype.decode("ascii").strip()), (dim0, dim1, dim2)[:ndim], offset)
+
+    @classmethod
+    def open_fresh(cls, source_path):
+        """The compiled file of a map if it is up to date with its source, else None"""
+        path = compiled_path(source_path)
+        if not (os.path.exists(path) and os.path.exists(source_path)):
+            return None
+        try:
+            compiled = cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[MAPBIN] Unreadable compiled map {path} ({e})")
+            return None
+        if compiled.stamp != source_stamp(source_path) or not compiled._tilesets_unchanged():
+            return None
+        return compiled
+
+    def _tilesets_unchanged(self):
+        assets = AssetManager.get_instance()
+        try:
+            return all(assets.fingerprint(path) == fingerprint for path, fingerprint in self.meta["tilesets"])
+        except OSError:
+            return False
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def array(self, name):
+        """Read-only view of an array of the file (no copy)"""
+        dtype, shape, offset = self.entries[name]
+        length = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        return self.buffer[offset:offset + length].view(dtype).reshape(shape)
+
+
+def write_compiled(path, stamp, meta, arrays):
+    """Write a compiled map file: meta (JSON-able dict) and arrays ({name: array})"""
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    encoded = [(name.encode("utf-8"), np.ascontiguousarray(array)) for name, array in arrays.items()]
+    offset = _HEADER.size + len(meta_bytes) + sum(_NAME_LEN.size + len(name) + _ENTRY.size for name, _ in encoded)
+    entries = []
+    for name, array in encoded:
+        offset = -(-offset // _ALIGN) * _ALIGN
+        entries.append((name, array, offset))
+        offset += array.nbytes
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, stamp[0], stamp[1], len(meta_bytes), len(entries)))
+        out.write(meta_bytes)
+        for name, array, offset in entries:
+            shape = tuple(array.shape) + (0,) * (3 - array.ndim)
+            out.write(_NAME_LEN.pack(len(name)))
+            out.write(name)
+            out.write(_ENTRY.pack(array.dtype.str.encode("ascii").ljust(4), array.ndim, *shape, offset))
+        for name, array, offset in entries:
+            out.write(b"\0" * (offset - out.tell()))
+            out.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+
+def compile_map(data, stamp):
+    """Write the compiled file of a MapData loaded from its JSON source (stamp taken before reading it)"""
+    width, height = data.width, data.height
+    arrays = {}
+    for index, layer in enumerate(data.layers):
+        gids = layer.gids(0, 0, width, height)
+        arrays[f"layer/{index}"] = gids.astype("<u2" if gids.max(initial=0) <= 0xFFFF else "<u4")
+    arrays["walkable"] = np.packbits(data.walkable)
+    if data.nearest_walkable_version != data.walkable_version:
+        data.build_nearest_walkable()
+    arrays["nearest_walkable"] = data.nearest_walkable.astype("<i4")
+    if data.blocks_sight is None:
+        data.build_sight_array()
+    arrays["blocks_sight"] = np.packbits(data.blocks_sight)
+    for name, table in data.tile_properties.tables.items():
+        arrays[f"tile/{name}"] = table
+
+    source = dict(data.map_data or {})
+    source["layers"] = [{key: value for key, value in layer.items() if key not in ("data", "chunks")}
+                        for layer in source.get("layers", [])]
+    meta = {
+        "width": width,
+        "height": height,
+        "origin": list(data.origin),
+        "walkable_layer_index": data.walkable_layer_index,
+        "layers": [layer.name for layer in data.layers],
+        "tile_properties": list(data.tile_properties.tables),
+        "tilesets": [[tileset.source, AssetManager.get_instance().fingerprint(tileset.source)]
+                     for tileset in data.tilesets if tileset.source],
+        "portals": [[portal.cells, portal.target_map, portal.target] for portal in data.portals],
+        "map": source,
+    }
+    path = compiled_path(data.path)
+    write_compiled(path, stamp, meta, arrays)
+    return path
+
+
+def _map_sources(names):
+    if names:
+        from game.maps import map_path
+        return [map_path(name) for name in names]
+    return sorted(os.path.join(MAP_DIR, f) for f in os.listdir(MAP_DIR) if f.endswith(".json"))
+
+
+def main(argv=None):
+    from game.maps import MapData
+
+    parser = argparse.ArgumentParser(prog="python -m game.mapbin", description="ProgMyst compiled maps")
+    parser.add_argument("command", choices=("build", "status"))
+    parser.add_argument("maps", nargs="*", help="map names or paths (every map of data/map by default)")
+    args = parser.parse_args(argv)
+
+    sources = _map_sources(args.maps)
+    stale = [path for path in sources if CompiledMap.open_fresh(path) is None]
+    if args.command == "status":
+        for path in stale:
+            print(f"[MAPBIN] Stale: {path}")
+        print(f"[MAPBIN] {len(sources)} maps, {len(stale)} to compile")
+        return 1 if stale else 0
+
+    # build: MapData.load rewrites the compiled file after reading the JSON
+    for path in sources:
+        MapData.load(path, use_compiled=False)
+    print(f"[MAPBIN] {len(sources)} maps compiled in {MAP_BIN_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
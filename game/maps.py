@@ -0,0 +1,482 @@
+import base64
+import gzip
+import json
+import os
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from core.settings import MAP_DIR, MAP_CACHE_SIZE, MAP_MEMORY_BUDGET
+from game.pathfinding import Pathfinder
+from game.tileset import TileProperties, load_map_tilesets
+from game.chunks import ChunkStreamer
+from game.mapbin import CompiledMap, compile_map, source_stamp
+
+
+def map_path(name):
+    """Map file of a map name ("clairiere", "neuill.json" or a full path)"""
+    if os.path.dirname(name):
+        return os.path.normpath(name)
+    return os.path.join(MAP_DIR, name if name.endswith(".json") else name + ".json")
+
+
+def map_name(path):
+    """Map name stored in the session ("clairiere" for data/map/clairiere.json)"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class Portal:
+    """Tile that sends the player to a cell of another map"""
+
+    __slots__ = ("cells", "target_map", "target")
+
+    def __init__(self, cells, target_map, target):
+        self.cells = cells            # Grid cells that trigger the portal
+        self.target_map = target_map  # Map file path
+        self.target = target          # Arrival tile on the target map (Tiled coordinates)
+
+    @classmethod
+    def from_object(cls, obj, tile_height, origin=(0, 0)):
+        """Portal from a Tiled object of the "portals" layer.
+
+        Object positions on isometric maps are in pixels of tile_height per tile along both
+        grid axes. Properties: target_map (map name) and target_x / target_y (arrival cell).
+        """
+        properties = {p["name"]: p["value"] for p in obj.get("properties", [])}
+        if "target_map" not in properties:
+            return None
+        x0, y0 = int(obj["x"] // tile_height), int(obj["y"] // tile_height)
+        x1 = max(x0, int((obj["x"] + obj.get("width", 0)) // tile_height - 1e-9))
+        y1 = max(y0, int((obj["y"] + obj.get("height", 0)) // tile_height - 1e-9))
+        x0, x1, y0, y1 = x0 - origin[0], x1 - origin[0], y0 - origin[1], y1 - origin[1]
+        cells = [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+        target = (int(properties.get("target_x", 16)), int(properties.get("target_y", 16)))
+        return cls(cells, map_path(properties["target_map"]), target)
+
+
+def _heap_bytes(array):
+    """Memory held by an array (views on a compiled map file are paged by the OS, not counted)"""
+    return 0 if isinstance(array, np.memmap) else array.nbytes
+
+
+def decode_gids(data, encoding=None, compression=None):
+    """Tile gids of a Tiled layer or chunk "data" (JSON list, or base64 with optional compression)"""
+    if encoding != "base64":
+        return np.asarray(data, dtype=np.uint32)
+    raw = base64.b64decode(data)
+    if compression == "zlib":
+        raw = zlib.decompress(raw)
+    elif compression == "gzip":
+        raw = gzip.decompress(raw)
+    elif compression:
+        raise ValueError(f"unsupported layer compression {compression}")
+    return np.frombuffer(raw, dtype="<u4").astype(np.uint32)
+
+
+class TileLayer:
+    """A Tiled tile layer, decoded block by block on first use.
+
+    Blocks are the chunks of an infinite map, or the whole data of a finite one. They stay
+    in their JSON/base64 form until a region overlapping them is read; decoded blocks are
+    compact uint32 arrays. Block positions are in map cells, already shifted by the map origin.
+    """
+
+    def __init__(self, layer, origin):
+        self.name = layer.get("name", "")
+        self.encoding = layer.get("encoding")
+        self.compression = layer.get("compression")
+        ox, oy = origin
+        if "chunks" in layer:
+            sources = [(c["x"], c["y"], c["width"], c["height"], c["data"]) for c in layer["chunks"]]
+        else:
+            sources = [(layer.get("x", 0), layer.get("y", 0), layer.get("width", 0), layer.get("height", 0),
+                        layer.get("data", []))]
+        self.blocks = {}  # (x, y) -> [width, height, raw data or decoded [h, w] array]
+        for x, y, width, height, data in sources:
+            if width and height:
+                self.blocks[(x - ox, y - oy)] = [width, height, data]
+        sizes = {(width, height) for width, height, data in self.blocks.values()}
+        self.block_size = sizes.pop() if len(sizes) == 1 else None
+        # Same-size blocks on a regular grid: overlapping blocks are found by arithmetic
+        if self.block_size and not all(x % self.block_size[0] == 0 and y % self.block_size[1] == 0
+                                       for x, y in self.blocks):
+            self.block_size = None
+
+    @classmethod
+    def from_array(cls, name, grid):
+        """Layer of already decoded [h, w] gids (compiled maps)"""
+        layer = cls({"name": name}, (0, 0))
+        height, width = grid.shape
+        layer.blocks[(0, 0)] = [width, height, grid]
+        layer.block_size = (width, height)
+        return layer
+
+    @staticmethod
+    def bounds(layer):
+        """(min_x, min_y, max_x, max_y) cells covered by a raw layer, without decoding it"""
+        if "chunks" in layer:
+            chunks = layer["chunks"]
+            if not chunks:
+                return None
+            return (min(c["x"] for c in chunks), min(c["y"] for c in chunks),
+                    max(c["x"] + c["width"] for c in chunks), max(c["y"] + c["height"] for c in chunks))
+        x, y = layer.get("x", 0), layer.get("y", 0)
+        return (x, y, x + layer.get("width", 0), y + layer.get("height", 0))
+
+    def _block(self, key):
+        block = self.blocks[key]
+        if not isinstance(block[2], np.ndarray):
+            width, height = block[0], block[1]
+            gids = decode_gids(block[2], self.encoding, self.compression)
+            grid = np.zeros(width * height, dtype=np.uint32)
+            grid[:min(len(gids), len(grid))] = gids[:len(grid)]
+            block[2] = grid.reshape(height, width)
+        return block[2]
+
+    def _overlapping(self, x0, y0, x1, y1):
+        if self.block_size is None:
+            return [key for key, (width, height, data) in self.blocks.items()
+                    if key[0] < x1 and key[0] + width > x0 and key[1] < y1 and key[1] + height > y0]
+        bw, bh = self.block_size
+        return [(bx, by) for by in range((y0 // bh) * bh, y1, bh) for bx in range((x0 // bw) * bw, x1, bw)
+                if (bx, by) in self.blocks]
+
+    def gids(self, x0, y0, x1, y1):
+        """[y1 - y0, x1 - x0] array of gids of a cell rectangle (0 where the layer has no tile)"""
+        region = np.zeros((max(0, y1 - y0), max(0, x1 - x0)), dtype=np.uint32)
+        for bx, by in self._overlapping(x0, y0, x1, y1):
+            block = self._block((bx, by))
+            height, width = block.shape
+            sx0, sy0 = max(x0, bx), max(y0, by)
+            sx1, sy1 = min(x1, bx + width), min(y1, by + height)
+            if sx0 < sx1 and sy0 < sy1:
+                region[sy0 - y0:sy1 - y0, sx0 - x0:sx1 - x0] = block[sy0 - by:sy1 - by, sx0 - bx:sx1 - bx]
+        return region
+
+    @property
+    def nbytes(self):
+        return sum(_heap_bytes(data) for width, height, data in self.blocks.values() if isinstance(data, np.ndarray))
+
+
+class MapData:
+    """Everything the world keeps per map: tile layers, walkable layer, navigation data and portals.
+
+    Tile properties (walkable, blocks_sight, z_height, animated) come from the map's tilesets as
+    per-gid tables: the walkable array is one lookup over the walkable layer, and the sight
+    array one lookup per layer.
+
+    Sizes come from the map itself: finite maps of any size and Tiled infinite maps (chunked
+    layers) are supported. Grid cells start at (0, 0) on the top-left of the map's bounds
+    (origin holds the Tiled coordinates of that cell). Tile layers stay encoded until the
+    chunk streamer (game/chunks.py) needs them for drawing; only the walkable layer is read
+    whole, for the walkable array.
+
+    A map is read from its compiled file (game/mapbin.py) when it is up to date: layers, walkable
+    cells and the nearest-walkable table then come straight from the memory-mapped file. Otherwise
+    the JSON is parsed and the compiled file rewritten for the next load.
+
+    Loading touches no pygame object, so it can run on the preload thread; the tile atlas is
+    attached on the main thread when the map becomes current.
+    """
+
+    WALKABLE_LAYER_INDEX = 2  # Layer_1 defines walkability
+
+    def __init__(self, path):
+        self.path = path
+        self.name = map_name(path)
+        self.map_data = None
+        self.layers = []  # TileLayer per Tiled tile layer, in draw order
+        self.walkable_layer_index = self.WALKABLE_LAYER_INDEX
+        self.origin = (0, 0)  # Tiled coordinates of grid cell (0, 0)
+        self.width = 0
+        self.height = 0
+        self.walkable = np.zeros((0, 0), dtype=bool)  # [y, x] walkable cells (movement, pathfinding)
+        self.walkable_version = 0  # Bumped on every walkability change (path caches key on it)
+        self.tilesets = []  # Tilesets read with the JSON (compiled maps only keep their tables)
+        self.tile_properties = TileProperties.from_tilesets([])  # Per-gid property tables
+        self.blocks_sight = None  # [y, x] cells with a sight-blocking tile on any layer (built lazily)
+        self.nearest_walkable = np.zeros((0, 0, 2), dtype=np.int32)  # [y, x] -> closest walkable (x, y)
+        self.nearest_walkable_version = None
+        self.pathfinder = Pathfinder(self)
+        self.distance_fields = {}  # name -> DistanceField (one per shared goal, e.g. the player)
+        self.portals = []
+        self.atlas = None  # TileAtlas, attached by World.load_tiles
+        self.chunks = ChunkStreamer(self)
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    @property
+    def center(self):
+        """Grid point drawn at the screen center when the camera offset is (0, 0)"""
+        return ((self.width - 1) / 2.0, (self.height - 1) / 2.0)
+
+    def to_grid(self, x, y):
+        """Grid cell of a Tiled tile coordinate (they differ on infinite maps)"""
+        return (x - self.origin[0], y - self.origin[1])
+
+    @classmethod
+    def load(cls, path, navigation=False, use_compiled=True):
+        """Read a map (safe off the main thread); navigation=True also builds its navigation tables"""
+        data = cls(path)
+        try:
+            compiled = CompiledMap.open_fresh(path) if use_compiled else None
+            if compiled is not None:
+                data.load_compiled(compiled)
+                print(f"[MAPS] {data.name}: {data.width}x{data.height}, {len(data.layers)} layers, "
+                      f"{len(data.portals)} portals (compiled)")
+            elif os.path.exists(path):
+                stamp = source_stamp(path)
+                with open(path, 'r', encoding='utf-8') as f:
+                    data.map_data = json.load(f)
+                data.process_map_data(data.map_data)
+                print(f"[MAPS] {data.name}: {data.width}x{data.height}, {len(data.layers)} layers, "
+                      f"{len(data.portals)} portals")
+                data.compile(stamp)
+            else:
+                print(f"[MAPS] Map file {path} not found, creating default grid")
+                data.create_default_grid()
+        except Exception as e:
+            print(f"[MAPS] Error loading map {path}: {e}")
+            data.create_default_grid()
+        if navigation:
+            data.prepare_navigation()
+        return data
+
+    def process_map_data(self, map_data):
+        """Read the map bounds, the tile layers (still encoded), the walkable array and the portals"""
+        raw_layers = [l for l in map_data.get("layers", []) if l.get("type") == "tilelayer"]
+        if map_data.get("infinite"):
+            bounds = [b for b in (TileLayer.bounds(layer) for layer in raw_layers) if b]
+            if bounds:
+                min_x, min_y = min(b[0] for b in bounds), min(b[1] for b in bounds)
+                max_x, max_y = max(b[2] for b in bounds), max(b[3] for b in bounds)
+            else:
+                min_x = min_y = max_x = max_y = 0
+        else:
+            min_x, min_y = 0, 0
+            max_x, max_y = map_data.get("width", 0), map_data.get("height", 0)
+        self.origin = (min_x, min_y)
+        self.width, self.height = max_x - min_x, max_y - min_y
+        self.layers = [TileLayer(layer, self.origin) for layer in raw_layers]
+        self.tilesets = load_map_tilesets(map_data, self.path)
+        self.tile_properties = TileProperties.from_tilesets(self.tilesets)
+        self.build_walkable_array()
+
+        tile_height = map_data.get("tileheight", 32)
+        self.portals = []
+        for layer in map_data.get("layers", []):
+            if layer.get("type") == "objectgroup" and layer.get("name") == "portals":
+                portals = (Portal.from_object(obj, tile_height, self.origin) for obj in layer.get("objects", []))
+                self.portals.extend(portal for portal in portals if portal)
+
+    def load_compiled(self, compiled):
+        """Fill the map from its compiled file: arrays are views on the mapped file, not parsed"""
+        meta = compiled.meta
+        self.map_data = meta["map"]
+        self.width, self.height = meta["width"], meta["height"]
+        self.origin = tuple(meta["origin"])
+        self.walkable_layer_index = meta["walkable_layer_index"]
+        self.layers = [TileLayer.from_array(name, compiled.array(f"layer/{index}"))
+                       for index, name in enumerate(meta["layers"])]
+        # Unpacked copy: walkability can change at runtime (set_walkable)
+        bits = np.unpackbits(compiled.array("walkable"), count=self.width * self.height)
+        self.walkable = bits.reshape(self.height, self.width).astype(bool)
+        self.walkable_version += 1
+        self.nearest_walkable = compiled.array("nearest_walkable")
+        self.nearest_walkable_version = self.walkable_version
+        self.tile_properties = TileProperties({name: compiled.array(f"tile/{name}")
+                                               for name in meta["tile_properties"]})
+        bits = np.unpackbits(compiled.array("blocks_sight"), count=self.width * self.height)
+        self.blocks_sight = bits.reshape(self.height, self.width).astype(bool)
+        self.portals = [Portal([tuple(cell) for cell in cells], target_map, tuple(target))
+                        for cells, target_map, target in meta["portals"]]
+
+    def compile(self, stamp):
+        """Write the compiled file of a map just read from JSON (skipped if the cache is not writable)"""
+        try:
+            path = compile_map(self, stamp)
+            print(f"[MAPS] {self.name} compiled to {path}")
+            # Compiling decoded every layer: switch to views on the file instead
+            self.load_compiled(CompiledMap(path))
+        except (OSError, ValueError) as e:
+            print(f"[MAPS] Compiled map not written ({e})")
+
+    def create_default_grid(self):
+        """Create simple default grid for testing (one walkable layer)"""
+        size = 21
+        self.width = self.height = size
+        self.layers = [TileLayer({"width": size, "height": size, "data": [1] * (size * size)}, (0, 0))]
+        self.walkable_layer_index = 0
+        self.build_walkable_array()
+
+    def build_walkable_array(self):
+        """Walkable cells: the tiles of the walkable layer whose tileset property allows it"""
+        if self.walkable_layer_index < len(self.layers):
+            layer = self.layers[self.walkable_layer_index]
+            self.walkable = self.tile_properties.lookup("walkable", layer.gids(0, 0, self.width, self.height))
+        else:
+            self.walkable = np.zeros((self.height, self.width), dtype=bool)
+        self.walkable_version += 1
+
+    def build_sight_array(self):
+        """Cells where a tile of any layer blocks the line of sight"""
+        blocks = np.zeros((self.height, self.width), dtype=bool)
+        for layer in self.layers:
+            blocks |= self.tile_properties.lookup("blocks_sight", layer.gids(0, 0, self.width, self.height))
+        self.blocks_sight = blocks
+
+    def build_nearest_walkable(self):
+        """Closest walkable cell of every map cell: multi-source BFS from all walkable cells at once"""
+        walkable = self.walkable
+        height, width = walkable.shape
+        nearest = np.full((height, width, 2), -1, dtype=np.int32)
+        ys, xs = np.nonzero(walkable)
+        nearest[ys, xs, 0] = xs
+        nearest[ys, xs, 1] = ys
+
+        # Each wave reaches the cells one ring (Chebyshev distance) further than the previous one
+        reached = walkable.copy()
+        frontier = walkable.copy()
+        while frontier.any() and not reached.all():
+            wave = np.zeros_like(reached)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if not dx and not dy:
+                        continue
+                    # dst cell (x, y) takes the nearest cell of its neighbour src (x - dx, y - dy)
+                    dst = (slice(max(dy, 0), height + min(dy, 0)), slice(max(dx, 0), width + min(dx, 0)))
+                    src = (slice(max(-dy, 0), height + min(-dy, 0)), slice(max(-dx, 0), width + min(-dx, 0)))
+                    take = frontier[src] & ~reached[dst] & ~wave[dst]
+                    nearest[dst][take] = nearest[src][take]
+                    wave[dst] |= take
+            reached |= wave
+            frontier = wave
+
+        self.nearest_walkable = nearest
+        self.nearest_walkable_version = self.walkable_version
+
+    def prepare_navigation(self):
+        """Build the jump tables and the nearest-walkable table ahead of the first query"""
+        if self.walkable.size:
+            self.pathfinder._sync()
+            self.build_nearest_walkable()
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the map data (the atlas is counted by the AssetManager)"""
+        sight = self.blocks_sight.nbytes if self.blocks_sight is not None else 0
+        return (self.walkable.nbytes + _heap_bytes(self.nearest_walkable) + self.pathfinder.nbytes + sight
+                + sum(layer.nbytes for layer in self.layers) + self.chunks.nbytes)
+
+    def release(self):
+        """Give the tile atlas back to the asset manager (map leaving the cache)"""
+        self.chunks.clear()
+        if self.atlas:
+            self.atlas.release()
+        self.atlas = None
+
+
+class MapManager:
+    """Singleton cache of loaded maps: LRU under a count and memory budget, with preloading.
+
+    preload() loads a map on a background thread (the player approaching a portal), so the
+    transition itself only swaps the MapData into the world. get() returns a cached map,
+    waits for a preload in progress, or loads synchronously as a last resort.
+    """
+
+    _instance = None
+
+    def __init__(self, max_maps=MAP_CACHE_SIZE, budget_bytes=MAP_MEMORY_BUDGET):
+        self.max_maps = max_maps
+        self.budget_bytes = budget_bytes
+        self.maps = OrderedDict()  # path -> MapData, least recently used first
+        self.pending = {}          # path -> Future of a background load
+        self.current = None        # Map last handed out by get() (never evicted)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-preload")
+        self.stats = {"hits": 0, "misses": 0, "preloads": 0, "preload_hits": 0, "evictions": 0}
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Drop the instance and its cached maps (debug/tests)"""
+        if cls._instance is not None:
+            cls._instance.executor.shutdown(wait=True)
+            for data in cls._instance.maps.values():
+                data.release()
+        cls._instance = None
+
+    def __contains__(self, path):
+        return os.path.normpath(path) in self.maps
+
+    def get(self, path):
+        """MapData for a map file, loading it now if it is neither cached nor preloading"""
+        path = os.path.normpath(path)
+        self.collect()
+        data = self.maps.get(path)
+        if data is not None:
+            self.stats["hits"] += 1
+            self.maps.move_to_end(path)
+        else:
+            future = self.pending.pop(path, None)
+            if future is not None:
+                self.stats["preload_hits"] += 1
+                data = future.result()
+            else:
+                self.stats["misses"] += 1
+                data = MapData.load(path)
+            self.maps[path] = data
+        self.current = data
+        self._enforce_budget()
+        return data
+
+    def preload(self, path):
+        """Start loading a map on the background thread (no-op if cached or already loading)"""
+        path = os.path.normpath(path)
+        if path in self.maps or path in self.pending or not os.path.exists(path):
+            return False
+        self.stats["preloads"] += 1
+        self.pending[path] = self.executor.submit(MapData.load, path, True)
+        print(f"[MAPS] Preloading {map_name(path)}")
+        return True
+
+    def preload_near(self, data, position, radius):
+        """Preload the targets of the portals within radius tiles of position"""
+        x, y = position
+        for portal in data.portals:
+            if any(max(abs(cx - x), abs(cy - y)) <= radius for cx, cy in portal.cells):
+                self.preload(portal.target_map)
+
+    def collect(self):
+        """Move finished background loads into the cache"""
+        for path, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[path]
+                self.maps[path] = future.result()
+                self._enforce_budget()
+
+    def _enforce_budget(self):
+        """Evict least recently used maps (never the current one) over the count or memory budget"""
+        while len(self.maps) > 1 and (len(self.maps) > self.max_maps or self.total_bytes() > self.budget_bytes):
+            path, data = next((path, data) for path, data in self.maps.items() if data is not self.current)
+            del self.maps[path]
+            data.release()
+            self.stats["evictions"] += 1
+            print(f"[MAPS] Evicted {data.name}")
+
+    def total_bytes(self):
+        return sum(data.nbytes for data in self.maps.values())
+
+    def log_stats(self):
+        stats = self.stats
+        print(f"[MAPS] {len(self.maps)} maps cached ({self.total_bytes() / 1e6:.1f} MB), "
+              f"{len(self.pending)} preloading, {stats['hits']} hits, {stats['preload_hits']} preload hits, "
+              f"{stats['misses']} misses, {stats['evictions']} evictions")
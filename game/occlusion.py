@@ -0,0 +1,129 @@
+import math
+
+import numpy as np
+import pygame
+
+from core.settings import TILE_WIDTH, TILE_HEIGHT, LAYER_HEIGHT
+from game.tileset import GID_MASK
+
+# Tiles are cut into BLOCKS x BLOCKS blocks: one bit each in a uint64 per tile
+BLOCKS = 8
+
+
+class TileOcclusion:
+    """Which tiles are fully hidden by the tiles drawn after them, from the atlas alpha.
+
+    Tiles are split into blocks whose size divides the iso steps (TILE_WIDTH / 2, TILE_HEIGHT / 4)
+    and LAYER_HEIGHT: the projection and the layer offset move tiles by whole blocks, so a tile
+    drawn later on a nearby cell or a higher layer lines its blocks up with ours. Per gid, solid
+    has a bit per fully opaque block and painted a bit per block with any visible pixel. A tile
+    is hidden when each of its painted blocks lies under a solid block of a tile drawn after it.
+    Partly transparent blocks never hide anything, so culling does not change the picture.
+    """
+
+    def __init__(self, atlas, tile_properties):
+        self.block_w = math.gcd(TILE_WIDTH // 2, TILE_WIDTH // BLOCKS)
+        self.block_h = math.gcd(TILE_HEIGHT // 4, LAYER_HEIGHT, TILE_HEIGHT // BLOCKS)
+        self.columns, self.rows = TILE_WIDTH // self.block_w, TILE_HEIGHT // self.block_h
+        size = max(atlas.rects, default=0) + 1
+        self.solid = np.zeros(size, dtype=np.uint64)
+        self.painted = np.zeros(size, dtype=np.uint64)
+        self.fill = np.zeros(size, dtype=np.int32)  # Visible pixels per gid (overdraw counter)
+        self._offsets = {}  # Layer count -> [(dx, dy, dl, bit mask, bit shift)]
+
+        alpha = pygame.surfarray.array_alpha(atlas.surface).T  # [y, x]
+        bits = (np.uint64(1) << np.arange(self.rows * self.columns, dtype=np.uint64)).reshape(self.rows, self.columns)
+        # Animated tiles change from frame to frame: they hide nothing
+        animated = tile_properties.lookup("animated", np.arange(size))
+        for gid, rect in atlas.rects.items():
+            tile = alpha[rect.y:rect.y + TILE_HEIGHT, rect.x:rect.x + TILE_WIDTH]
+            if tile.shape != (TILE_HEIGHT, TILE_WIDTH):
+                continue
+            blocks = tile.reshape(self.rows, self.block_h, self.columns, self.block_w)
+            self.painted[gid] = bits[(blocks > 0).any(axis=(1, 3))].sum()
+            if not animated[gid]:
+                self.solid[gid] = bits[(blocks == 255).all(axis=(1, 3))].sum()
+            self.fill[gid] = np.count_nonzero(tile)
+
+    def index(self, gids):
+        """Table index of gids (flip bits dropped as the atlas does, unknown gids -> 0)"""
+        index = np.asarray(gids, dtype=np.uint32) & GID_MASK
+        return np.where(index < len(self.solid), index, 0)
+
+    def margin(self, layers):
+        """Cells around a region whose tiles can cover it, with that many layers"""
+        reach = ((layers - 1) * LAYER_HEIGHT + TILE_HEIGHT) // (TILE_HEIGHT // 4)
+        return reach // 2 + 1
+
+    def offsets(self, layers):
+        """Tiles (dx, dy, dl) drawn after a tile and overlapping it, with the block bits they can cover.
+
+        A block (column c, row r) of the tile at (dx, dy, dl) lands on our block (c + column,
+        r + row); mask keeps its blocks that land inside our tile, shift moves their bits there.
+        """
+        if layers in self._offsets:
+            return self._offsets[layers]
+        offsets = []
+        reach = self.margin(layers)
+        for dl in range(layers):
+            for dy in range(-reach, reach + 1):
+                for dx in range(-reach, reach + 1):
+                    # Same layer: drawn after means further along y, then x
+                    if dl == 0 and (dy, dx) <= (0, 0):
+                        continue
+                    column = (dx - dy) * (TILE_WIDTH // 2) // self.block_w
+                    row = ((dx + dy) * (TILE_HEIGHT // 4) - dl * LAYER_HEIGHT) // self.block_h
+                    if abs(column) >= self.columns or abs(row) >= self.rows:
+                        continue
+                    mask = 0
+                    for r in range(self.rows):
+                        for c in range(self.columns):
+                            if 0 <= r + row < self.rows and 0 <= c + column < self.columns:
+                                mask |= 1 << (r * self.columns + c)
+                    offsets.append((dx, dy, dl, np.uint64(mask), row * self.columns + column))
+        self._offsets[layers] = offsets
+        return offsets
+
+    def hidden(self, stack, margin):
+        """[layer, y, x] gids of a region grown by margin cells -> bool mask of hidden tiles inside it"""
+        layers = stack.shape[0]
+        height, width = stack.shape[1] - 2 * margin, stack.shape[2] - 2 * margin
+        index = self.index(stack)
+        solid = self.solid[index]
+        painted = self.painted[index[:, margin:margin + height, margin:margin + width]]
+        covered = np.zeros_like(painted)
+        for dx, dy, dl, mask, shift in self.offsets(layers):
+            above = solid[dl:, margin + dy:margin + dy + height, margin + dx:margin + dx + width] & mask
+            if shift >= 0:
+                covered[:layers - dl] |= above << np.uint64(shift)
+            else:
+                covered[:layers - dl] |= above >> np.uint64(-shift)
+        return (painted & ~covered) == 0
+
+
+class OverdrawCounter:
+    """Tiles and pixels blitted by World.draw: overdraw = visible tile pixels / screen pixels"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.tiles = 0
+        self.pixels = 0
+        self.screen_pixels = 0
+
+    def record(self, tiles, pixels, screen_pixels):
+        self.frames += 1
+        self.tiles += tiles
+        self.pixels += pixels
+        self.screen_pixels += screen_pixels
+
+    @property
+    def overdraw(self):
+        return self.pixels / self.screen_pixels if self.screen_pixels else 0.0
+
+    def log_stats(self, occluded=0):
+        frames = max(1, self.frames)
+        print(f"[DRAW] {self.tiles / frames:.0f} tiles/frame, overdraw {self.overdraw:.2f}x "
+              f"over {self.frames} frames, {occluded} hidden tiles culled")
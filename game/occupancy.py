@@ -0,0 +1,151 @@
+import numpy as np
+
+FREE = -1
+
+
+class OccupancyGrid:
+    """Which entity stands on, or has claimed, each tile.
+
+    cells[y, x] holds the id of an entity standing on the tile (FREE if none) and counts[y, x]
+    how many do: teleports and crowded spawns may stack entities, the extra ones are kept in
+    stacked. reserved[y, x] holds the id of the entity that claimed the tile for a planned move.
+    Everything is updated incrementally when an entity changes tile, so "can this entity step
+    there" is two array reads instead of a comparison with every other entity.
+    """
+
+    def __init__(self, shape=(0, 0)):
+        self.cells = np.full(shape, FREE, dtype=np.int32)
+        self.counts = np.zeros(shape, dtype=np.int32)
+        self.reserved = np.full(shape, FREE, dtype=np.int32)
+        self.ids = {}           # entity -> id
+        self.entities = []      # id -> entity
+        self.free_ids = []
+        self.positions = {}     # entity -> occupied (x, y)
+        self.stacked = {}       # (x, y) -> other entities standing on an occupied tile
+        self.reservations = {}  # entity -> tuple of reserved (x, y)
+
+    def __contains__(self, entity):
+        return entity in self.positions
+
+    def resize(self, shape):
+        """New map size: rebuild the arrays from the current positions and reservations"""
+        positions, reservations = self.positions, self.reservations
+        self.cells = np.full(shape, FREE, dtype=np.int32)
+        self.counts = np.zeros(shape, dtype=np.int32)
+        self.reserved = np.full(shape, FREE, dtype=np.int32)
+        self.positions, self.stacked, self.reservations = {}, {}, {}
+        for entity, cell in positions.items():
+            self.place(entity, cell)
+        for entity, cells in reservations.items():
+            self.reserve(entity, cells)
+
+    def _in_bounds(self, x, y):
+        return 0 <= y < self.cells.shape[0] and 0 <= x < self.cells.shape[1]
+
+    def _id(self, entity):
+        entity_id = self.ids.get(entity)
+        if entity_id is None:
+            entity_id = self.free_ids.pop() if self.free_ids else len(self.entities)
+            if entity_id == len(self.entities):
+                self.entities.append(entity)
+            else:
+                self.entities[entity_id] = entity
+            self.ids[entity] = entity_id
+        return entity_id
+
+    def place(self, entity, cell):
+        """Put (or move) an entity on a tile"""
+        cell = (int(cell[0]), int(cell[1]))
+        old = self.positions.get(entity)
+        if old == cell:
+            return
+        if old is not None:
+            self._leave(entity, old)
+        self.positions[entity] = cell
+        x, y = cell
+        if not self._in_bounds(x, y):
+            return
+        if self.counts[y, x]:
+            self.stacked.setdefault(cell, []).append(entity)
+        else:
+            self.cells[y, x] = self._id(entity)
+        self.counts[y, x] += 1
+
+    def _leave(self, entity, cell):
+        x, y = cell
+        if not self._in_bounds(x, y):
+            return
+        self.counts[y, x] -= 1
+        others = self.stacked.get(cell)
+        if self.cells[y, x] == self.ids.get(entity):
+            # The tile goes to the next stacked entity, if any
+            self.cells[y, x] = self._id(others.pop()) if others else FREE
+        elif others and entity in others:
+            others.remove(entity)
+        if others is not None and not others:
+            del self.stacked[cell]
+
+    def remove(self, entity):
+        """Forget an entity: its tile and its reservations are freed"""
+        self.release(entity)
+        cell = self.positions.pop(entity, None)
+        if cell is not None:
+            self._leave(entity, cell)
+        entity_id = self.ids.pop(entity, None)
+        if entity_id is not None:
+            self.entities[entity_id] = None
+            self.free_ids.append(entity_id)
+
+    def occupant(self, x, y):
+        """An entity standing on (x, y), or None"""
+        if not self._in_bounds(x, y) or self.cells[y, x] == FREE:
+            return None
+        return self.entities[self.cells[y, x]]
+
+    def is_free(self, x, y, entity=None):
+        """True if no other entity stands on or has reserved (x, y).
+
+        The tile an entity already stands on, and tiles it reserved itself, are free for it.
+        Tiles outside the grid are left to the terrain check.
+        """
+        if not self._in_bounds(x, y) or self.positions.get(entity) == (x, y):
+            return True
+        own = self.ids.get(entity, FREE)
+        occupant = self.cells[y, x]
+        if occupant != FREE and occupant != own:
+            return False
+        claimant = self.reserved[y, x]
+        return claimant == FREE or claimant == own
+
+    def held_by_others(self, cells, entities):
+        """Vectorized is_free: (N, 2) int cells, one entity each -> bool array, True where held"""
+        cells = np.asarray(cells)
+        x, y = cells[:, 0], cells[:, 1]
+        inside = (x >= 0) & (y >= 0) & (y < self.cells.shape[0]) & (x < self.cells.shape[1])
+        x, y = np.where(inside, x, 0), np.where(inside, y, 0)
+        own = np.array([self.ids.get(entity, FREE) for entity in entities], dtype=np.int32)
+        occupant, claimant = self.cells[y, x], self.reserved[y, x]
+        held = ((occupant != FREE) & (occupant != own)) | ((claimant != FREE) & (claimant != own))
+        return inside & held
+
+    def reserve(self, entity, cells):
+        """Claim tiles for a planned move, all or none; replaces the entity's previous claim"""
+        cells = tuple((int(x), int(y)) for x, y in cells)
+        if self.reservations.get(entity) == cells:
+            return True
+        if not all(self.is_free(x, y, entity) for x, y in cells):
+            return False
+        self.release(entity)
+        entity_id = self._id(entity)
+        for x, y in cells:
+            if self._in_bounds(x, y):
+                self.reserved[y, x] = entity_id
+        self.reservations[entity] = cells
+        return True
+
+    def release(self, entity):
+        """Drop the tiles an entity reserved"""
+        entity_id = self.ids.get(entity)
+        for x, y in self.reservations.pop(entity, ()):
+            if self._in_bounds(x, y) and self.reserved[y, x] == entity_id:
+                self.reserved[y, x] = FREE
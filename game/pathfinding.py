@@ -0,0 +1,482 @@
+import heapq
+import time
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+import numpy as np
+
+SQRT2 = 2 ** 0.5
+
+# (dx, dy) of the 8 moves; straight moves first
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Moves worth trying after arriving with a given move (jump point search pruning, no corner cutting)
+_SUCCESSORS = {
+    None: DIRECTIONS,
+    (1, 0): ((1, 0), (1, 1), (1, -1), (0, 1), (0, -1)),
+    (-1, 0): ((-1, 0), (-1, 1), (-1, -1), (0, 1), (0, -1)),
+    (0, 1): ((0, 1), (1, 1), (-1, 1), (1, 0), (-1, 0)),
+    (0, -1): ((0, -1), (1, -1), (-1, -1), (1, 0), (-1, 0)),
+}
+for _dx, _dy in DIRECTIONS[4:]:
+    _SUCCESSORS[(_dx, _dy)] = ((_dx, _dy), (_dx, 0), (0, _dy))
+
+# The same by direction index, for the flat search state: arrival index -> move indices
+START = len(DIRECTIONS)
+_MOVES = [tuple(DIRECTIONS.index(move) for move in _SUCCESSORS[arrival])
+          for arrival in DIRECTIONS + (None,)]
+# [sign(dy) + 1][sign(dx) + 1] -> index of the move pointing that way (-1 for none)
+_TOWARD = [[DIRECTIONS.index((dx, dy)) if (dx, dy) in DIRECTIONS else -1 for dx in (-1, 0, 1)]
+           for dy in (-1, 0, 1)]
+
+
+def _flat_array(typecode, values):
+    """Compact flat copy of a NumPy array, fast to index one cell at a time from Python"""
+    flat = array(typecode)
+    flat.frombytes(np.ascontiguousarray(values, dtype=np.dtype(typecode)).tobytes())
+    return flat
+
+
+def _east_jumps(walk):
+    """Jump table for moves towards +x on a padded walkable array.
+
+    For each cell: d > 0 means the next jump point is d cells away, d <= 0 means -d walkable
+    cells follow before a wall (dead end). A cell is a jump point when it has a forced
+    neighbour: a side cell that is open while the one behind it is blocked.
+    """
+    forced = np.zeros_like(walk)
+    forced[1:-1, 1:] = walk[1:-1, 1:] & ((walk[:-2, 1:] & ~walk[:-2, :-1]) | (walk[2:, 1:] & ~walk[2:, :-1]))
+    table = np.zeros(walk.shape, dtype=np.int32)
+    for x in range(walk.shape[1] - 2, -1, -1):
+        ahead = table[:, x + 1]
+        table[:, x] = np.where(~walk[:, x + 1], 0,
+                               np.where(forced[:, x + 1], 1, np.where(ahead > 0, ahead + 1, ahead - 1)))
+    return table
+
+
+def _south_east_jumps(walk, east, south):
+    """Jump table for moves towards (+x, +y), same encoding as _east_jumps.
+
+    A diagonal move needs both side cells open. A cell is a diagonal jump point when a
+    straight scan from it (along +x or +y) finds a jump point.
+    """
+    can_step = np.zeros_like(walk)
+    can_step[:-1, :-1] = walk[:-1, :-1] & walk[:-1, 1:] & walk[1:, :-1] & walk[1:, 1:]
+    stop = (east > 0) | (south > 0)
+    table = np.zeros(walk.shape, dtype=np.int32)
+    for y in range(walk.shape[0] - 2, -1, -1):
+        ahead = table[y + 1, 1:]
+        table[y, :-1] = np.where(~can_step[y, :-1], 0,
+                                 np.where(stop[y + 1, 1:], 1, np.where(ahead > 0, ahead + 1, ahead - 1)))
+    return table
+
+
+def build_jump_tables(walkable):
+    """Precompute the jump distance of every cell in the 8 directions (JPS+).
+
+    walkable is a (height, width) bool array. The tables are padded with a one-cell wall
+    border and returned as {(dx, dy): table}, each table of shape (height + 2, width + 2).
+    """
+    walk = np.zeros((walkable.shape[0] + 2, walkable.shape[1] + 2), dtype=bool)
+    walk[1:-1, 1:-1] = walkable
+
+    # Straight moves are all computed as +x on a flipped / transposed grid
+    east = _east_jumps(walk)
+    west = _east_jumps(walk[:, ::-1])[:, ::-1]
+    south = _east_jumps(np.ascontiguousarray(walk.T)).T
+    north = _east_jumps(np.ascontiguousarray(walk[::-1].T)).T[::-1]
+
+    # Diagonal moves as (+x, +y) on a flipped grid, with the matching straight tables
+    tables = {(1, 0): east, (-1, 0): west, (0, 1): south, (0, -1): north}
+    tables[(1, 1)] = _south_east_jumps(walk, east, south)
+    tables[(1, -1)] = _south_east_jumps(walk[::-1], east[::-1], north[::-1])[::-1]
+    tables[(-1, 1)] = _south_east_jumps(walk[:, ::-1], west[:, ::-1], south[:, ::-1])[:, ::-1]
+    tables[(-1, -1)] = _south_east_jumps(walk[::-1, ::-1], west[::-1, ::-1], north[::-1, ::-1])[::-1, ::-1]
+    return walk, tables
+
+
+def label_regions(walk, width):
+    """Connected region id of every cell of a flat padded walkable list (0 for walls).
+
+    Diagonal moves need both side cells open, so 4-connectivity gives the same regions
+    as 8-directional movement.
+    """
+    regions = [0] * len(walk)
+    region = 0
+    for seed, open_cell in enumerate(walk):
+        if not open_cell or regions[seed]:
+            continue
+        region += 1
+        regions[seed] = region
+        stack = [seed]
+        while stack:
+            i = stack.pop()
+            for j in (i + 1, i - 1, i + width, i - width):
+                if walk[j] and not regions[j]:
+                    regions[j] = region
+                    stack.append(j)
+    return regions
+
+
+class Pathfinder:
+    """A* with jump point search over the world's walkable layer (8 directions).
+
+    Jump distances are precomputed for the whole map (JPS+), so a search only touches jump
+    points and each jump is a table lookup. Tables and cached paths are keyed by the world's
+    walkability version: any change to the walkable layer rebuilds them on the next query.
+
+    Everything a search reads or writes is a flat array indexed by padded cell: the jump
+    tables, the region labels (a goal in another region is rejected without searching) and
+    the per-cell search state, reset by bumping a search stamp instead of being cleared.
+    The heuristic is weighted: with clutter the plain octile distance leaves thousands of
+    near-equal jump points to expand, the weighted one goes for the goal and returns a path
+    at most weight times longer than the shortest (a few percent longer in practice).
+    """
+
+    def __init__(self, world, cache_size=1024, weight=1.5):
+        self.world = world
+        self.cache_size = cache_size
+        self.weight = weight
+        self.cache = OrderedDict()  # (start, goal, version) -> path, least recently used first
+        self.version = None
+        self.width = 0  # Padded table size
+        self.height = 0
+        self.regions = array("i")
+        self.jumps = []  # Jump table per direction index (DIRECTIONS order)
+        self.moves = []  # Arrival direction index (START for the start cell) -> pruned moves
+        # Search state per cell, valid where opened / closed hold the current search stamp
+        self.g = array("d")
+        self.parents = array("i")
+        self.arrival = array("b")
+        self.opened = array("I")
+        self.closed = array("I")
+        self.searches = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _sync(self):
+        """Rebuild the jump tables if walkability changed since the last query"""
+        version = self.world.walkable_version
+        if version == self.version:
+            return
+        walk, tables = build_jump_tables(self.world.walkable)
+        self.height, self.width = walk.shape
+        size = walk.size
+        self.regions = _flat_array("i", label_regions(walk.ravel().tolist(), self.width))
+        self.jumps = [_flat_array("i", tables[direction]) for direction in DIRECTIONS]
+        # Pruned moves with their flat index offset, cost per step and jump table
+        self.moves = [tuple((d, DIRECTIONS[d][0], DIRECTIONS[d][1], DIRECTIONS[d][1] * self.width + DIRECTIONS[d][0],
+                             SQRT2 if d >= 4 else 1.0, self.jumps[d]) for d in moves)
+                      for moves in _MOVES]
+        self.g = array("d", bytes(8 * size))
+        self.parents = _flat_array("i", np.full(size, -1))
+        self.arrival = array("b", bytes(size))
+        self.opened = array("I", bytes(4 * size))
+        self.closed = array("I", bytes(4 * size))
+        self.searches = 0
+        self.cache.clear()
+        self.version = version
+        print(f"[PATH] Jump tables built for {walk.shape[1] - 2}x{walk.shape[0] - 2} (walkability v{version})")
+
+    @property
+    def nbytes(self):
+        arrays = [self.regions, self.g, self.parents, self.arrival, self.opened, self.closed] + self.jumps
+        return sum(len(values) * values.itemsize for values in arrays)
+
+    def find_path(self, start, goal):
+        """Cells from start to goal (both included) as a tuple of (x, y), or None if unreachable"""
+        self._sync()
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        key = (start, goal, self.version)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+
+        self.misses += 1
+        path = self._search(start, goal)
+        self.cache[key] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return path
+
+    def _index(self, x, y):
+        """Flat index of world cell (x, y) in the padded tables, or None if off the map"""
+        if 0 <= x < self.width - 2 and 0 <= y < self.height - 2:
+            return (y + 1) * self.width + x + 1
+        return None
+
+    def _search(self, start, goal):
+        start_i = self._index(*start)
+        goal_i = self._index(*goal)
+        regions = self.regions
+        if start_i is None or goal_i is None or not regions[start_i] or regions[start_i] != regions[goal_i]:
+            return None
+        if start_i == goal_i:
+            return (start,)
+
+        self.searches += 1
+        search = self.searches
+        width, weight, moves = self.width, self.weight, self.moves
+        g, parents, arrival, opened, closed = self.g, self.parents, self.arrival, self.opened, self.closed
+        goal_y, goal_x = divmod(goal_i, width)
+        diagonal_bonus = SQRT2 - 2  # Octile distance = ax + ay + (SQRT2 - 2) * min(ax, ay)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        g[start_i] = 0.0
+        parents[start_i] = -1
+        arrival[start_i] = START
+        opened[start_i] = search
+        # (f, h, node): ties on f go to the node closest to the goal
+        open_heap = [(0.0, 0.0, start_i)]
+
+        while open_heap:
+            i = heappop(open_heap)[2]
+            if i == goal_i:
+                return self._reconstruct(goal_i)
+            if closed[i] == search:
+                continue  # Stale entry, i was expanded through a shorter way
+            closed[i] = search
+            cost = g[i]
+            y, x = divmod(i, width)
+            to_goal_x, to_goal_y = goal_x - x, goal_y - y
+            goal_ax = to_goal_x if to_goal_x > 0 else -to_goal_x
+            goal_ay = to_goal_y if to_goal_y > 0 else -to_goal_y
+            # The goal can be reached before the next jump point along the move pointing at it:
+            # straight when it is on our row / column, else diagonal up to its row / column
+            toward = _TOWARD[(to_goal_y > 0) - (to_goal_y < 0) + 1][(to_goal_x > 0) - (to_goal_x < 0) + 1]
+            goal_steps = goal_ax + goal_ay if not (goal_ax and goal_ay) else goal_ax if goal_ax < goal_ay else goal_ay
+
+            for direction, dx, dy, offset, step_cost, table in moves[arrival[i]]:
+                distance = table[i]
+                if direction == toward and (goal_steps <= distance or goal_steps <= -distance):
+                    steps = goal_steps
+                elif distance > 0:
+                    steps = distance
+                else:
+                    continue
+
+                successor = i + steps * offset
+                if closed[successor] == search:
+                    continue
+                new_g = cost + steps * step_cost
+                if opened[successor] != search or new_g < g[successor]:
+                    opened[successor] = search
+                    g[successor] = new_g
+                    parents[successor] = i
+                    arrival[successor] = direction
+                    ax = to_goal_x - steps * dx
+                    ay = to_goal_y - steps * dy
+                    if ax < 0:
+                        ax = -ax
+                    if ay < 0:
+                        ay = -ay
+                    h = ax + ay + diagonal_bonus * (ax if ax < ay else ay)
+                    heappush(open_heap, (new_g + weight * h, h, successor))
+        return None
+
+    def _reconstruct(self, goal_i):
+        """Expand the jump point chain into consecutive cells"""
+        width, parents = self.width, self.parents
+        jump_points = []
+        i = goal_i
+        while i >= 0:
+            jump_points.append(i)
+            i = parents[i]
+        jump_points.reverse()
+
+        # Padded indices are shifted back to world cells on the way: (x - 1, y - 1)
+        y0, x0 = divmod(jump_points[0] - width - 1, width)
+        cells = [(x0, y0)]
+        for i in jump_points[1:]:
+            y1, x1 = divmod(i - width - 1, width)
+            if -1 <= x1 - x0 <= 1 and -1 <= y1 - y0 <= 1:
+                cells.append((x1, y1))  # Neighbouring jump points, common in clutter
+            else:
+                dx = (x1 > x0) - (x1 < x0)
+                dy = (y1 > y0) - (y1 < y0)
+                steps = max(abs(x1 - x0), abs(y1 - y0))
+                xs = range(x0 + dx, x1 + dx, dx) if dx else repeat(x0, steps)
+                ys = range(y0 + dy, y1 + dy, dy) if dy else repeat(y0, steps)
+                cells.extend(zip(xs, ys))
+            x0, y0 = x1, y1
+        return tuple(cells)
+
+    def log_stats(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        print(f"[PATH] {total} queries, cache hits {rate:.0f}%, {len(self.cache)} cached paths")
+
+
+class DistanceField:
+    """Distance to one goal cell from every walkable cell, for many agents sharing that goal.
+
+    Built with a bucket-queue Dijkstra (integer costs: 10 straight, 14 diagonal) from the goal
+    outwards. Besides the distance, each cell stores the neighbour to step to, so an agent
+    follows the field with one lookup per move instead of its own path search. The field is
+    only rebuilt when the goal cell or the world's walkability changes.
+    """
+
+    STRAIGHT_COST = 10
+    DIAGONAL_COST = 14
+
+    def __init__(self, world):
+        self.world = world
+        self.goal = None
+        self.version = None
+        self.distances = np.zeros((0, 0))            # [y, x] distance in tiles, inf if unreachable
+        self.toward = np.zeros((0, 0, 2), dtype=np.int32)  # [y, x] -> (x, y) of the next cell, -1 if none
+        self.builds = 0
+
+    def update(self, goal):
+        """Rebuild the field if the goal cell or walkability changed; True if it was rebuilt"""
+        goal = (int(round(goal[0])), int(round(goal[1])))
+        if goal == self.goal and self.world.walkable_version == self.version:
+            return False
+        self.goal = goal
+        self.version = self.world.walkable_version
+        self._build()
+        self.builds += 1
+        return True
+
+    def _build(self):
+        walkable = self.world.walkable
+        height, width = walkable.shape[0] + 2, walkable.shape[1] + 2
+        padded = np.zeros((height, width), dtype=bool)
+        padded[1:-1, 1:-1] = walkable
+        walk = padded.ravel().tolist()
+
+        distances = [-1] * len(walk)
+        toward = [-1] * len(walk)
+        goal_x, goal_y = self.goal
+        if 0 <= goal_x < width - 2 and 0 <= goal_y < height - 2 and walk[(goal_y + 1) * width + goal_x + 1]:
+            goal_i = (goal_y + 1) * width + goal_x + 1
+            distances[goal_i] = 0
+            toward[goal_i] = goal_i
+            # (offset, cost, side cells that must be open for a diagonal step)
+            moves = [(1, self.STRAIGHT_COST, 0, 0), (-1, self.STRAIGHT_COST, 0, 0),
+                     (width, self.STRAIGHT_COST, 0, 0), (-width, self.STRAIGHT_COST, 0, 0)]
+            moves += [(dy * width + dx, self.DIAGONAL_COST, dx, dy * width)
+                      for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1))]
+            buckets = [[goal_i]]
+            distance = 0
+            while distance < len(buckets):
+                for i in buckets[distance]:
+                    if distances[i] != distance:
+                        continue  # Reached by a shorter way after it was queued
+                    for offset, cost, side_x, side_y in moves:
+                        j = i + offset
+                        if not walk[j] or (side_x and not (walk[i + side_x] and walk[i + side_y])):
+                            continue
+                        new_distance = distance + cost
+                        if distances[j] < 0 or new_distance < distances[j]:
+                            distances[j] = new_distance
+                            toward[j] = i  # Moves are symmetric: j steps back along the relaxed edge
+                            if new_distance >= len(buckets):
+                                buckets.extend([] for _ in range(new_distance - len(buckets) + 1))
+                            buckets[new_distance].append(j)
+                buckets[distance] = None
+                distance += 1
+
+        distance_array = np.asarray(distances, dtype=np.float64).reshape(height, width)[1:-1, 1:-1]
+        self.distances = np.where(distance_array < 0, np.inf, distance_array / self.STRAIGHT_COST)
+        toward_array = np.asarray(toward, dtype=np.int64).reshape(height, width)[1:-1, 1:-1]
+        toward_y, toward_x = np.divmod(toward_array, width)
+        self.toward = np.where((toward_array < 0)[..., None], -1,
+                               np.stack((toward_x - 1, toward_y - 1), axis=-1)).astype(np.int32)
+
+    def _in_bounds(self, x, y):
+        return 0 <= x < self.distances.shape[1] and 0 <= y < self.distances.shape[0]
+
+    def distance(self, x, y):
+        """Distance in tiles from (x, y) to the goal, inf if unreachable"""
+        x, y = int(round(x)), int(round(y))
+        return float(self.distances[y, x]) if self._in_bounds(x, y) else np.inf
+
+    def next_cell(self, x, y):
+        """Cell to step to from (x, y) toward the goal (the goal itself once there), or None"""
+        x, y = int(round(x)), int(round(y))
+        if not self._in_bounds(x, y) or self.toward[y, x, 0] < 0:
+            return None
+        return (int(self.toward[y, x, 0]), int(self.toward[y, x, 1]))
+
+    def next_cells(self, positions):
+        """Vectorized next_cell: (N, 2) grid positions -> (N, 2) cells, -1 rows where unreachable"""
+        cells = np.rint(np.asarray(positions, dtype=np.float64)).astype(np.int64)
+        height, width = self.distances.shape
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < width) & (cells[:, 1] >= 0) & (cells[:, 1] < height)
+        result = np.full(cells.shape, -1, dtype=np.int32)
+        result[inside] = self.toward[cells[inside, 1], cells[inside, 0]]
+        return result
+
+
+class PathPlanner:
+    """Queue of path requests solved within a per-frame time budget.
+
+    Agents that need a path (patrols, wanderers) enqueue a request with a callback instead of
+    searching immediately; process() is called once per frame and solves requests until the
+    budget is spent, so many agents replanning at once spread over several frames instead of
+    causing a spike. At least one request is solved per call so the queue always drains.
+    A new request from an agent that is still waiting replaces its old one in place.
+    """
+
+    def __init__(self, world, budget_ms=2.0):
+        self.world = world
+        self.budget_ms = budget_ms
+        self.pending = OrderedDict()  # requester -> (start, goal, callback, enqueue time)
+        self.solved = 0
+        self.max_queue_length = 0
+        self.overruns = 0          # Frames where processing went past the budget
+        self.worst_overrun_ms = 0.0
+        self.total_wait_ms = 0.0   # Time requests spent queued before being solved
+
+    def __len__(self):
+        return len(self.pending)
+
+    def request(self, requester, start, goal, callback):
+        """Queue a path search for a moving entity; callback(path or None) runs when it is solved"""
+        enqueued = self.pending[requester][3] if requester in self.pending else time.perf_counter()
+        self.pending[requester] = (start, goal, callback, enqueued)
+        self.max_queue_length = max(self.max_queue_length, len(self.pending))
+
+    def cancel(self, requester):
+        self.pending.pop(requester, None)
+
+    def process(self):
+        """Solve queued requests until the frame budget is spent; return how many were solved"""
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000.0
+        solved = 0
+        while self.pending:
+            requester, (start, goal, callback, enqueued) = self.pending.popitem(last=False)
+            path = self.world.find_path(start, goal, requester)
+            now = time.perf_counter()
+            self.total_wait_ms += (now - enqueued) * 1000.0
+            solved += 1
+            callback(path)
+            if now >= deadline:
+                break
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if elapsed_ms > self.budget_ms:
+            self.overruns += 1
+            self.worst_overrun_ms = max(self.worst_overrun_ms, elapsed_ms - self.budget_ms)
+        self.solved += solved
+        return solved
+
+    def stats(self):
+        return {
+            "queue_length": len(self.pending),
+            "max_queue_length": self.max_queue_length,
+            "solved": self.solved,
+            "average_wait_ms": self.total_wait_ms / self.solved if self.solved else 0.0,
+            "overruns": self.overruns,
+            "worst_overrun_ms": self.worst_overrun_ms,
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        print(f"[PATH] Planner: {stats['queue_length']} queued (max {stats['max_queue_length']}), "
+              f"{stats['solved']} solved, wait {stats['average_wait_ms']:.1f} ms avg, "
+              f"{stats['overruns']} budget overruns (worst +{stats['worst_overrun_ms']:.2f} ms)")
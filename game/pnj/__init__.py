@@ -1,8 +1,6 @@
-# Package PNJ - Contient tous les personnages non-joueurs du jeu
+# Package PNJ - Un PNJ générique construit depuis les définitions de data/pnj/definitions.json
 
-from .dame_indenta import DameIndenta
-from .neuill import Neuill
-from .json import JSON
-from .loopfang import Loopfang
+from .definitions import PNJDefinition, load_pnj_definitions
+from .pnj import PNJ
 
-__all__ = ['DameIndenta', 'Neuill', 'JSON', 'Loopfang']
+__all__ = ['PNJ', 'PNJDefinition', 'load_pnj_definitions']
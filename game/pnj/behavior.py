@@ -0,0 +1,92 @@
+# === game/pnj/behavior.py ===
+"""Comportements de déplacement des PNJ (patrouille, errance), décrits dans data/pnj/definitions.json.
+
+Un comportement alterne pause, demande de chemin et déplacement. Les chemins ne sont pas
+calculés sur place : la demande part dans la file du PathPlanner, traitée avec un budget
+de temps par image, et le PNJ repart quand sa réponse arrive.
+"""
+
+
+class Behavior:
+    """Cycle commun : pause -> demande de chemin -> déplacement -> pause"""
+
+    def __init__(self, manager, data):
+        self.manager = manager
+        self.speed = data.get("speed", 1.0)  # Cases par seconde
+        self.pause = tuple(data.get("pause", (1000, 3000)))  # Durée des pauses en ms (min, max)
+        self.state = "idle"
+        self.timer = manager.rng.uniform(*self.pause)
+
+    def next_goal(self, npc):
+        """Prochaine case à atteindre (None : rester sur place)"""
+        raise NotImplementedError()
+
+    def update(self, npc, dt):
+        if self.state == "idle":
+            self.timer -= dt
+            if self.timer <= 0:
+                goal = self.next_goal(npc)
+                if goal is None or tuple(goal) == npc.get_grid_position():
+                    self._rest()
+                    return
+                self.state = "planning"
+                self.manager.planner.request(npc, npc.get_grid_position(), goal,
+                                             lambda path: self._on_path(npc, path))
+        elif self.state == "moving" and not self.manager.is_following_path(npc):
+            self._rest()
+
+    def _on_path(self, npc, path):
+        if self.state != "planning":
+            return
+        if path and len(path) > 1:
+            self.manager.follow_path(npc, path, self.speed)
+            self.state = "moving"
+        else:
+            self._rest()
+
+    def _rest(self):
+        self.state = "idle"
+        self.timer = self.manager.rng.uniform(*self.pause)
+
+
+class WanderBehavior(Behavior):
+    """Errance autour du point d'apparition, dans un rayon donné"""
+
+    def __init__(self, manager, data, home):
+        super().__init__(manager, data)
+        self.home = tuple(home)
+        self.radius = data.get("radius", 3)
+
+    def next_goal(self, npc):
+        rng = self.manager.rng
+        x = self.home[0] + rng.randint(-self.radius, self.radius)
+        y = self.home[1] + rng.randint(-self.radius, self.radius)
+        return self.manager.world.find_nearest_walkable(x, y)
+
+
+class PatrolBehavior(Behavior):
+    """Ronde en boucle sur une liste de cases"""
+
+    def __init__(self, manager, data):
+        super().__init__(manager, data)
+        self.points = [tuple(point) for point in data.get("points", [])]
+        self.index = 0
+
+    def next_goal(self, npc):
+        if not self.points:
+            return None
+        goal = self.points[self.index]
+        self.index = (self.index + 1) % len(self.points)
+        return goal
+
+
+def create_behavior(data, manager, home):
+    """Comportement décrit par l'entrée "behavior" d'une définition (None si absent)"""
+    if not data:
+        return None
+    if data.get("type") == "wander":
+        return WanderBehavior(manager, data, home)
+    if data.get("type") == "patrol":
+        return PatrolBehavior(manager, data)
+    print(f"[PNJ] Comportement inconnu: {data.get('type')}")
+    return None
@@ -0,0 +1,59 @@
+# === game/pnj/definitions.py ===
+"""Définitions des PNJ lues depuis data/pnj/definitions.json.
+
+Chaque entrée décrit un PNJ : spritesheet et découpage, animations, buste, spawn, textes de
+dialogue et quêtes. Ajouter un PNJ = ajouter une entrée, sans nouvelle classe.
+"""
+import json
+
+from core.settings import PNJ_DATA_PATH
+from game.animation import build_animations
+
+_definitions = {}
+
+
+def _as_tuple(value):
+    """Les listes JSON deviennent des tuples (clés de cache de l'AssetManager)"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+class PNJDefinition:
+    """Données d'un type de PNJ, partagées par toutes ses instances"""
+
+    def __init__(self, name, data):
+        self.name = name
+        sprite = data["sprite"]
+        self.sprite_path = sprite["path"]
+        # Découpage et échelle, passés tels quels à AssetManager.acquire / masks
+        self.sprite_spec = {key: _as_tuple(sprite[key])
+                            for key in ("frame_size", "grid", "count", "indices", "scale") if key in sprite}
+        placeholder = sprite.get("placeholder", {})
+        self.placeholder_size = tuple(placeholder.get("size", (48, 96)))
+        self.placeholder_color = tuple(placeholder.get("color", (255, 0, 255)))
+
+        # Séquences précalculées (liste de frames, ou {"frames", "durations"} pour des durées variables)
+        self.frame_delay = data.get("frame_delay", 200)
+        self.animations = build_animations(data.get("animations", {"idle": [0]}), self.frame_delay)
+        self.animation = data.get("animation", next(iter(self.animations)))
+
+        self.behavior = data.get("behavior")  # Patrouille / errance (game/pnj/behavior.py)
+
+        self.bust_path = data.get("bust")
+        self.map = data.get("map", "clairiere")  # Carte où le PNJ apparaît (nom de fichier sans .json)
+        self.spawn = _as_tuple(data.get("spawn"))
+        self.hp = data.get("hp", 1)
+        self.attack_damage = data.get("attack_damage", 1)
+
+        self.dialogue = data.get("dialogue", {})
+        self.dialogue_code = self.dialogue.get("code")
+        self.quests = data.get("quests", {})
+
+
+def load_pnj_definitions(path=PNJ_DATA_PATH):
+    """Retourne {nom: PNJDefinition} dans l'ordre du fichier (lu une seule fois)"""
+    if path not in _definitions:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _definitions[path] = {name: PNJDefinition(name, entry) for name, entry in data.items()}
+        print(f"[PNJ] {len(_definitions[path])} définitions chargées depuis {path}")
+    return _definitions[path]
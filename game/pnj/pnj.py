@@ -0,0 +1,304 @@
+import pygame
+import os
+from core.settings import get_grimoire_path
+from core.analyze import analyser_script
+from core.assets import AssetManager
+from game.entity import Entity
+from game.components import ComponentStore
+from game.animation import AnimationController
+
+# Textes communs quand la définition n'en fournit pas
+OFFLINE_MESSAGES = [
+    "Je ne peux pas vérifier tes quêtes sans accéder à ta session...",
+    "Assure-toi d'être connecté correctement !"
+]
+NO_GRIMOIRE_MESSAGE = "Je ne trouve pas ton grimoire..."
+
+
+class PNJ(Entity):
+    """PNJ générique construit depuis une PNJDefinition (data/pnj/definitions.json).
+
+    Les frames passent par l'AssetManager : toutes les instances d'une même définition
+    partagent la feuille décodée et ses masques. Le buste n'est chargé qu'au premier accès.
+
+    Position, vitesse et début de l'animation courante sont une ligne d'un ComponentStore :
+    le PNJManager déplace tous ses PNJ d'un coup (ComponentStore.integrate). La frame affichée
+    se déduit de l'horloge partagée (AnimationController), sans compteur par PNJ.
+    """
+
+    __slots__ = ("definition", "store", "row", "movement_type", "sprite_path", "bust_path",
+                 "dialog_state", "has_given_quests", "asset_handles", "_bust", "_bust_loaded",
+                 "frames", "animations", "_current_animation", "behavior")
+
+    def __init__(self, definition, grid_pos=None, name=None, store=None):
+        # Ligne de composants (store privé si le PNJ n'est pas géré par un PNJManager)
+        self.store = store if store is not None else ComponentStore(capacity=1)
+        self.definition = definition
+        self.animations = definition.animations
+        self._current_animation = definition.animation
+        self.row = self.store.add(self, anim_start=AnimationController.get_instance().time)
+
+        super().__init__(grid_pos if grid_pos is not None else definition.spawn or (16, 16),
+                         name or definition.name)
+
+        # UNIFIED: Set movement type for NPCs (tile-based with smooth animations)
+        self.movement_type = "tile_based"
+        self.behavior = None  # Patrouille / errance, attribuée par le PNJManager
+
+        self.sprite_path = definition.sprite_path
+        self.bust_path = definition.bust_path
+        self.dialog_state = 0
+        self.has_given_quests = False
+
+        # Combat stats
+        self.current_hp = definition.hp
+        self.max_hp = definition.hp
+
+        # Chargement des ressources (buste : à la demande)
+        self.asset_handles = []
+        self._bust = None
+        self._bust_loaded = False
+        self.frames = self.load_frames()
+
+    # === Composants (lignes du ComponentStore) ===
+
+    @property
+    def grid_pos(self):
+        x, y = self.store.positions[self.row]
+        return [int(round(x)), int(round(y))]
+
+    @grid_pos.setter
+    def grid_pos(self, value):
+        # Placement (spawn, teleport): no interpolation from the old position
+        self.store.positions[self.row] = value
+        self.store.previous_positions[self.row] = value
+
+    def get_position(self):
+        """Position flottante (déplacements continus des créatures)"""
+        x, y = self.store.positions[self.row]
+        return (float(x), float(y))
+
+    def get_render_position(self, alpha):
+        """Position interpolée entre les deux derniers pas de simulation"""
+        (px, py), (x, y) = self.store.previous_positions[self.row], self.store.positions[self.row]
+        return (float(px + (x - px) * alpha), float(py + (y - py) * alpha))
+
+    @property
+    def velocity(self):
+        """Vitesse en cases par seconde"""
+        vx, vy = self.store.velocities[self.row]
+        return (float(vx), float(vy))
+
+    @velocity.setter
+    def velocity(self, value):
+        self.store.velocities[self.row] = value
+
+    @property
+    def frame_index(self):
+        """Position dans l'animation courante, d'après l'horloge partagée"""
+        animation = self.animations.get(self._current_animation)
+        if animation is None:
+            return 0
+        return animation.index_at(AnimationController.get_instance().elapsed(self.store.anim_start[self.row]))
+
+    @property
+    def frame_delay(self):
+        return self.definition.frame_delay
+
+    @property
+    def current_animation(self):
+        return self._current_animation
+
+    @current_animation.setter
+    def current_animation(self, name):
+        if name != self._current_animation:
+            # La nouvelle animation repart de sa première frame
+            self._current_animation = name
+            self.store.anim_start[self.row] = AnimationController.get_instance().time
+
+    def _acquire(self, path, **spec):
+        """Charge une ressource via l'AssetManager et garde le handle"""
+        handle = AssetManager.get_instance().acquire(path, **spec)
+        self.asset_handles.append(handle)
+        return handle.value
+
+    def _load_image(self, path):
+        if path:
+            try:
+                return self._acquire(path)
+            except (FileNotFoundError, pygame.error):
+                print(f"[PNJ] ATTENTION: Impossible de charger l'image {path}")
+        return None
+
+    @property
+    def bust(self):
+        """Buste du PNJ, chargé au premier accès"""
+        if not self._bust_loaded:
+            self._bust_loaded = True
+            self._bust = self._load_image(self.bust_path)
+        return self._bust
+
+    def release_assets(self):
+        """Rend les images à l'AssetManager"""
+        for handle in self.asset_handles:
+            handle.release()
+        self.asset_handles = []
+        self._bust = None
+        self._bust_loaded = False
+
+    def load_frames(self):
+        """Découpe le spritesheet selon la définition (frames partagées via l'AssetManager)"""
+        spec = self.definition.sprite_spec
+        try:
+            frames = self._acquire(self.sprite_path, **spec)
+        except (FileNotFoundError, pygame.error):
+            print(f"[PNJ] ATTENTION: Impossible de charger l'image {self.sprite_path}")
+            placeholder = pygame.Surface(self.definition.placeholder_size)
+            placeholder.fill(self.definition.placeholder_color)
+            return [placeholder]
+        # Masques de collision partagés avec le jeu de frames (clic et survol)
+        self.frame_masks = dict(zip(frames, AssetManager.get_instance().masks(self.sprite_path, **spec)))
+        return frames
+
+    def update(self, dt):
+        """UNIFIED: Update NPC (déplacements intégrés par le PNJManager, animation par l'horloge)"""
+        self.update_movement(dt)
+
+    def update_movement(self, dt):
+        """Fait avancer le comportement du PNJ (les vitesses sont intégrées par le PNJManager)"""
+        if self.behavior:
+            self.behavior.update(self, dt)
+
+    def get_current_frame(self):
+        """Retourne la frame actuelle à afficher"""
+        if not self.frames:
+            return None
+        animation = self.animations.get(self._current_animation)
+        if animation is not None:
+            frame_id = AnimationController.get_instance().frame(animation, self.store.anim_start[self.row])
+            if 0 <= frame_id < len(self.frames):
+                return self.frames[frame_id]
+        return self.frames[0]
+
+    # === Dialogue et quêtes ===
+
+    @property
+    def quests_given_key(self):
+        return self.definition.dialogue.get("quests_given_key", f"pnj_{self.name.lower()}_quests_given")
+
+    def say(self, message):
+        print(f"[DIALOG] {self.name} dit: {message}")
+
+    def _advance_intro(self, messages):
+        """Dit le message d'introduction courant ; retourne True quand le dernier vient d'être dit"""
+        if not messages:
+            return True
+        self.say(messages[self.dialog_state % len(messages)])
+        self.dialog_state = (self.dialog_state + 1) % len(messages)
+        return self.dialog_state == 0
+
+    def load_progress_from_session(self, session):
+        if session:
+            self.has_given_quests = session.get_progress(self.quests_given_key, False)
+            if self.has_given_quests:
+                self.dialog_state = 0
+            print(f"[DEBUG] Progression chargée pour {self.name}: quêtes données = {self.has_given_quests}")
+
+    def check_quests(self, player_name):
+        """Vérifie l'état des quêtes du joueur"""
+        if not player_name:
+            print(f"[DEBUG] Nom du joueur invalide: {player_name}")
+            return None
+
+        grimoire_path = get_grimoire_path(player_name)
+
+        if not os.path.exists(grimoire_path):
+            print(f"[DEBUG] Grimoire introuvable: {grimoire_path}")
+            return None
+
+        if not os.access(grimoire_path, os.R_OK):
+            print(f"[DEBUG] Grimoire non lisible: {grimoire_path}")
+            return None
+
+        if os.path.getsize(grimoire_path) == 0:
+            print(f"[DEBUG] Grimoire vide: {grimoire_path}")
+            return None
+
+        completed_quests = analyser_script(grimoire_path)
+        return completed_quests
+
+    def get_completion_message(self, quest_code):
+        """Retourne le message de félicitations pour une quête complétée"""
+        return self.definition.quests.get("completion_messages", {}).get(quest_code, "")
+
+    def speak(self):
+        """UNIFIED: Default speak method when no session available"""
+        dialogue = self.definition.dialogue
+        if not self.has_given_quests:
+            if self._advance_intro(dialogue.get("intro_offline", dialogue.get("intro", []))):
+                self.has_given_quests = True
+        else:
+            for message in dialogue.get("offline", OFFLINE_MESSAGES):
+                self.say(message)
+
+    def attack(self, target):
+        """Le PNJ attaque une cible"""
+        if hasattr(target, "current_hp"):
+            damage = self.definition.attack_damage
+            target.current_hp = max(0, target.current_hp - damage)
+            print(f"[COMBAT] {self.name} attaque {target.name if hasattr(target, 'name') else 'cible'} pour {damage} dégâts!")
+            return True
+        return False
+
+    def interact(self, session=None):
+        """Interaction quand le joueur clique sur le PNJ"""
+        if session:
+            self.interact_with_session(session)
+        else:
+            self.speak()
+
+    def interact_with_session(self, session):
+        """Interaction avec accès à la session du joueur"""
+        self.load_progress_from_session(session)
+
+        if not self.has_given_quests:
+            if self._advance_intro(self.definition.dialogue.get("intro", [])):
+                self.has_given_quests = True
+                session.set_progress(self.quests_given_key, True)
+                session.save_data()
+        elif not self.definition.quests:
+            for message in self.definition.dialogue.get("quests_given", []):
+                self.say(message)
+        else:
+            self.report_quest_progress(session)
+
+    def report_quest_progress(self, session):
+        """Félicite le joueur pour les quêtes de ce PNJ accomplies depuis la dernière visite"""
+        quests = self.definition.quests
+        completed = self.check_quests(session.name)
+
+        if completed is None:
+            self.say(quests.get("no_grimoire", NO_GRIMOIRE_MESSAGE))
+            return
+
+        quest_codes = quests.get("codes", [])
+        completed_now = [q for q in quest_codes if q in completed]
+
+        progress_key = quests.get("progress_key", f"{self.name.lower()}_completed_quests")
+        previously_completed = session.get_progress(progress_key, [])
+        new_completions = [q for q in completed_now if q not in previously_completed]
+
+        if new_completions:
+            for quest in new_completions:
+                self.say(self.get_completion_message(quest))
+            session.set_progress(progress_key, completed_now)
+            session.save_data()
+
+            # Toutes les quêtes du PNJ sont complétées
+            if len(completed_now) == len(quest_codes):
+                for message in quests.get("all_done", []):
+                    self.say(message)
+        elif completed_now:
+            self.say(quests.get("some_done", "").format(count=len(completed_now)))
+        else:
+            self.say(quests.get("none_done", ""))
@@ -0,0 +1,102 @@
+import math
+
+
+class SpatialHash:
+    """Uniform grid index over entity grid positions.
+
+    Entities are bucketed by (x // cell_size, y // cell_size); queries only look at the
+    buckets they overlap instead of scanning every entity. Positions are updated
+    incrementally through move() whenever an entity changes tile.
+    """
+
+    def __init__(self, cell_size=4):
+        self.cell_size = cell_size
+        self.buckets = {}    # (bx, by) -> set of entities
+        self.positions = {}  # entity -> (x, y) grid position
+
+    def _bucket(self, x, y):
+        return (int(math.floor(x)) // self.cell_size, int(math.floor(y)) // self.cell_size)
+
+    def __contains__(self, entity):
+        return entity in self.positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def insert(self, entity, pos):
+        """Add (or move) an entity at a grid position"""
+        if entity in self.positions:
+            self.move(entity, pos)
+            return
+        pos = (pos[0], pos[1])
+        self.positions[entity] = pos
+        self.buckets.setdefault(self._bucket(*pos), set()).add(entity)
+
+    def remove(self, entity):
+        pos = self.positions.pop(entity, None)
+        if pos is None:
+            return
+        key = self._bucket(*pos)
+        bucket = self.buckets.get(key)
+        if bucket:
+            bucket.discard(entity)
+            if not bucket:
+                del self.buckets[key]
+
+    def move(self, entity, pos):
+        """Update an entity position, touching buckets only when it crosses one"""
+        old = self.positions.get(entity)
+        if old is None:
+            self.insert(entity, pos)
+            return
+        pos = (pos[0], pos[1])
+        old_key, new_key = self._bucket(*old), self._bucket(*pos)
+        self.positions[entity] = pos
+        if old_key != new_key:
+            bucket = self.buckets.get(old_key)
+            if bucket:
+                bucket.discard(entity)
+                if not bucket:
+                    del self.buckets[old_key]
+            self.buckets.setdefault(new_key, set()).add(entity)
+
+    def get_position(self, entity):
+        return self.positions.get(entity)
+
+    def entities_at(self, cell):
+        """Entities standing on a grid cell"""
+        x, y = cell
+        bucket = self.buckets.get(self._bucket(x, y), ())
+        return [e for e in bucket if self.positions[e] == (x, y)]
+
+    def entities_in_rect(self, min_x, min_y, max_x, max_y):
+        """Entities whose grid position lies in [min, max] (inclusive)"""
+        bx0, by0 = self._bucket(min_x, min_y)
+        bx1, by1 = self._bucket(max_x, max_y)
+        found = []
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                for entity in self.buckets.get((bx, by), ()):
+                    x, y = self.positions[entity]
+                    if min_x <= x <= max_x and min_y <= y <= max_y:
+                        found.append(entity)
+        return found
+
+    def entities_near(self, x, y, radius):
+        """Entities within a euclidean grid distance, closest first"""
+        candidates = self.entities_in_rect(x - radius, y - radius, x + radius, y + radius)
+        by_distance = []
+        for entity in candidates:
+            ex, ey = self.positions[entity]
+            distance = math.hypot(ex - x, ey - y)
+            if distance <= radius:
+                by_distance.append((distance, entity))
+        by_distance.sort(key=lambda item: item[0])
+        return [entity for _, entity in by_distance]
+
+    def nearest(self, x, y, radius, predicate=None):
+        """Closest entity within radius (optionally matching predicate), or None"""
+        for entity in self.entities_near(x, y, radius):
+            if predicate is None or predicate(entity):
+                return entity
+        return None
@@ -0,0 +1,280 @@
+# === game/tileset.py ===
+import hashlib
+import json
+import math
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pygame
+
+from core.settings import TILESET_PATH, CACHE_DIR
+from core.assets import AssetManager, asset_exists, list_asset_dir, open_asset
+
+# Les 3 bits de poids fort d'un gid Tiled encodent les retournements
+GID_MASK = 0x1FFFFFFF
+
+# Propriétés de tuiles lues dans les tilesets : nom -> (type NumPy, valeur par défaut)
+TILE_PROPERTIES = {
+    "walkable": (np.bool_, True),       # Case praticable si la couche praticable porte cette tuile
+    "blocks_sight": (np.bool_, False),  # Tuile opaque pour les lignes de vue
+    "z_height": (np.float32, 0.0),      # Hauteur de la tuile (en niveaux de couche)
+    "animated": (np.bool_, False),      # Tuile animée (<animation> dans le .tsx)
+}
+
+
+def _property_value(kind, value):
+    """Valeur d'une propriété Tiled selon son type ("bool", "int", "float", sinon texte)"""
+    if kind == "bool":
+        return value in (True, "true")
+    if kind == "int":
+        return int(value)
+    if kind == "float":
+        return float(value)
+    return value
+
+
+class Tileset:
+    """Tileset Tiled (.tsx ou embarqué) : id local -> chemin de l'image"""
+
+    def __init__(self, firstgid, name, tiles, properties=None, source=None):
+        self.firstgid = firstgid
+        self.name = name
+        self.tiles = tiles  # id local -> chemin image
+        self.properties = properties or {}  # id local -> {nom: valeur}
+        self.source = source  # Chemin du .tsx (None si embarqué)
+
+    @classmethod
+    def from_tsx(cls, path, firstgid):
+        """Lit un tileset de type 'collection of images'"""
+        with open_asset(path) as f:
+            root = ET.parse(f).getroot()
+        base_dir = os.path.dirname(path)
+        tiles = {}
+        properties = {}
+        for tile in root.findall("tile"):
+            tile_id = int(tile.get("id"))
+            image = tile.find("image")
+            if image is not None:
+                tiles[tile_id] = os.path.normpath(os.path.join(base_dir, image.get("source")))
+            values = {prop.get("name"): _property_value(prop.get("type"), prop.get("value"))
+                      for prop in tile.findall("properties/property")}
+            if tile.find("animation") is not None:
+                values.setdefault("animated", True)
+            if values:
+                properties[tile_id] = values
+        tileset = cls(firstgid, root.get("name", os.path.basename(path)), tiles, properties, path)
+        tileset._resolve_missing_sources()
+        return tileset
+
+    @classmethod
+    def from_embedded(cls, data, map_dir):
+        """Lit un tileset embarqué dans le JSON de la carte"""
+        tiles = {tile["id"]: os.path.normpath(os.path.join(map_dir, tile["image"]))
+                 for tile in data.get("tiles", []) if "image" in tile}
+        properties = {}
+        for tile in data.get("tiles", []):
+            values = {prop["name"]: _property_value(prop.get("type"), prop["value"])
+                      for prop in tile.get("properties", [])}
+            if "animation" in tile:
+                values.setdefault("animated", True)
+            if values:
+                properties[tile["id"]] = values
+        tileset = cls(data.get("firstgid", 1), data.get("name", "embedded"), tiles, properties)
+        tileset._resolve_missing_sources()
+        return tileset
+
+    def _resolve_missing_sources(self):
+        """Les images du .tsx sont numérotées à partir de 000 alors que les fichiers sur disque
+        commencent à 001 : si une source manque, on associe les ids dans l'ordre des fichiers du dossier."""
+        missing = [tile_id for tile_id, path in self.tiles.items() if not asset_exists(path)]
+        if not missing:
+            return
+        tiles_dir = os.path.dirname(self.tiles[missing[0]])
+        files = [os.path.join(tiles_dir, f) for f in list_asset_dir(tiles_dir) if f.endswith(".png")]
+        if not files:
+            return
+        for order, tile_id in enumerate(sorted(self.tiles)):
+            if order < len(files):
+                self.tiles[tile_id] = files[order]
+        print(f"[TILESET] {len(missing)} sources manquantes dans {self.name}, association par ordre des fichiers")
+
+    def gids(self):
+        """Itère sur (gid, chemin image)"""
+        for tile_id, path in sorted(self.tiles.items()):
+            yield self.firstgid + tile_id, path
+
+
+def load_map_tilesets(map_data, map_path):
+    """Retourne les tilesets référencés par une carte Tiled.
+
+    Un .tsx introuvable est remplacé par le tileset du projet (TILESET_PATH).
+    """
+    map_dir = os.path.dirname(map_path)
+    tilesets = []
+    for entry in map_data.get("tilesets", []):
+        firstgid = entry.get("firstgid", 1)
+        if "source" not in entry:
+            tilesets.append(Tileset.from_embedded(entry, map_dir))
+            continue
+        tsx_path = os.path.normpath(os.path.join(map_dir, entry["source"]))
+        if not asset_exists(tsx_path):
+            print(f"[TILESET] {entry['source']} introuvable, utilisation de {TILESET_PATH}")
+            tsx_path = TILESET_PATH
+        tilesets.append(Tileset.from_tsx(tsx_path, firstgid))
+    if not tilesets:
+        tilesets.append(Tileset.from_tsx(TILESET_PATH, 1))
+    return tilesets
+
+
+class TileProperties:
+    """Tables NumPy des propriétés de tuiles (TILE_PROPERTIES), indexées par gid.
+
+    Une case par gid des tilesets, plus une dernière pour les gids inconnus (valeurs par défaut).
+    Le gid 0 (pas de tuile) vaut zéro partout : ni praticable, ni opaque. Une couche entière se
+    convertit donc en une seule indexation, sans logique Python par tuile :
+    props.lookup("walkable", gids) -> tableau de booléens de la forme de gids.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables  # nom -> tableau [gid]
+
+    @classmethod
+    def from_tilesets(cls, tilesets):
+        last_gid = max((tileset.firstgid + tile_id for tileset in tilesets
+                        for tile_id in list(tileset.tiles) + list(tileset.properties)), default=0)
+        tables = {}
+        for name, (dtype, default) in TILE_PROPERTIES.items():
+            table = np.full(last_gid + 2, default, dtype=dtype)
+            table[0] = 0
+            tables[name] = table
+        for tileset in tilesets:
+            for tile_id, values in tileset.properties.items():
+                for name, value in values.items():
+                    if name in tables:
+                        tables[name][tileset.firstgid + tile_id] = value
+        return cls(tables)
+
+    def lookup(self, name, gids):
+        """Valeurs de la propriété pour un tableau de gids (retournements ignorés)"""
+        table = self.tables[name]
+        index = np.asarray(gids, dtype=np.uint32) & GID_MASK
+        return table[np.minimum(index, len(table) - 1)]
+
+    def count(self, name):
+        """Nombre de gids dont la propriété diffère de sa valeur par défaut"""
+        return int(np.count_nonzero(self.tables[name][1:-1] != TILE_PROPERTIES[name][1]))
+
+
+class TileAtlas:
+    """Toutes les tuiles pré-redimensionnées dans une seule surface, avec la table gid -> rect.
+
+    L'atlas est construit au premier lancement puis mis en cache dans CACHE_DIR : les lancements
+    suivants ne décodent qu'une image au lieu d'une par tuile.
+    """
+
+    def __init__(self, surface, rects, handle=None):
+        self.surface = surface
+        self.rects = rects  # gid -> pygame.Rect dans l'atlas
+        self.handle = handle
+        self.subsurfaces = {gid: surface.subsurface(rect) for gid, rect in rects.items()}
+
+    @staticmethod
+    def collect_sources(tilesets):
+        """Liste (gid, chemin) des images de tuiles présentes sur disque"""
+        return [(gid, path) for tileset in tilesets for gid, path in tileset.gids() if asset_exists(path)]
+
+    @classmethod
+    def cache_paths(cls, sources, tile_size):
+        """Chemins (image, index) de l'atlas en cache pour ces sources"""
+        signature = cls._signature(sources, tile_size)
+        return (os.path.join(CACHE_DIR, f"tile_atlas_{signature}.png"),
+                os.path.join(CACHE_DIR, f"tile_atlas_{signature}.json"))
+
+    @classmethod
+    def get_preload_paths(cls, tilesets, tile_size):
+        """Images à décoder pour obtenir l'atlas : l'atlas en cache, sinon chaque tuile"""
+        sources = cls.collect_sources(tilesets)
+        image_path, index_path = cls.cache_paths(sources, tile_size)
+        if os.path.exists(image_path) and os.path.exists(index_path):
+            return [image_path]
+        return [path for gid, path in sources]
+
+    @classmethod
+    def load_or_build(cls, tilesets, tile_size):
+        """Charge l'atlas en cache correspondant aux tilesets, ou le construit"""
+        sources = cls.collect_sources(tilesets)
+        image_path, index_path = cls.cache_paths(sources, tile_size)
+
+        if not (os.path.exists(image_path) and os.path.exists(index_path)):
+            surface, rects = cls.pack(sources, tile_size)
+            try:
+                cls._save(surface, rects, image_path, index_path)
+                print(f"[ATLAS] {len(rects)} tuiles empaquetées dans {image_path}")
+            except (OSError, pygame.error) as e:
+                print(f"[ATLAS] Cache non écrit ({e}), atlas gardé en mémoire")
+                return cls(surface.convert_alpha(), rects)
+
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        rects = {int(gid): pygame.Rect(rect) for gid, rect in index["rects"].items()}
+        handle = AssetManager.get_instance().acquire(image_path)
+        return cls(handle.value, rects, handle)
+
+    @staticmethod
+    def pack(sources, tile_size):
+        """Empaquète les tuiles (toutes de même taille une fois redimensionnées) en grille"""
+        tile_w, tile_h = tile_size
+        columns = max(1, math.ceil(math.sqrt(len(sources))))
+        rows = max(1, math.ceil(len(sources) / columns))
+        surface = pygame.Surface((columns * tile_w, rows * tile_h), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
+        assets = AssetManager.get_instance()
+        rects = {}
+        for slot, (gid, path) in enumerate(sources):
+            # Tuiles non référencées : évinçables dès que l'atlas est construit
+            tile = pygame.transform.scale(assets.image(path), tile_size)
+            rect = pygame.Rect((slot % columns) * tile_w, (slot // columns) * tile_h, tile_w, tile_h)
+            surface.blit(tile, rect)
+            rects[gid] = rect
+        return surface, rects
+
+    @staticmethod
+    def _signature(sources, tile_size):
+        """Empreinte des sources (chemins et versions du contenu) : un changement reconstruit l'atlas"""
+        assets = AssetManager.get_instance()
+        digest = hashlib.sha1(repr(tile_size).encode())
+        for gid, path in sources:
+            digest.update(f"{gid}:{path}:{assets.fingerprint(path)}".encode())
+        return digest.hexdigest()[:12]
+
+    @staticmethod
+    def _save(surface, rects, image_path, index_path):
+        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+        pygame.image.save(surface, image_path)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump({"rects": {str(gid): list(rect) for gid, rect in rects.items()}}, f)
+
+    def get(self, gid):
+        """Surface de la tuile (subsurface de l'atlas), None si le gid est inconnu"""
+        return self.subsurfaces.get(gid & GID_MASK)
+
+    def get_rect(self, gid):
+        """Rect de la tuile dans l'atlas, None si le gid est inconnu"""
+        return self.rects.get(gid & GID_MASK)
+
+    def release(self):
+        if self.handle is not None:
+            self.handle.release()
+            self.handle = None
+
+
+if __name__ == "__main__":
+    # Pré-construit l'atlas de la clairière (étape de build facultative)
+    from core.settings import CLAIRIERE_MAP, TILE_WIDTH, TILE_HEIGHT
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    with open(CLAIRIERE_MAP, "r", encoding="utf-8") as f:
+        atlas = TileAtlas.load_or_build(load_map_tilesets(json.load(f), CLAIRIERE_MAP), (TILE_WIDTH, TILE_HEIGHT))
+    print(f"[ATLAS] {len(atlas.rects)} tuiles, atlas {atlas.surface.get_size()}")
@@ -0,0 +1,37 @@
+from core.settings import SIMULATION_HZ, MAX_SIMULATION_STEPS
+
+
+class FixedTimestep:
+    """Accumulator turning variable frame times into fixed simulation steps.
+
+    Each frame, advance(dt) returns how many steps of step_ms to simulate. The time left in
+    the accumulator, as a fraction of a step (alpha), tells the renderer how far to
+    interpolate between the previous and the current simulation state. Catch-up is capped:
+    after a long stall the extra time is dropped instead of simulating a burst of steps.
+    """
+
+    def __init__(self, hz=SIMULATION_HZ, max_steps=MAX_SIMULATION_STEPS):
+        self.step_ms = 1000.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # Time discarded by the catch-up cap (diagnostics)
+
+    def reset(self):
+        """Forget pending time (entering a state after loading or a pause)"""
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """Add dt milliseconds; return the number of fixed steps to simulate now"""
+        self.accumulator += dt
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            self.dropped_ms += (steps - self.max_steps) * self.step_ms
+            self.accumulator -= (steps - self.max_steps) * self.step_ms
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of the next step already elapsed, in [0, 1)"""
+        return min(self.accumulator / self.step_ms, 1.0)
@@ -1,18 +1,51 @@
 import json
 import pygame
-import os
+import numpy as np
 from core.settings import *
+from game.tileset import TileAtlas, load_map_tilesets
+from game.spatial import SpatialHash
+from game.occupancy import OccupancyGrid
+from game.pathfinding import DistanceField
+from game.maps import MapManager, MapData
+from game.mapbin import CompiledMap
+from game.occlusion import OverdrawCounter
+
+
+class _MapAttribute:
+    """World attribute stored on the current MapData, so changing map swaps them all at once"""
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, world, owner=None):
+        return self if world is None else getattr(world.map, self.name)
+    
+    def __set__(self, world, value):
+        setattr(world.map, self.name, value)
+
 
 class World:
     """Simple isometric world with clean coordinate system"""
     
-    def __init__(self, screen):
+    # Per-map state (game/maps.py), cached by the MapManager between visits
+    map_data = _MapAttribute()
+    walkable = _MapAttribute()  # [y, x] walkable cells (movement, pathfinding)
+    walkable_version = _MapAttribute()  # Bumped on every walkability change (path caches key on it)
+    nearest_walkable = _MapAttribute()  # [y, x] -> closest walkable (x, y)
+    nearest_walkable_version = _MapAttribute()
+    pathfinder = _MapAttribute()
+    distance_fields = _MapAttribute()  # name -> DistanceField (one per shared goal, e.g. the player)
+    atlas = _MapAttribute()  # TileAtlas: all tiles in one surface, gid -> rect
+    
+    def __init__(self, screen, map_path=CLAIRIERE_MAP):
         self.screen = screen
         self.screen_center_x = screen.get_width() // 2
         self.screen_center_y = screen.get_height() // 2
         
-        # Simple entity system
+        # Simple entity system (list keeps registration order, spatial index answers position queries)
         self.entities = []
+        self.spatial = SpatialHash()
+        self.occupancy = OccupancyGrid()  # Entity / reservation per tile (blocking checks)
         
         # Spawn points using REAL tile coordinates (0-32)
         # Based on visual observation from screenshot
@@ -24,43 +57,62 @@ class World:
             "Loopfang": (22, 16),       # East of center
         }
         
-        # Reference walkable layer (layer_1 = index 2)
-        self.walkable_layer_index = 2
-        
-        # Tile system
-        self.tile_images = []
-        self.tile_grid = {}  # grid_pos -> tile_data
+        # Current map (tiles, walkable layer, navigation data, portals)
+        self.maps = MapManager.get_instance()
+        self.map = MapData(map_path)
+        self.map_path = map_path
+        self.fallback_tile = None
+        self.overdraw = OverdrawCounter()  # Tiles / pixels blitted by draw (F1)
         
-        # Load everything
-        self.load_tiles()
+        # Load everything (tiles come from the map's tilesets)
         self.load_map()
+        self.load_tiles()
         self.validate_spawn_points()
         
+    @staticmethod
+    def get_preload_paths(map_path=CLAIRIERE_MAP):
+        """Images decoded by load_tiles (for the asset preload pipeline)"""
+        try:
+            compiled = CompiledMap.open_fresh(map_path)
+            if compiled is not None:
+                map_data = compiled.meta["map"]  # Tilesets without parsing the tile data
+            else:
+                with open(map_path, 'r', encoding='utf-8') as f:
+                    map_data = json.load(f)
+            tilesets = load_map_tilesets(map_data, map_path)
+            return TileAtlas.get_preload_paths(tilesets, (TILE_WIDTH, TILE_HEIGHT))
+        except Exception as e:
+            print(f"[WORLD] Could not list tile images to preload: {e}")
+            return []
+    
     def load_tiles(self):
-        """Load tile images from assets/tiles/"""
-        self.tile_images = []
-        tiles_dir = "assets/tiles"
+        """Load the tile atlas for the map's tilesets (built and cached on first run)"""
+        if self.atlas:
+            return  # Map back from the cache with its atlas
+        self.fallback_tile = None
         
         try:
-            if os.path.exists(tiles_dir):
-                tile_files = [f for f in sorted(os.listdir(tiles_dir)) 
-                             if f.endswith(".png") and f.startswith("tile_")]
-                
-                for filename in tile_files:
-                    path = os.path.join(tiles_dir, filename)
-                    img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.scale(img, (TILE_WIDTH, TILE_HEIGHT))
-                    self.tile_images.append(img)
-                
-                print(f"[WORLD] Loaded {len(self.tile_images)} tile images")
+            tilesets = self.map.tilesets or load_map_tilesets(self.map_data or {}, self.map_path)
+            self.atlas = TileAtlas.load_or_build(tilesets, (TILE_WIDTH, TILE_HEIGHT))
+            self.map.chunks.clear()  # Baked chunks hold atlas areas
+            if self.atlas.rects:
+                print(f"[WORLD] Loaded {len(self.atlas.rects)} tiles from atlas {self.atlas.surface.get_size()}")
             else:
-                print("[WORLD] Tiles directory not found, using fallback")
+                print("[WORLD] Tileset has no tile images, using fallback")
+                self.release_tiles()
                 self._create_fallback_tile()
                 
         except Exception as e:
             print(f"[WORLD] Error loading tiles: {e}")
+            self.release_tiles()
             self._create_fallback_tile()
     
+    def release_tiles(self):
+        """Release the tile atlas back to the asset manager"""
+        if self.atlas:
+            self.atlas.release()
+        self.atlas = None
+    
     def _create_fallback_tile(self):
         """Create simple fallback tile"""
         fallback = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
@@ -75,85 +127,75 @@ class World:
         pygame.draw.polygon(fallback, (100, 150, 100), points)
         pygame.draw.polygon(fallback, (80, 120, 80), points, 2)
         
-        self.tile_images = [fallback]
+        self.fallback_tile = fallback
     
     def load_map(self):
-        """Load map data and create isometric grid"""
-        map_path = "data/map/clairiere.json"
-        
-        try:
-            if os.path.exists(map_path):
-                with open(map_path, 'r', encoding='utf-8') as f:
-                    map_data = json.load(f)
-                
-                self._process_map_data(map_data)
-                print(f"[WORLD] Map loaded with {len(self.tile_grid)} tiles")
-            else:
-                print("[WORLD] Map file not found, creating default grid")
-                self._create_default_grid()
-                
-        except Exception as e:
-            print(f"[WORLD] Error loading map: {e}")
-            self._create_default_grid()
+        """Load map data and create isometric grid (from the map cache when already loaded)"""
+        self.map = self.maps.get(self.map_path)
+        if self.occupancy.cells.shape != self.walkable.shape:
+            self.occupancy.resize(self.walkable.shape)
+        print(f"[WORLD] Map {self.map.name} ready ({self.map.width}x{self.map.height})")
     
-    def _process_map_data(self, map_data):
-        """Process JSON map data using REAL coordinates (0-32)"""
-        self.tile_grid = {}
-        self.walkable_grid = {}  # Simplified walkable reference from layer_1
-        
-        layers = [l for l in map_data.get("layers", []) if l.get("type") == "tilelayer"]
+    def change_map(self, map_path):
+        """Switch to another map: entities stay registered, callers move or despawn them"""
+        self.map_path = map_path
+        self.load_map()
+        self.load_tiles()
+    
+    def portal_at(self, x, y):
+        """Portal of the current map covering grid cell (x, y), or None"""
+        for portal in self.map.portals:
+            if (x, y) in portal.cells:
+                return portal
+        return None
+    
+    def set_walkable(self, x, y, walkable):
+        """Change the walkability of one tile (invalidates cached paths)"""
+        x, y = int(x), int(y)
+        if not (0 <= x < self.map.width and 0 <= y < self.map.height):
+            print(f"[WORLD] set_walkable: ({x}, {y}) is outside the map")
+            return
+        if self.walkable[y, x] == walkable:
+            return
+        self.walkable[y, x] = walkable
+        self.walkable_version += 1
+        if not walkable:
+            for entity in self.entities_at(x, y):
+                entity.unstick()
+    
+    def find_path(self, start, goal, entity=None):
+        """Shortest 8-directional path of grid cells from start to goal (both included), or None.
         
-        for layer_index, layer in enumerate(layers):
-            width = layer.get("width", 0)
-            height = layer.get("height", 0)
-            data = layer.get("data", [])
-            
-            print(f"[WORLD] Processing layer {layer_index}: {width}x{height}")
-            
-            for y in range(height):
-                for x in range(width):
-                    idx = y * width + x
-                    if idx < len(data):
-                        tile_id = data[idx]
-                        
-                        # Use REAL coordinates (no centering)
-                        real_x, real_y = x, y
-                        
-                        # Store all layers
-                        if tile_id > 0:
-                            tile_key = (real_x, real_y, layer_index)
-                            self.tile_grid[tile_key] = {
-                                'tile_id': tile_id,
-                                'layer': layer_index
-                            }
-                        
-                        # Layer_1 (index 2) defines walkability
-                        if layer_index == self.walkable_layer_index:
-                            self.walkable_grid[(real_x, real_y)] = tile_id > 0
-                            
-                            # Store base walkable tiles for position checks
-                            if tile_id > 0:
-                                self.tile_grid[(real_x, real_y)] = {
-                                    'tile_id': tile_id,
-                                    'layer': layer_index,
-                                    'walkable': True
-                                }
-    
-    def _create_default_grid(self):
-        """Create simple default grid for testing"""
-        self.tile_grid = {}
-        for x in range(-10, 11):
-            for y in range(-10, 11):
-                self.tile_grid[(x, y)] = {
-                    'tile_id': 1,
-                    'walkable': True
-                }
-    
-    def _is_walkable(self, tile_id):
-        """Determine if tile is walkable - simple rules"""
-        # Most tiles are walkable except obvious obstacles
-        blocked_tiles = {91, 92, 93, 94, 95, 101, 102, 103, 104}  # Trees, rocks, etc
-        return tile_id not in blocked_tiles
+        With an entity, a goal tile held by another entity is unreachable. The cells in between
+        only follow the terrain: their occupants move, movers reserve them one step ahead.
+        """
+        if entity is not None and not self.occupancy.is_free(int(goal[0]), int(goal[1]), entity):
+            return None
+        return self.pathfinder.find_path(start, goal)
+    
+    def distance_field(self, goal, name="player"):
+        """Distance field toward goal, rebuilt only when the goal cell or walkability changed"""
+        field = self.distance_fields.get(name)
+        if field is None:
+            field = self.distance_fields[name] = DistanceField(self)
+        field.update(goal)
+        return field
+    
+    def line_of_sight(self, start, goal):
+        """True if no sight-blocking tile (tileset property) lies between two cells, ends excluded"""
+        if self.map.blocks_sight is None:
+            self.map.build_sight_array()
+        (sx, sy), (gx, gy) = start, goal
+        steps = int(max(abs(gx - sx), abs(gy - sy)))
+        if steps < 2:
+            return True
+        # Cells crossed by the segment, sampled once per step along its major axis
+        t = np.arange(1, steps) / steps
+        xs = np.rint(sx + (gx - sx) * t).astype(np.intp)
+        ys = np.rint(sy + (gy - sy) * t).astype(np.intp)
+        height, width = self.map.blocks_sight.shape
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        return not self.map.blocks_sight[ys[inside], xs[inside]].any()
     
     def validate_spawn_points(self):
         """Ensure all spawn points are on walkable tiles"""
@@ -173,21 +215,23 @@ class World:
         if invalid_spawns:
             print(f"[WORLD] Warning: {len(invalid_spawns)} spawn points remain invalid: {invalid_spawns}")
     
-    def find_nearest_walkable(self, x, y, max_distance=5):
-        """Find nearest walkable position using spiral search"""
-        # Start from distance 1 and spiral outward
-        for distance in range(1, max_distance + 1):
-            # Check all positions at this distance
-            for dx in range(-distance, distance + 1):
-                for dy in range(-distance, distance + 1):
-                    # Only check positions on the border of the current distance
-                    if abs(dx) == distance or abs(dy) == distance:
-                        test_x, test_y = int(x + dx), int(y + dy)
-                        if self.is_valid_position(test_x, test_y):
-                            return (test_x, test_y)
+    def find_nearest_walkable(self, x, y, max_distance=None):
+        """Closest walkable tile to (x, y), itself if walkable (table lookup, no radius limit by default)"""
+        if self.nearest_walkable_version != self.walkable_version:
+            self.map.build_nearest_walkable()
+        height, width = self.nearest_walkable.shape[:2]
+        if not height or not width:
+            return None
         
-        print(f"[WORLD] No walkable position found near ({x}, {y}) within {max_distance} tiles")
-        return None
+        # Off-map points use the closest map cell
+        grid_x = min(max(int(round(float(x))), 0), width - 1)
+        grid_y = min(max(int(round(float(y))), 0), height - 1)
+        nearest_x, nearest_y = self.nearest_walkable[grid_y, grid_x].tolist()
+        if nearest_x < 0 or (max_distance is not None and
+                             max(abs(nearest_x - x), abs(nearest_y - y)) > max_distance):
+            print(f"[WORLD] No walkable position found near ({x}, {y})")
+            return None
+        return (nearest_x, nearest_y)
     
     def get_spawn_position(self, entity_name):
         """Get reliable spawn position aligned with tile grid"""
@@ -214,16 +258,29 @@ class World:
     
     def is_valid_position(self, x, y):
         """Simple position validation using layer_1"""
-        # Convert to real grid coordinates (0-32)
+        # Convert to grid cell coordinates
         grid_x = int(round(float(x)))
         grid_y = int(round(float(y)))
         
-        # Check bounds
-        if not (0 <= grid_x < 33 and 0 <= grid_y < 33):
+        # Check bounds (map metadata)
+        if not (0 <= grid_x < self.map.width and 0 <= grid_y < self.map.height):
             return False
         
         # Check if walkable in layer_1
-        return self.walkable_grid.get((grid_x, grid_y), False)
+        return bool(self.walkable[grid_y, grid_x])
+    
+    def is_free(self, x, y, entity=None):
+        """Walkable and not held by another entity (standing on it or having reserved it)"""
+        grid_x, grid_y = int(round(float(x))), int(round(float(y)))
+        return self.is_valid_position(grid_x, grid_y) and self.occupancy.is_free(grid_x, grid_y, entity)
+    
+    def reserve(self, entity, cells):
+        """Claim tiles for an entity's planned move; False (nothing reserved) if one is taken"""
+        return self.occupancy.reserve(entity, cells)
+    
+    def release(self, entity):
+        """Drop an entity's tile reservations"""
+        self.occupancy.release(entity)
     
     def get_screen_position(self, grid_x, grid_y, camera_offset=(0, 0)):
         """Convert grid coordinates to screen position with unified axis correction"""
@@ -231,9 +288,10 @@ class World:
         # This matches Character's input logic: +X goes NW, +Y goes NE visually
         corrected_x, corrected_y = self.apply_axis_correction(grid_x, grid_y)
         
-        # Center coordinates: (0,0) of map = top-left, (16,16) = center
-        centered_x = corrected_x - 16.0
-        centered_y = corrected_y - 16.0
+        # Center coordinates: (0,0) of map = top-left, map center = screen center
+        center_x, center_y = self.map.center
+        centered_x = corrected_x - center_x
+        centered_y = corrected_y - center_y
         
         # Simple isometric conversion (same for all entities)
         iso_x, iso_y = grid_to_iso(centered_x, centered_y, TILE_WIDTH, TILE_HEIGHT)
@@ -244,6 +302,14 @@ class World:
         
         return (screen_x, screen_y)
     
+    def get_screen_positions(self, positions, camera_offset=(0, 0)):
+        """Vectorized get_screen_position: (N, 2) grid positions -> (N, 2) integer screen positions"""
+        # Axis correction is the identity (see apply_axis_correction)
+        centered = np.asarray(positions, dtype=np.float64) - np.array(self.map.center)
+        iso = grid_to_iso_array(centered, TILE_WIDTH, TILE_HEIGHT)
+        offset = np.array([self.screen_center_x + camera_offset[0], self.screen_center_y + camera_offset[1]])
+        return (iso + offset).astype(np.int64)
+    
     def apply_axis_correction(self, grid_x, grid_y):
         """Apply unified axis correction for all entities
         
@@ -270,8 +336,10 @@ class World:
     
     def register_entity(self, entity):
         """Reliably register entity with world"""
-        if entity not in self.entities:
+        if entity not in self.spatial:
             self.entities.append(entity)
+            self.spatial.insert(entity, entity.get_grid_position())
+            self.occupancy.place(entity, entity.get_grid_position())
             entity.world = self  # Set world reference
             
             # Log registration with reliable position
@@ -279,57 +347,95 @@ class World:
             screen_pos = self.get_screen_position(grid_pos[0], grid_pos[1])
             print(f"[WORLD] Registered {entity.name} at grid {grid_pos} -> screen {screen_pos}")
     
+    def unregister_entity(self, entity):
+        """Remove entity from the world and its spatial index"""
+        if entity in self.spatial:
+            self.spatial.remove(entity)
+            self.occupancy.remove(entity)
+            self.entities.remove(entity)
+    
+    def entity_moved(self, entity):
+        """Keep the spatial index and the occupancy grid in sync after an entity changed tile"""
+        if entity in self.spatial:
+            self.spatial.move(entity, entity.get_grid_position())
+            self.occupancy.place(entity, entity.get_grid_position())
+    
+    def entities_at(self, x, y):
+        """Entities standing on grid cell (x, y)"""
+        return self.spatial.entities_at((int(x), int(y)))
+    
+    def entities_in_rect(self, min_x, min_y, max_x, max_y):
+        """Entities whose grid position is inside the (inclusive) grid rectangle"""
+        return self.spatial.entities_in_rect(min_x, min_y, max_x, max_y)
+    
+    def get_entities_near(self, x, y, radius, exclude=None):
+        """Entities within radius tiles of (x, y), closest first (proximity triggers)"""
+        return [e for e in self.spatial.entities_near(x, y, radius) if e is not exclude]
+    
+    def nearest_entity(self, x, y, radius, predicate=None, exclude=None):
+        """Closest entity within radius tiles (combat targeting), or None"""
+        return self.spatial.nearest(x, y, radius,
+                                    lambda e: e is not exclude and (predicate is None or predicate(e)))
+    
+    def screen_to_grid(self, screen_x, screen_y, camera_offset=(0, 0)):
+        """Inverse of get_screen_position: screen pixel -> fractional grid coordinates"""
+        iso_x = screen_x - self.screen_center_x - camera_offset[0]
+        iso_y = screen_y - self.screen_center_y - camera_offset[1]
+        corrected_x, corrected_y = iso_to_grid_precise(iso_x, iso_y, TILE_WIDTH, TILE_HEIGHT)
+        center_x, center_y = self.map.center
+        return self.reverse_axis_correction(corrected_x + center_x, corrected_y + center_y)
+    
     def get_tile_image(self, tile_id):
-        """Get tile image by ID"""
-        if not self.tile_images:
-            return None
-            
-        # Use tile_id as index (with bounds checking)
-        idx = (tile_id - 1) % len(self.tile_images)
-        return self.tile_images[idx]
+        """Get tile image by gid (subsurface of the atlas)"""
+        if self.atlas:
+            return self.atlas.get(tile_id)
+        return self.fallback_tile
     
     def draw(self, screen, camera_offset=(0, 0)):
-        """Draw the isometric world with proper layer ordering"""
+        """Draw the isometric world with proper layer ordering (chunks around the camera only)"""
         # Clear background
         screen.fill((50, 80, 50))  # Dark green
         
-        # Get visible tiles with layer support
-        visible_tiles = []
-        for tile_key, tile_data in self.tile_grid.items():
-            # Handle both (x,y) and (x,y,layer) keys
-            if len(tile_key) == 3:  # (x, y, layer)
-                grid_x, grid_y, layer = tile_key
-            elif len(tile_key) == 2:  # (x, y) - skip these, we want layered ones
-                continue
-            else:
-                continue
-                
-            screen_x, screen_y = self.get_screen_position(grid_x, grid_y, camera_offset)
-            
-            # Only draw tiles that might be visible
-            if (-TILE_WIDTH < screen_x < screen.get_width() + TILE_WIDTH and 
-                -TILE_HEIGHT < screen_y < screen.get_height() + TILE_HEIGHT):
-                
-                visible_tiles.append((grid_x, grid_y, layer, tile_data, screen_x, screen_y))
+        # Cells whose tiles can reach the screen: one tile of margin, plus the height of the
+        # layers below the screen (upper layers are drawn LAYER_HEIGHT higher each)
+        width, height = screen.get_size()
+        bottom = height + TILE_HEIGHT + len(self.map.layers) * LAYER_HEIGHT
+        corners = [self.screen_to_grid(x, y, camera_offset) for x, y in
+                   ((-TILE_WIDTH, -TILE_HEIGHT), (width + TILE_WIDTH, -TILE_HEIGHT),
+                    (-TILE_WIDTH, bottom), (width + TILE_WIDTH, bottom))]
+        min_x, max_x = min(x for x, y in corners) - 1, max(x for x, y in corners) + 1
+        min_y, max_y = min(y for x, y in corners) - 1, max(y for x, y in corners) + 1
         
-        # Sort for proper isometric rendering: layer first, then y, then x
-        visible_tiles.sort(key=lambda t: (t[2], t[1], t[0]))  # Sort by layer, y, x
+        # Bake chunks entering the view, drop far ones; tiles come sorted by layer, y, x
+        chunks = self.map.chunks
+        chunks.update(min_x, min_y, max_x, max_y)
+        dests, areas, fills = chunks.visible(min_x, min_y, max_x, max_y)
+        if not areas:
+            return
         
-        # Draw tiles with layer offset
-        for grid_x, grid_y, layer, tile_data, screen_x, screen_y in visible_tiles:
-            tile_img = self.get_tile_image(tile_data['tile_id'])
-            if tile_img:
-                # Apply Z offset: each layer is 16px higher
-                z_offset = layer * 16
-                draw_x = screen_x - TILE_WIDTH//2
-                draw_y = screen_y - TILE_HEIGHT//2 - z_offset
-                screen.blit(tile_img, (draw_x, draw_y))
-            
-            # Debug: draw layer info
-            if False:  # Enable for debugging
-                font = pygame.font.Font(None, 16)
-                text = font.render(f"L{layer}", True, (255, 255, 255))
-                screen.blit(text, (screen_x - 10, screen_y - 10))
+        offset_x = self.screen_center_x + camera_offset[0]
+        offset_y = self.screen_center_y + camera_offset[1]
+        screen_x, screen_y = dests[:, 0] + offset_x, dests[:, 1] + offset_y
+        # Only draw tiles whose image overlaps the screen
+        visible = np.flatnonzero((-TILE_WIDTH < screen_x) & (screen_x < width) &
+                                 (-TILE_HEIGHT < screen_y) & (screen_y < height))
+        positions = (dests[visible] + np.array([offset_x, offset_y])).tolist()
+        self.overdraw.record(len(positions), int(fills[visible].sum()), width * height)
+        
+        # Draw tiles with layer offset, in one batch of atlas area blits
+        if self.atlas:
+            surface = self.atlas.surface
+            blit_sequence = [(surface, dest, areas[i]) for i, dest in zip(visible.tolist(), positions)]
+        elif self.fallback_tile:
+            blit_sequence = [(self.fallback_tile, dest) for dest in positions]
+        else:
+            return
+        screen.blits(blit_sequence, doreturn=False)
+    
+    def log_draw_stats(self):
+        """Overdraw since the last call, and tiles culled by occlusion on the current map"""
+        self.overdraw.log_stats(self.map.chunks.stats["occluded"])
+        self.overdraw.reset()
     
     def draw_debug_grid(self, screen, camera_offset=(0, 0)):
         """Draw debug grid overlay"""
@@ -360,8 +466,8 @@ class World:
             float_pos = entity.get_position()
             screen_pos = self.get_screen_position(float_pos[0], float_pos[1])
             
-            # Check if position is on a tile
-            is_on_tile = grid_pos in self.tile_grid
+            # Check if position is on the map
+            is_on_tile = 0 <= grid_pos[0] < self.map.width and 0 <= grid_pos[1] < self.map.height
             is_walkable = self.is_valid_position(grid_pos[0], grid_pos[1]) if is_on_tile else False
             
             position_info = f"  {entity.name}: grid {grid_pos}"
@@ -378,8 +484,7 @@ class World:
         print("[WORLD] === SPAWN POINTS DEBUG (REAL COORDS) ===")
         for name, (x, y) in self.spawn_points.items():
             is_valid = self.is_valid_position(x, y)
-            is_walkable = self.walkable_grid.get((x, y), False)
-            tile_in_layer1 = (x, y, self.walkable_layer_index) in self.tile_grid
+            in_map = 0 <= x < self.map.width and 0 <= y < self.map.height
             
-            print(f"  {name}: real({x}, {y}) -> valid: {is_valid}, walkable: {is_walkable}, layer1: {tile_in_layer1}")
+            print(f"  {name}: real({x}, {y}) -> valid: {is_valid}, in map: {in_map}")
         print("[WORLD] =================================")
\ No newline at end of file
@@ -3,10 +3,12 @@ import pygame
 import json
 import os
 from core.iso_creator import create_iso_sprite, IsoSpriteAnimator
-from core.settings import get_star_sprite_path, FONTS
+from core.settings import get_star_sprite_path, FONTS, MENU_BACKGROUND_PATH
+from core.assets import AssetManager, list_asset_dir
 from ui.uitools import (BorderManager, load_star_frames, load_background_image, 
                        create_starry_background, draw_starry_background, 
-                       draw_text_with_effects, oscillate_color, PrevNextButton, UISlider)
+                       draw_text_with_effects, oscillate_color, PrevNextButton, UISlider,
+                       preload_with_loading_screen)
 from PIL import Image
 import tempfile
 
@@ -32,6 +34,7 @@ class CharacterCreator:
         self.base_type = "1"
         self.assets = {cat: [] for cat in CATEGORIES}
         self.original_pil_assets = {cat: [] for cat in CATEGORIES}
+        self.asset_handles = []
         self.indices = {cat: 0 for cat in CATEGORIES}
         self.colors = {cat: None for cat in CATEGORIES}
         self.current_category_index = 0
@@ -40,7 +43,7 @@ class CharacterCreator:
         screen_w, screen_h = self.screen.get_width(), self.screen.get_height()
 
         # Fond étoilé avec filtre noir
-        self.bg_image = load_background_image("assets/other/blueaura.png", (screen_w, screen_h))
+        self.bg_image = load_background_image(MENU_BACKGROUND_PATH, (screen_w, screen_h))
         self.star_frames = load_star_frames(get_star_sprite_path())
         self.stars = create_starry_background(self.star_frames, screen_w, screen_h, 30)
         self.filter_surface = pygame.Surface((screen_w, screen_h))
@@ -117,16 +120,28 @@ class CharacterCreator:
 
     def load_assets(self):
         """Charge les assets PIL et pygame pour chaque catégorie."""
+        files = {}
         for cat in CATEGORIES:
             path = os.path.join(ASSET_PATH, cat, self.base_type)
+            files[cat] = [os.path.join(path, f) for f in list_asset_dir(path) if f.endswith(".png")]
+        # Décodage PIL en parallèle, puis conversion pygame sur le thread principal
+        self.release_assets()
+        self.asset_handles = preload_with_loading_screen(self.screen, [p for paths in files.values() for p in paths],
+                                                         "Chargement des apparences...", pil=True)
+
+        for cat in CATEGORIES:
             self.assets[cat], self.original_pil_assets[cat] = [], []
-            if os.path.exists(path):
-                for f in sorted(os.listdir(path)):
-                    if f.endswith(".png"):
-                        img_path = os.path.join(path, f)
-                        pil_img = Image.open(img_path).convert("RGBA")
-                        self.original_pil_assets[cat].append(pil_img)
-                        self.assets[cat].append(pygame.image.fromstring(pil_img.tobytes(), pil_img.size, pil_img.mode))
+            for img_path in files.get(cat, []):
+                # Déjà en cache et tenu par les handles du préchargement
+                pil_img = AssetManager.get_instance().pil_image(img_path)
+                self.original_pil_assets[cat].append(pil_img)
+                self.assets[cat].append(pygame.image.fromstring(pil_img.tobytes(), pil_img.size, pil_img.mode))
+
+    def release_assets(self):
+        """Rend les images PIL des apparences à l'AssetManager"""
+        for handle in self.asset_handles:
+            handle.release()
+        self.asset_handles = []
 
     def get_current_config(self):
         """Retourne la config courante pour le preview animé."""
@@ -419,6 +434,7 @@ class CharacterCreator:
             os.makedirs("data", exist_ok=True)
             image_path = os.path.join("data", f"{self.player_name}_bust.png")
             pygame.image.save(composite, image_path)
+            AssetManager.get_instance().invalidate(image_path)
             print(f"[OK] Personnage exporté : {image_path}")
 
             # Sauvegarde des données JSON (correction: "bust" au lieu de "buste")
@@ -441,7 +457,9 @@ class CharacterCreator:
 
             # Configuration complète pour le sprite iso
             config = self.get_current_config()
-            create_iso_sprite(config, output_path=os.path.join("data", f"{self.player_name}_iso.png"))
+            iso_path = os.path.join("data", f"{self.player_name}_iso.png")
+            create_iso_sprite(config, output_path=iso_path)
+            AssetManager.get_instance().invalidate(iso_path)
             
         except Exception as e:
             print(f"[ERREUR] Export : {e}")
@@ -461,3 +479,5 @@ class CharacterCreator:
             self.draw_preview()
             pygame.display.flip()
             clock.tick(30)
+
+        self.release_assets()
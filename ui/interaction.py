@@ -2,6 +2,7 @@ import os
 import pygame
 from ui.uitools import BorderManager
 from core.settings import FONTS
+from core.assets import AssetManager, asset_exists
 
 # Import du dispatcher de dialogue
 from core.dialogue_dispatcher import DialogueDispatcher
@@ -54,6 +55,7 @@ class InteractionUI:
         # Images de bustes
         self.character_bust = None
         self.npc_bust = None
+        self.bust_handles = []
         
         # Dialogue
         self.current_dialogue = ""
@@ -140,10 +142,14 @@ class InteractionUI:
         
     def _load_character_busts(self, character, npc):
         """Charge les images de bustes des personnages, retourne une surface de secours si besoin"""
+        self._release_busts()
+
         def load_bust(path, fallback_color):
-            if path and os.path.exists(path):
+            if path and asset_exists(path):
                 try:
-                    return pygame.image.load(path).convert_alpha()
+                    handle = AssetManager.get_instance().acquire(path)
+                    self.bust_handles.append(handle)
+                    return handle.value
                 except pygame.error:
                     pass
             surf = pygame.Surface((150, 200))
@@ -153,6 +159,14 @@ class InteractionUI:
         self.character_bust = load_bust(bust_path, (255, 100, 100))
         bust_path = getattr(npc, 'bust_path', None)
         self.npc_bust = load_bust(bust_path, (100, 100, 255))
+
+    def _release_busts(self):
+        """Rend les bustes de l'interaction précédente à l'AssetManager"""
+        for handle in self.bust_handles:
+            handle.release()
+        self.bust_handles = []
+        self.character_bust = None
+        self.npc_bust = None
             
     def update(self, mouse_pos):
         """Met à jour l'interface"""
@@ -353,4 +367,5 @@ class InteractionUI:
         self.current_character = None
         self.current_dialogue = ""
         self.response_buttons = []
+        self._release_busts()
         print("[INTERACTION] Dialogue terminé")
\ No newline at end of file
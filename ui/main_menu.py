@@ -1,7 +1,9 @@
 # === ui/main_menu.py ===
 import os
 import pygame
-from core.settings import get_star_sprite_path, FONTS
+from core.settings import (get_star_sprite_path, FONTS, MENU_BACKGROUND_PATH, ELECTRIC_AURA_PATH,
+                           DEFAULT_CHARACTER_SPRITE, MENU_SPRITE_SCALE, MENU_IDLE_FRAMES, MENU_HOVER_FRAMES)
+from core.assets import get_frame_set
 from ui.uitools import (BorderManager, load_star_frames, load_background_image, 
                        create_starry_background, draw_starry_background, 
                        draw_stylish_button, oscillate_color, draw_text_with_effects)
@@ -18,7 +20,7 @@ class MainMenu:
         self.session = session
 
         # Chargement du fond et des étoiles avec uitools
-        self.bg_image = load_background_image("assets/other/blueaura.png", (screen.get_width(), screen.get_height()))
+        self.bg_image = load_background_image(MENU_BACKGROUND_PATH, (screen.get_width(), screen.get_height()))
         self.star_frames = load_star_frames(get_star_sprite_path())
         self.stars = create_starry_background(self.star_frames, screen.get_width(), screen.get_height(), 50)
 
@@ -27,10 +29,10 @@ class MainMenu:
         self.sprite_path = session.sprite_path
         if not os.path.exists(self.sprite_path):
             print(f"[AVERTISSEMENT] Aucun sprite trouvé pour {session.name}, chargement d'un sprite par défaut.")
-            self.sprite_path = "assets/sprites/default_character.png"
+            self.sprite_path = DEFAULT_CHARACTER_SPRITE
 
         # Double la taille d'affichage et centre le personnage et le bouton
-        self.sprite_scale = 2
+        self.sprite_scale = MENU_SPRITE_SCALE
         screen_w, screen_h = self.screen.get_width(), self.screen.get_height()
         title_y = 150
         button_y = 400 + 25  # bouton centré verticalement (y + hauteur/2)
@@ -57,20 +59,9 @@ class MainMenu:
     def load_idle_frames(self, sprite_path):
         """Charge les frames d'animation spécifiques du sprite (grille 12x8, frames: 1,4,13,28,37,40,25,16)"""
         try:
-            sheet = pygame.image.load(sprite_path).convert_alpha()
-            frame_width, frame_height = 48, 96
-            columns = 12
-            frame_indices = [1, 4, 13, 28, 37, 40, 25, 16]
-            frames = []
-            for idx in frame_indices:
-                col = idx % columns
-                row = idx // columns
-                rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
-                frame = sheet.subsurface(rect)
-                # Double la taille d'affichage
-                frame = pygame.transform.scale(frame, (frame_width * self.sprite_scale, frame_height * self.sprite_scale))
-                frames.append(frame)
-            return frames
+            # Double la taille d'affichage ; la feuille n'est décodée qu'une fois pour idle et hover
+            return get_frame_set(sprite_path, frame_size=(48, 96), indices=MENU_IDLE_FRAMES,
+                                 scale=self.sprite_scale)
         except Exception as e:
             print(f"[ERREUR] Chargement sprite: {e}")
             fallback = pygame.Surface((48 * self.sprite_scale, 96 * self.sprite_scale))
@@ -80,19 +71,8 @@ class MainMenu:
     def load_hover_frames(self, sprite_path):
         """Charge les frames d'animation hover du sprite (frames: 49, 52, 61, 76, 85, 88, 73, 64)"""
         try:
-            sheet = pygame.image.load(sprite_path).convert_alpha()
-            frame_width, frame_height = 48, 96
-            columns = 12
-            frame_indices = [49, 52, 61, 76, 85, 88, 73, 64]
-            frames = []
-            for idx in frame_indices:
-                col = idx % columns
-                row = idx // columns
-                rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
-                frame = sheet.subsurface(rect)
-                frame = pygame.transform.scale(frame, (frame_width * self.sprite_scale, frame_height * self.sprite_scale))
-                frames.append(frame)
-            return frames
+            return get_frame_set(sprite_path, frame_size=(48, 96), indices=MENU_HOVER_FRAMES,
+                                 scale=self.sprite_scale)
         except Exception as e:
             print(f"[ERREUR] Chargement sprite hover: {e}")
             return self.idle_frames if hasattr(self, 'idle_frames') else [pygame.Surface((48 * self.sprite_scale, 96 * self.sprite_scale))]
@@ -100,21 +80,8 @@ class MainMenu:
     def load_electric_frames(self):
         """Charge l'animation électrique depuis assets/other/electricaura.png (480x192, 2x5 grille, 7 frames)"""
         try:
-            sheet = pygame.image.load("assets/other/electricaura.png").convert_alpha()
-            frame_width, frame_height = 96, 96
-            scale = self.sprite_scale
-            frames = []
-            for row in range(2):
-                for col in range(5 if row == 0 else 2):
-                    if len(frames) >= 7:
-                        break
-                    rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
-                    frame = sheet.subsurface(rect)
-                    frame = pygame.transform.scale(frame, (frame_width * scale, frame_height * scale))
-                    frames.append(frame)
-                if len(frames) >= 7:
-                    break
-            return frames
+            return get_frame_set(ELECTRIC_AURA_PATH, frame_size=(96, 96), count=7,
+                                 scale=self.sprite_scale)
         except Exception as e:
             print(f"[ERREUR] Chargement animation électrique: {e}")
             fallback = pygame.Surface((96 * self.sprite_scale, 96 * self.sprite_scale))
@@ -232,7 +199,7 @@ def ask_player_name(screen):
     border_mgr = BorderManager.get_instance()  # Pas de session lors de la saisie du nom
     star_frames = load_star_frames(get_star_sprite_path())
     stars = create_starry_background(star_frames, screen.get_width(), screen.get_height(), 50)
-    bg_image = load_background_image("assets/other/blueaura.png", (screen.get_width(), screen.get_height()))
+    bg_image = load_background_image(MENU_BACKGROUND_PATH, (screen.get_width(), screen.get_height()))
 
     while not done:
         for event in pygame.event.get():
@@ -1,3 +1,4 @@
+import bisect
 import pygame
 from core.quest import QUESTS, NEW_QUESTS, SECRET_QUESTS
 from core.session import SessionManager
@@ -22,11 +23,20 @@ class QuestTable:
         self.quest_analyzer = QuestAnalyzer(session) if session else None
         
         # Interface
-        self.scroll_offset = 0
-        self.max_visible_quests = 12
         self.quest_height = 40
+        self.desc_height = 60
         self.expanded_quest = None  # Quête actuellement expanded
         
+        # Défilement au pixel près : position affichée et position visée
+        self.scroll_y = 0.0
+        self.scroll_target = 0.0
+        self.scroll_speed = 12.0  # Facteur de lissage (par seconde)
+        
+        # Liste virtualisée : hauteurs cumulées des lignes et cache des surfaces
+        self.row_offsets = [0]
+        self.row_cache = {}  # quest_code -> (clé d'état, surface)
+        self.row_padding = 3  # Marge pour les bordures dessinées hors du rectangle
+        
         # Police
         self.quest_font = pygame.font.Font(FONTS['default'], 20)
         self.desc_font = pygame.font.Font(FONTS['default'], 16)
@@ -52,8 +62,49 @@ class QuestTable:
             return
         
         self.quest_data = self.quest_analyzer.get_given_quests()
+        
+        # Oublie les lignes des quêtes qui ne sont plus listées
+        codes = {quest['code'] for quest in self.quest_data}
+        self.row_cache = {code: row for code, row in self.row_cache.items() if code in codes}
+        self._rebuild_layout()
         print(f"[QUEST_TABLE] Chargé {len(self.quest_data)} quêtes données")
     
+    def _rebuild_layout(self):
+        """Recalcule les hauteurs cumulées des lignes (somme préfixe)"""
+        offsets = [0]
+        for quest in self.quest_data:
+            height = self.quest_height
+            if quest['code'] == self.expanded_quest:
+                height += self.desc_height
+            offsets.append(offsets[-1] + height)
+        self.row_offsets = offsets
+        self._clamp_scroll()
+    
+    def _get_main_rect(self):
+        """Retourne le rectangle de la fenêtre principale"""
+        return pygame.Rect(40, 40, self.screen_width - 80, self.screen_height - 80)
+    
+    def _get_quest_area_rect(self):
+        """Retourne la zone d'affichage de la liste des quêtes"""
+        main_rect = self._get_main_rect()
+        return pygame.Rect(main_rect.x + 10, main_rect.y + 80,
+                           main_rect.width - 20, main_rect.height - 120)
+    
+    def _get_max_scroll(self):
+        """Retourne le défilement maximal en pixels"""
+        return max(0, self.row_offsets[-1] - self._get_quest_area_rect().height)
+    
+    def _clamp_scroll(self):
+        """Maintient les positions de défilement dans les bornes"""
+        max_scroll = self._get_max_scroll()
+        self.scroll_target = min(max(0.0, self.scroll_target), max_scroll)
+        self.scroll_y = min(max(0.0, self.scroll_y), max_scroll)
+    
+    def _scroll_by(self, rows):
+        """Décale la cible de défilement d'un nombre de lignes"""
+        self.scroll_target += rows * self.quest_height
+        self._clamp_scroll()
+    
     def show(self):
         """Affiche la table des quêtes"""
         self.is_active = True
@@ -70,6 +121,7 @@ class QuestTable:
         """Cache la table des quêtes"""
         self.is_active = False
         self.expanded_quest = None
+        self._rebuild_layout()
     
     def handle_event(self, event):
         """Gère les événements utilisateur"""
@@ -81,10 +133,9 @@ class QuestTable:
                 self.hide()
                 return "close"
             elif event.key == pygame.K_UP:
-                self.scroll_offset = max(0, self.scroll_offset - 1)
+                self._scroll_by(-1)
             elif event.key == pygame.K_DOWN:
-                max_scroll = max(0, len(self.quest_data) - self.max_visible_quests)
-                self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
+                self._scroll_by(1)
             elif event.key == pygame.K_b:
                 # Changer de bordure avec B
                 self.border_manager.next_border()
@@ -102,32 +153,30 @@ class QuestTable:
                     self.expanded_quest = None
                 else:
                     self.expanded_quest = quest_code
+                self._rebuild_layout()
                 
                 return "quest_clicked"
         
         elif event.type == pygame.MOUSEWHEEL:
             # Scroll avec la molette
-            if event.y > 0:  # Scroll up
-                self.scroll_offset = max(0, self.scroll_offset - 1)
-            else:  # Scroll down
-                max_scroll = max(0, len(self.quest_data) - self.max_visible_quests)
-                self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
+            self._scroll_by(-event.y)
         
         return None
     
     def _get_quest_at_position(self, mouse_x, mouse_y):
         """Retourne l'index de la quête à la position de la souris"""
-        quest_area_rect = pygame.Rect(50, 100, self.screen_width - 100, 
-                                    self.max_visible_quests * self.quest_height)
+        quest_area_rect = self._get_quest_area_rect()
         
         if not quest_area_rect.collidepoint(mouse_x, mouse_y):
             return None
         
-        # Calcule l'index relatif dans la zone visible
-        relative_y = mouse_y - quest_area_rect.y
-        quest_index = relative_y // self.quest_height + self.scroll_offset
+        # Position dans la liste complète, puis recherche dans les hauteurs cumulées
+        content_y = mouse_y - quest_area_rect.y + int(self.scroll_y)
+        if content_y >= self.row_offsets[-1]:
+            return None
+        quest_index = bisect.bisect_right(self.row_offsets, content_y) - 1
         
-        return quest_index if quest_index < len(self.quest_data) else None
+        return quest_index if 0 <= quest_index < len(self.quest_data) else None
     
     def _get_quest_star_type(self, quest_code, completed):
         """Retourne le type d'étoile pour une quête"""
@@ -153,8 +202,11 @@ class QuestTable:
         overlay.fill(self.bg_color)
         screen.blit(overlay, (0, 0))
         
+        # Défilement lissé vers la cible
+        self._update_scroll(dt)
+        
         # Fenêtre principale
-        main_rect = pygame.Rect(40, 40, self.screen_width - 80, self.screen_height - 80)
+        main_rect = self._get_main_rect()
         pygame.draw.rect(screen, (60, 60, 100), main_rect)
         self.border_manager.draw_border(screen, main_rect, border_thickness=10)
         
@@ -177,11 +229,10 @@ class QuestTable:
         screen.blit(stats_surface, stats_rect)
         
         # Zone de quêtes
-        quest_area_rect = pygame.Rect(main_rect.x + 10, main_rect.y + 80, 
-                                    main_rect.width - 20, main_rect.height - 120)
+        quest_area_rect = self._get_quest_area_rect()
         
         # Scrollbar si nécessaire
-        if len(self.quest_data) > self.max_visible_quests:
+        if self._get_max_scroll() > 0:
             self._draw_scrollbar(screen, quest_area_rect)
         
         # Affiche les quêtes visibles
@@ -195,74 +246,119 @@ class QuestTable:
         inst_rect.bottom = main_rect.bottom - 10
         screen.blit(inst_surface, inst_rect)
     
+    def _update_scroll(self, dt):
+        """Rapproche la position affichée de la cible de défilement"""
+        delta = self.scroll_target - self.scroll_y
+        if abs(delta) < 0.5:
+            self.scroll_y = self.scroll_target
+        else:
+            self.scroll_y += delta * min(1.0, self.scroll_speed * dt / 1000.0)
+    
     def _render_quest_list(self, screen, quest_area_rect, dt):
-        """Affiche la liste des quêtes avec animations"""
-        visible_quests = self.quest_data[self.scroll_offset:self.scroll_offset + self.max_visible_quests]
+        """Affiche uniquement les lignes visibles depuis le cache, puis les étoiles animées"""
+        if not self.quest_data:
+            return
         
-        current_y = quest_area_rect.y
+        scroll_y = int(self.scroll_y)
+        first = max(0, bisect.bisect_right(self.row_offsets, scroll_y) - 1)
+        bottom = scroll_y + quest_area_rect.height
+        pad = self.row_padding
         
-        for i, quest in enumerate(visible_quests):
-            quest_code = quest['code']
-            quest_name = quest['name']
-            quest_desc = quest['description']
-            completed = quest['completed']
-            
-            # Rectangle de la quête
-            quest_rect = pygame.Rect(quest_area_rect.x, current_y, 
-                                   quest_area_rect.width, self.quest_height)
-            
-            # Couleur de fond selon le statut
-            bg_color = self.completed_color if completed else self.given_color
-            bg_color = (bg_color[0] // 4, bg_color[1] // 4, bg_color[2] // 4)  # Plus sombre
-            
-            pygame.draw.rect(screen, bg_color, quest_rect)
-            self.border_manager.draw_border(screen, quest_rect, border_thickness=2)
-            
-            # Animation d'étoile
-            star_type = self._get_quest_star_type(quest_code, completed)
+        # Les bordures débordent de la zone : on découpe avec la même marge
+        previous_clip = screen.get_clip()
+        screen.set_clip(quest_area_rect.inflate(2 * pad, 2 * pad).clip(previous_clip or screen.get_rect()))
+        
+        index = first
+        while index < len(self.quest_data) and self.row_offsets[index] < bottom:
+            quest = self.quest_data[index]
+            row_x = quest_area_rect.x
+            row_y = quest_area_rect.y + self.row_offsets[index] - scroll_y
             
-            if quest_code not in self.quest_stars:
-                self.quest_stars[quest_code] = QuestStar(quest_rect.x + 5, quest_rect.y + 4, star_type)
+            screen.blit(self._get_row_surface(quest, quest_area_rect.width), (row_x - pad, row_y - pad))
             
-            star = self.quest_stars[quest_code]
-            star.set_position(quest_rect.x + 5, quest_rect.y + 4)
+            # Seule l'étoile est redessinée à chaque frame
+            star = self._get_quest_star(quest)
+            star.set_position(row_x + 5, row_y + 4)
             star.update(dt)
             star.draw(screen)
-            
-            # Texte de la quête
-            text_x = quest_rect.x + 45  # Après l'étoile
-            text_y = quest_rect.y + (quest_rect.height - self.quest_font.get_height()) // 2
-            
-            text_color = self.completed_color if completed else self.given_color
-            
-            # Code de la quête
-            code_surface = self.quest_font.render(quest_code, True, text_color)
-            screen.blit(code_surface, (text_x, text_y))
-            
-            # Nom de la quête
-            name_surface = self.quest_font.render(quest_name, True, self.text_color)
-            screen.blit(name_surface, (text_x + 70, text_y))
-            
-            # Statut
-            status_text = "✓" if completed else "○"
-            status_surface = self.quest_font.render(status_text, True, text_color)
-            status_rect = status_surface.get_rect()
-            status_rect.right = quest_rect.right - 10
-            status_rect.centery = quest_rect.centery
-            screen.blit(status_surface, status_rect)
-            
-            current_y += self.quest_height
-            
-            # Description expandée si cette quête est sélectionnée
-            if self.expanded_quest == quest_code:
-                desc_height = self._render_expanded_description(screen, quest_area_rect, 
-                                                              current_y, quest_desc)
-                current_y += desc_height
+            index += 1
+        
+        screen.set_clip(previous_clip)
+    
+    def _get_quest_star(self, quest):
+        """Retourne l'étoile animée d'une quête (créée à la demande)"""
+        quest_code = quest['code']
+        if quest_code not in self.quest_stars:
+            star_type = self._get_quest_star_type(quest_code, quest['completed'])
+            self.quest_stars[quest_code] = QuestStar(0, 0, star_type)
+        return self.quest_stars[quest_code]
+    
+    def _get_row_surface(self, quest, width):
+        """Retourne la surface pré-rendue d'une ligne, reconstruite seulement si son état change"""
+        quest_code = quest['code']
+        expanded = self.expanded_quest == quest_code
+        state_key = (quest['name'], quest['description'], quest['completed'], expanded,
+                     width, self.border_manager.current_border_index)
+        
+        cached = self.row_cache.get(quest_code)
+        if cached and cached[0] == state_key:
+            return cached[1]
+        
+        surface = self._render_row(quest, width, expanded)
+        self.row_cache[quest_code] = (state_key, surface)
+        return surface
+    
+    def _render_row(self, quest, width, expanded):
+        """Dessine une ligne de quête (et sa description si ouverte) dans une surface dédiée"""
+        pad = self.row_padding
+        height = self.quest_height + (self.desc_height if expanded else 0)
+        surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        
+        quest_code = quest['code']
+        completed = quest['completed']
+        
+        # Rectangle de la quête
+        quest_rect = pygame.Rect(pad, pad, width, self.quest_height)
+        
+        # Couleur de fond selon le statut
+        bg_color = self.completed_color if completed else self.given_color
+        bg_color = (bg_color[0] // 4, bg_color[1] // 4, bg_color[2] // 4)  # Plus sombre
+        
+        pygame.draw.rect(surface, bg_color, quest_rect)
+        self.border_manager.draw_border(surface, quest_rect, border_thickness=2)
+        
+        # Texte de la quête
+        text_x = quest_rect.x + 45  # Après l'étoile
+        text_y = quest_rect.y + (quest_rect.height - self.quest_font.get_height()) // 2
+        
+        text_color = self.completed_color if completed else self.given_color
+        
+        # Code de la quête
+        code_surface = self.quest_font.render(quest_code, True, text_color)
+        surface.blit(code_surface, (text_x, text_y))
+        
+        # Nom de la quête
+        name_surface = self.quest_font.render(quest['name'], True, self.text_color)
+        surface.blit(name_surface, (text_x + 70, text_y))
+        
+        # Statut
+        status_text = "✓" if completed else "○"
+        status_surface = self.quest_font.render(status_text, True, text_color)
+        status_rect = status_surface.get_rect()
+        status_rect.right = quest_rect.right - 10
+        status_rect.centery = quest_rect.centery
+        surface.blit(status_surface, status_rect)
+        
+        # Description expandée si cette quête est sélectionnée
+        if expanded:
+            self._render_expanded_description(surface, quest_rect, quest_rect.bottom, quest['description'])
+        
+        return surface
     
     def _render_expanded_description(self, screen, area_rect, y_pos, description):
         """Affiche la description expandée d'une quête"""
         desc_rect = pygame.Rect(area_rect.x + 20, y_pos, 
-                              area_rect.width - 40, 60)
+                              area_rect.width - 40, self.desc_height)
         
         # Fond de la description
         pygame.draw.rect(screen, self.desc_bg_color, desc_rect)
@@ -297,7 +393,7 @@ class QuestTable:
         return desc_rect.height
     
     def _draw_scrollbar(self, screen, quest_area_rect):
-        """Dessine une scrollbar simple"""
+        """Dessine une scrollbar proportionnelle au contenu"""
         scrollbar_rect = pygame.Rect(quest_area_rect.right + 5, quest_area_rect.y, 
                                    10, quest_area_rect.height)
         
@@ -305,9 +401,12 @@ class QuestTable:
         pygame.draw.rect(screen, (100, 100, 100), scrollbar_rect)
         
         # Position du thumb
-        if len(self.quest_data) > 0:
-            thumb_height = max(20, scrollbar_rect.height * self.max_visible_quests // len(self.quest_data))
-            thumb_y = scrollbar_rect.y + (scrollbar_rect.height - thumb_height) * self.scroll_offset // max(1, len(self.quest_data) - self.max_visible_quests)
+        content_height = self.row_offsets[-1]
+        if content_height > 0:
+            thumb_height = max(20, scrollbar_rect.height * quest_area_rect.height // content_height)
+            thumb_height = min(thumb_height, scrollbar_rect.height)
+            max_scroll = max(1, self._get_max_scroll())
+            thumb_y = scrollbar_rect.y + int((scrollbar_rect.height - thumb_height) * self.scroll_y / max_scroll)
             
             thumb_rect = pygame.Rect(scrollbar_rect.x, thumb_y, scrollbar_rect.width, thumb_height)
             pygame.draw.rect(screen, (200, 200, 200), thumb_rect)
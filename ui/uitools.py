@@ -3,6 +3,7 @@ import math
 import random
 import pygame
 from core.session import SessionManager
+from core.assets import AssetManager, asset_exists, get_image, get_frame_set, get_generated_frame_set
 
 # === Utilitaires pour couleurs et effets ===
 def oscillate_color(tick, base1=(160, 250, 255), base2=(85, 100, 190)):
@@ -68,12 +69,7 @@ class Star:
 def load_star_frames(path):
     """Charge les frames d'étoiles animées (spritesheet 4x1)."""
     try:
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        for i in range(4):
-            frame = sheet.subsurface(pygame.Rect(i * 32, 0, 32, 32))
-            frames.append(frame)
-        return frames
+        return list(get_frame_set(path, frame_size=(32, 32), count=4))
     except (pygame.error, FileNotFoundError):
         # Fallback: créer une étoile simple
         fallback_star = pygame.Surface((32, 32))
@@ -83,8 +79,7 @@ def load_star_frames(path):
 def load_background_image(path, screen_size):
     """Charge et redimensionne une image de fond."""
     try:
-        bg_image = pygame.image.load(path).convert()
-        return pygame.transform.scale(bg_image, screen_size)
+        return AssetManager.get_instance().image(path, convert_alpha=False, scale=tuple(screen_size))
     except (pygame.error, FileNotFoundError):
         return None
 
@@ -145,6 +140,31 @@ def draw_stylish_button(screen, border_mgr, rect, text, font, tick, hovered=Fals
     # Texte principal
     screen.blit(text_surface, text_rect)
 
+def draw_loading_screen(screen, progress, label="Chargement..."):
+    """Affiche un écran de chargement avec barre de progression (progress entre 0 et 1)."""
+    pygame.event.pump()  # Garde la fenêtre réactive pendant le chargement
+    screen.fill((10, 10, 30))
+    screen_w, screen_h = screen.get_size()
+    
+    font = pygame.font.Font(None, 36)
+    draw_text_with_effects(screen, font, label, (screen_w // 2, screen_h // 2 - 30), (160, 250, 255))
+    
+    bar_rect = pygame.Rect(screen_w // 4, screen_h // 2, screen_w // 2, 16)
+    pygame.draw.rect(screen, (30, 30, 60), bar_rect)
+    fill_rect = bar_rect.copy()
+    fill_rect.width = int(bar_rect.width * max(0.0, min(1.0, progress)))
+    pygame.draw.rect(screen, (85, 100, 190), fill_rect)
+    pygame.draw.rect(screen, (160, 250, 255), bar_rect, 2)
+    pygame.display.flip()
+
+def preload_with_loading_screen(screen, paths, label="Chargement...", pil=False):
+    """Précharge des images sur le pool de décodage en affichant la progression.
+    
+    Retourne les AssetHandle des images (à relâcher quand elles ne sont plus utiles)."""
+    def on_progress(done, total):
+        draw_loading_screen(screen, done / total if total else 1.0, label)
+    return AssetManager.get_instance().preload(paths, pil=pil, on_progress=on_progress)
+
 # === Nouvelles classes pour l'interface ===
 class PrevNextButton:
     """Boutons Previous/Next avec assets gauchedroiteui.png et gauchedroitehoverui.png"""
@@ -154,30 +174,27 @@ class PrevNextButton:
         self.is_prev = is_prev  # True pour Previous/Gauche, False pour Next/Droite
         self.hovered = False
         self.clicked = False
-        self.frames_normal = []
-        self.frames_hover = []
+        self.frames_normal = ()
+        self.frames_hover = ()
         
         self.load_assets()
     
     def load_assets(self):
-        """Charge les assets prev/next (11x14px, 2 frames) ou fallback simple."""
+        """Charge les assets prev/next (11x14px, 2 frames, partagés entre boutons) ou fallback simple."""
         def fallback():
+            frames = []
             for i in range(2):
                 surf = pygame.Surface((11, 14))
                 surf.fill((150, 100, 100) if i == 0 else (100, 150, 100))
-                self.frames_normal.append(surf)
-                self.frames_hover.append(surf.copy())
+                frames.append(surf)
+            return frames
         try:
-            normal = pygame.image.load("assets/ui/gauchedroiteui.png").convert_alpha()
-            hover = pygame.image.load("assets/ui/gauchedroitehoverui.png").convert_alpha()
-            for i in range(2):
-                rect = pygame.Rect(i*11, 0, 11, 14)
-                self.frames_normal.append(normal.subsurface(rect))
-                self.frames_hover.append(hover.subsurface(rect))
+            self.frames_normal = get_frame_set("assets/ui/gauchedroiteui.png", frame_size=(11, 14), count=2)
+            self.frames_hover = get_frame_set("assets/ui/gauchedroitehoverui.png", frame_size=(11, 14), count=2)
         except Exception:
-            fallback()
-        if len(self.frames_normal) < 2:
-            fallback()
+            self.frames_normal = self.frames_hover = ()
+        if len(self.frames_normal) < 2 or len(self.frames_hover) < 2:
+            self.frames_normal = self.frames_hover = get_generated_frame_set(("prev_next",), fallback)
     
     def handle_event(self, event):
         """Gère les événements de la souris"""
@@ -216,13 +233,10 @@ class UISlider:
     def load_assets(self):
         sheet_path = "assets/ui/sliders1.png"
         hover_path = "assets/ui/sliders.png"
-        self.sheet = pygame.image.load(sheet_path).convert_alpha()
-        self.sheet_hover = pygame.image.load(hover_path).convert_alpha()
-        frame_w = self.sheet.get_width() // 5
-        frame_h = self.sheet.get_height()
+        grid = (len(self.SLIDER_TYPES), 1)
         idx = self.SLIDER_TYPES.index(self.slider_type)
-        self.knob_img = self.sheet.subsurface((idx * frame_w, 0, frame_w, frame_h))
-        self.knob_img_hover = self.sheet_hover.subsurface((idx * frame_w, 0, frame_w, frame_h))
+        self.knob_img = get_frame_set(sheet_path, grid=grid)[idx]
+        self.knob_img_hover = get_frame_set(hover_path, grid=grid)[idx]
 
     def draw(self, screen):
         # Barre de fond
@@ -330,8 +344,8 @@ class BorderManager:
     def load_borders(self):
         """Découpe l'asset en 80 bordures individuelles"""
         try:
-            if os.path.exists(self.border_asset_path):
-                border_sheet = pygame.image.load(self.border_asset_path).convert_alpha()
+            if asset_exists(self.border_asset_path):
+                border_sheet = get_image(self.border_asset_path)
                 print(f"[BORDER] Asset chargé: {self.border_asset_path}")
                 
                 # Découper en 10x8 = 80 bordures
@@ -528,41 +542,30 @@ class QuestStar:
         self.x = x
         self.y = y
         self.quest_type = quest_type
-        self.frames = []
+        self.frames = ()
         self.current_frame = 0
         self.frame_timer = 0
         self.frame_delay = 100  # ms entre les frames
         self.load_frames()
     
     def load_frames(self):
-        """Charge les 13 frames d'animation depuis une image 416x32"""
+        """Charge les 13 frames d'animation depuis une image 416x32 (partagées par type de quête)"""
         sprite_path = self.QUEST_TYPES.get(self.quest_type, self.QUEST_TYPES['uncompleted'])
         
         try:
-            # Tente de charger l'image
-            if os.path.exists(sprite_path):
-                sheet = pygame.image.load(sprite_path).convert_alpha()
+            if asset_exists(sprite_path):
+                sheet = get_image(sprite_path)
                 # Vérifie les dimensions (416x32 pour 13 frames de 32x32)
                 if sheet.get_width() >= 416 and sheet.get_height() >= 32:
-                    frame_width = 32
-                    for i in range(13):
-                        x = i * frame_width
-                        frame_rect = pygame.Rect(x, 0, frame_width, 32)
-                        if x + frame_width <= sheet.get_width():
-                            frame = sheet.subsurface(frame_rect).copy()
-                            self.frames.append(frame)
+                    self.frames = get_frame_set(sprite_path, frame_size=(32, 32), count=13)
                 else:
                     # Image trop petite, utilise l'image entière
-                    self.frames = [sheet]
-            else:
-                # Fichier non trouvé, utilise un fallback
-                self.create_fallback_frames()
-                
+                    self.frames = (sheet,)
         except (pygame.error, FileNotFoundError):
-            self.create_fallback_frames()
+            pass
         
         if not self.frames:
-            self.create_fallback_frames()
+            self.frames = get_generated_frame_set(("quest_star", self.quest_type), self.create_fallback_frames)
     
     def create_fallback_frames(self):
         """Crée des frames de secours si l'asset n'est pas trouvé"""
@@ -577,6 +580,7 @@ class QuestStar:
         color = colors.get(self.quest_type, (255, 255, 255))
         
         # Crée 13 frames avec différentes intensités pour simuler l'animation
+        frames = []
         for i in range(13):
             frame = pygame.Surface((32, 32), pygame.SRCALPHA)
             intensity = 0.5 + 0.5 * abs(math.sin(i * math.pi / 6))
@@ -594,7 +598,8 @@ class QuestStar:
                 points.append((x, y))
             
             pygame.draw.polygon(frame, animated_color, points)
-            self.frames.append(frame)
+            frames.append(frame)
+        return frames
     
     def update(self, dt):
         """Met à jour l'animation"""